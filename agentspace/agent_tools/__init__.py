@@ -17,6 +17,7 @@ __all__ = [
     "player_multi_season_summary_tool",
     "compare_player_season_summaries_tool",
     "player_report_template_tool",
+    "get_full_records",
     "plot_match_shot_map_tool",
     "plot_event_heatmap_tool",
     "plot_pass_network_tool",
@@ -41,6 +42,7 @@ _LAZY_IMPORTS = {
     "player_multi_season_summary_tool": ("agentspace.agent_tools.statsbomb", "player_multi_season_summary_tool"),
     "compare_player_season_summaries_tool": ("agentspace.agent_tools.statsbomb", "compare_player_season_summaries_tool"),
     "player_report_template_tool": ("agentspace.agent_tools.statsbomb", "player_report_template_tool"),
+    "get_full_records": ("agentspace.agent_tools.statsbomb", "get_full_records"),
     "register_statsbomb_online_index_tools": ("agentspace.agent_tools.online_index", "register_statsbomb_online_index_tools"),
     "register_wyscout_tools": ("agentspace.agent_tools.wyscout", "register_wyscout_tools"),
     "register_statsbomb_viz_tools": ("agentspace.agent_tools.viz", "register_statsbomb_viz_tools"),
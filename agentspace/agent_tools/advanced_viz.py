@@ -3,7 +3,6 @@ Advanced visualization agent tools for player analysis.
 """
 from __future__ import annotations
 
-import base64
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -11,6 +10,7 @@ from agentscope.message import Base64Source, ImageBlock, TextBlock
 from agentscope.tool import Toolkit, ToolResponse
 
 from ..analytics.pizza_charts import plot_pizza_chart, create_pizza_base64
+from .images import encode_image_file
 
 
 def _error_response(reason: str, metadata: Optional[Dict[str, Any]] = None) -> ToolResponse:
@@ -75,9 +75,7 @@ def plot_pizza_chart_tool(
         )
 
         # Read the image and convert to base64
-        with open(result.path, 'rb') as f:
-            img_data = f.read()
-        b64_data = base64.b64encode(img_data).decode('utf-8')
+        b64_data = encode_image_file(Path(result.path))
 
         # Create image block (NO alt field in the block itself)
         image_block = ImageBlock(
@@ -107,7 +105,6 @@ def plot_pizza_chart_tool(
             "comparison_player": comparison_player,
             "metrics": result.metrics,
             "image_path": str(result.path),
-            "image_data": b64_data,
             "image_mime_type": "image/png",
             "images": [{
                 "data": b64_data,
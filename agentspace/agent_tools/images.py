@@ -0,0 +1,64 @@
+"""
+Image encoding shared by the visualization agent tools.
+"""
+from __future__ import annotations
+
+import base64
+import mmap
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Tuple
+
+# Recent encodings keyed on ``(path, mtime_ns, size)`` so re-serving an
+# unchanged image skips re-encoding. Bounded by total encoded size rather than
+# entry count, since a single chart can encode to several megabytes.
+_ENCODED_CACHE: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_ENCODED_CACHE_MAX_CHARS = 8 * 1024 * 1024
+_ENCODED_CACHE_LOCK = threading.Lock()
+_encoded_cache_chars = 0
+
+
+def _encode_file(path: str, size: int) -> str:
+    # The file is memory-mapped so the raw bytes are never copied into a
+    # separate buffer before encoding.
+    if size == 0:
+        return ""
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return base64.b64encode(view).decode("ascii")
+
+
+def encode_image_file(path: Path) -> str:
+    """Return the base64 encoding of the image at ``path``, memoised while unchanged."""
+
+    global _encoded_cache_chars
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _ENCODED_CACHE_LOCK:
+        cached = _ENCODED_CACHE.get(key)
+        if cached is not None:
+            _ENCODED_CACHE.move_to_end(key)
+            return cached
+
+    encoded = _encode_file(key[0], stat.st_size)
+    if len(encoded) > _ENCODED_CACHE_MAX_CHARS:
+        return encoded
+    with _ENCODED_CACHE_LOCK:
+        previous = _ENCODED_CACHE.pop(key, None)
+        if previous is not None:
+            _encoded_cache_chars -= len(previous)
+        _ENCODED_CACHE[key] = encoded
+        _encoded_cache_chars += len(encoded)
+        while _encoded_cache_chars > _ENCODED_CACHE_MAX_CHARS:
+            _, evicted = _ENCODED_CACHE.popitem(last=False)
+            _encoded_cache_chars -= len(evicted)
+    return encoded
+
+
+def clear_encoded_image_cache() -> None:
+    """Drop all memoised encodings."""
+
+    global _encoded_cache_chars
+    with _ENCODED_CACHE_LOCK:
+        _ENCODED_CACHE.clear()
+        _encoded_cache_chars = 0
@@ -3,12 +3,23 @@ Agentscope toolkit integration for StatsBomb data helpers.
 """
 
 import json
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from agentscope.message import TextBlock
 from agentscope.tool import Toolkit, ToolResponse
 import agentscope
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 from ..analytics import (
     DEFAULT_LEADERBOARD_GROUPS,
     build_player_leaderboards,
@@ -17,11 +28,11 @@ from ..analytics import (
     summarise_team_events,
 )
 from ..services.statsbomb_tools import (
+    MAX_FETCH_WORKERS,
     EventFilters,
     MatchDataset,
     MatchDescriptor,
     PlayerEventSummary,
-    POPULAR_COMPETITIONS,
     count_player_passes_by_body_part,
     fetch_match_dataset,
     fetch_player_match_stats_data,
@@ -38,61 +49,74 @@ from ..services.statsbomb_tools import (
     list_seasons,
     _canonical,
     _augment_player_record,
+    _POPULAR_COMPETITIONS_BY_ID,
     resolve_competition_id,
     season_id_for_label,
 )
 
-PLAYER_SEASON_DEFAULT_FIELDS = [
+PLAYER_SEASON_DEFAULT_FIELDS = (
     "player_name",
     "team_name",
     "player_season_minutes",
     "player_season_goals_90",
     "player_season_xa_90",
     "player_season_np_xg_90",
-]
+)
 
-PLAYER_SEASON_SUMMARY_MAP = [
-    ("player_season_minutes", "Minutes"),
-    ("player_season_goals", "Total goals"),
-    ("player_season_goals_90", "Goals/90"),
-    ("player_season_assists", "Total assists"),
-    ("player_season_assists_90", "Assists/90"),
-    ("player_season_np_xg", "Non-pen xG"),
-    ("player_season_np_xg_90", "Non-pen xG/90"),
-    ("player_season_xa", "xA"),
-    ("player_season_xa_90", "xA/90"),
-    ("player_season_shots_90", "Shots/90"),
-    ("player_season_key_passes_90", "Key passes/90"),
-    ("player_season_pressures_90", "Pressures/90"),
-]
+# Summary maps are (record key, label, format spec): counts render as whole
+# numbers, rates and expected-goal values with two decimals.
+PLAYER_SEASON_SUMMARY_MAP = (
+    ("player_season_minutes", "Minutes", ".0f"),
+    ("player_season_goals", "Total goals", ".0f"),
+    ("player_season_goals_90", "Goals/90", ".2f"),
+    ("player_season_assists", "Total assists", ".0f"),
+    ("player_season_assists_90", "Assists/90", ".2f"),
+    ("player_season_np_xg", "Non-pen xG", ".2f"),
+    ("player_season_np_xg_90", "Non-pen xG/90", ".2f"),
+    ("player_season_xa", "xA", ".2f"),
+    ("player_season_xa_90", "xA/90", ".2f"),
+    ("player_season_shots_90", "Shots/90", ".2f"),
+    ("player_season_key_passes_90", "Key passes/90", ".2f"),
+    ("player_season_pressures_90", "Pressures/90", ".2f"),
+)
 
-TEAM_SEASON_DEFAULT_FIELDS = [
+TEAM_SEASON_DEFAULT_FIELDS = (
     "team_name",
     "team_season_goals",
     "team_season_xg",
     "team_season_xga",
     "team_season_points",
-]
+)
 
-TEAM_SEASON_SUMMARY_MAP = [
-    ("team_season_points", "Points"),
-    ("team_season_matches", "Matches"),
-    ("team_season_goals", "Goals"),
-    ("team_season_goals_against", "Goals conceded"),
-    ("team_season_xg", "xG"),
-    ("team_season_xga", "xGA"),
-]
+TEAM_SEASON_SUMMARY_MAP = (
+    ("team_season_points", "Points", ".0f"),
+    ("team_season_matches", "Matches", ".0f"),
+    ("team_season_goals", "Goals", ".0f"),
+    ("team_season_goals_against", "Goals conceded", ".0f"),
+    ("team_season_xg", "xG", ".2f"),
+    ("team_season_xga", "xGA", ".2f"),
+)
 
-PLAYER_MATCH_DEFAULT_FIELDS = [
+PLAYER_MATCH_DEFAULT_FIELDS = (
     "player_name",
     "team_name",
     "player_match_minutes",
     "player_match_goals",
     "player_match_xg",
     "player_match_assists",
-]
+)
+
+PLAYER_MATCH_SUMMARY_MAP = (
+    ("player_match_minutes", "Minutes", ".0f"),
+    ("player_match_goals", "Goals", ".0f"),
+    ("player_match_assists", "Assists", ".0f"),
+    ("player_match_xg", "xG", ".2f"),
+    ("player_match_shots", "Shots", ".0f"),
+)
 
-PLAYER_LIST_DEFAULT_FIELDS = [
+EVENT_PREVIEW_FIELDS = ("event_id", "type", "team", "player", "minute", "second", "score_state")
+
+PLAYER_LIST_DEFAULT_FIELDS = (
     "player_id",
     "player_name",
     "team_name",
@@ -100,7 +124,7 @@ PLAYER_LIST_DEFAULT_FIELDS = [
     "player_season_minutes",
     "player_season_goals",
     "player_season_assists",
-]
+)
 
 
 def _placeholder(value: Optional[str], default: str) -> str:
@@ -361,34 +385,84 @@ def _summarise_leaderboards(
     return lines
 
 
-PLAYER_MATCH_SUMMARY_MAP = [
-    ("player_match_minutes", "Minutes"),
-    ("player_match_goals", "Goals"),
-    ("player_match_assists", "Assists"),
-    ("player_match_xg", "xG"),
-    ("player_match_shots", "Shots"),
-]
+def _leader_line(
+    player_summary: "pd.DataFrame",
+    column: str,
+    top_n: int,
+    format_values: Callable[["pd.Series"], "pd.Series"],
+) -> str:
+    """Join the top ``top_n`` players by ``column`` into a single display line."""
+
+    positive = player_summary[column] > 0
+    if not positive.any():
+        # Common for goals in goalless matches; skip the selection entirely.
+        return ""
+    top = player_summary[positive].nlargest(max(top_n, 0), column)
+    entries = (
+        top["player_name"].astype(str) + " (" + top["team"].astype(str) + ", " + format_values(top[column]) + ")"
+    )
+    return ", ".join(entries.tolist())
+
+
+def _team_summary_lines(team_summary: "pd.DataFrame") -> List[str]:
+    """Render one ``Team: Goals ..., xG ..., Passes Completed ...`` line per team."""
+
+    numeric = team_summary.reindex(columns=["goals", "xg", "passes_completed"], fill_value=0).fillna(0)
+    goals = numeric["goals"].astype(int)
+    xg = numeric["xg"].astype(float)
+    passes_completed = numeric["passes_completed"].astype(int)
+    lines = (
+        team_summary["team"].astype(str)
+        + ": Goals "
+        + goals.astype(str)
+        + (", xG " + xg.map("{:.2f}".format)).where(xg != 0, "")
+        + (", Passes Completed " + passes_completed.astype(str)).where(passes_completed != 0, "")
+    )
+    return lines.tolist()
+
 
 # ---------------------------------------------------------------------------
 # Helper utilities
 # ---------------------------------------------------------------------------
 
-def _summarise_metrics(record: Dict[str, Any], mapping: List[Tuple[str, str]]) -> str:
-    lines = []
-    for key, label in mapping:
-        value = record.get(key)
-        if value in (None, ""):
-            continue
-        if isinstance(value, float):
-            value = f"{value:.2f}"
-        lines.append(f"- {label}: {value}")
-    return "\n".join(lines)
-
-
 def _error_response(text: str, metadata: Dict[str, Any]) -> ToolResponse:
     return ToolResponse(content=[TextBlock(type="text", text=text)], metadata=metadata)
 
 
+# Full payloads withheld from tool metadata when ``verbose_metadata=False``,
+# bounded so that unread payloads are eventually released.
+_RESULT_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_RESULT_CACHE_SIZE = 32
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _payload_metadata(key: str, payload: Any, verbose: bool) -> Dict[str, Any]:
+    """Return ``{key: payload}``, or ``{key + "_ref": ref}`` with the payload cached."""
+
+    if verbose:
+        return {key: payload}
+    ref = uuid.uuid4().hex
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[ref] = payload
+        while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return {f"{key}_ref": ref}
+
+
+def get_full_records(ref: str) -> Any:
+    """
+    Return a payload previously withheld from tool metadata.
+
+    Args:
+        ref: The ``*_ref`` value from a tool called with ``verbose_metadata=False``.
+
+    Returns:
+        The cached payload, or ``None`` once it has been evicted.
+    """
+    with _RESULT_CACHE_LOCK:
+        return _RESULT_CACHE.get(ref)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -431,6 +505,9 @@ def register_statsbomb_tools(
         # Group already exists; that's fine.
         pass
 
+    # Tools taking ``verbose_metadata`` have it preset: no agent-callable tool
+    # resolves a ``*_ref``, so agents always get full payloads and the flag
+    # stays out of the tool schema for Python callers only.
     toolkit.register_tool_function(
         list_competitions_tool,
         group_name=group_name,
@@ -456,22 +533,26 @@ def register_statsbomb_tools(
     toolkit.register_tool_function(
         fetch_match_events,
         group_name=group_name,
+        preset_kwargs={"verbose_metadata": True},
         func_description="Fetch filtered match events (and optional lineups "
         "or 360 frames) for a specific StatsBomb match.",
     )
     toolkit.register_tool_function(
         fetch_player_season_aggregates,
         group_name=group_name,
+        preset_kwargs={"verbose_metadata": True},
         func_description="Retrieve player season aggregates with optional sorting and filtering.",
     )
     toolkit.register_tool_function(
         list_competition_players_tool,
         group_name=group_name,
+        preset_kwargs={"verbose_metadata": True},
         func_description="List player season records for a competition, optionally filtered to a team.",
     )
     toolkit.register_tool_function(
         list_team_players_tool,
         group_name=group_name,
+        preset_kwargs={"verbose_metadata": True},
         func_description="List the current squad for a team in a given competition season.",
     )
     toolkit.register_tool_function(
@@ -487,11 +568,13 @@ def register_statsbomb_tools(
     toolkit.register_tool_function(
         fetch_team_season_aggregates,
         group_name=group_name,
+        preset_kwargs={"verbose_metadata": True},
         func_description="Retrieve team season aggregates with optional sorting.",
     )
     toolkit.register_tool_function(
         fetch_player_match_aggregates,
         group_name=group_name,
+        preset_kwargs={"verbose_metadata": True},
         func_description="Retrieve per-player match statistics for a single match.",
     )
     toolkit.register_tool_function(
@@ -522,6 +605,35 @@ def register_statsbomb_tools(
     return toolkit
 
 
+# Arguments of the last successful ``agentscope.init``. Repeating an identical
+# init would register another Studio run and rebuild the tracing exporter.
+_SESSION_INIT_ARGS: Optional[Tuple[Tuple[str, Any], ...]] = None
+_SESSION_INIT_LOCK = threading.Lock()
+
+
+def _init_agentscope_once(**kwargs: Any) -> None:
+    """Call :func:`agentscope.init`, skipping repeats of the same named run.
+
+    Only calls with an explicit ``name`` are deduplicated, so builds that
+    should share one Studio run must opt in by naming it. Unnamed calls always
+    initialise a fresh run and forget the recorded arguments.
+    """
+
+    global _SESSION_INIT_ARGS
+    key = tuple(sorted(kwargs.items()))
+    with _SESSION_INIT_LOCK:
+        if kwargs.get("name") is None:
+            _SESSION_INIT_ARGS = None
+            agentscope.init(**kwargs)
+            return
+        if key == _SESSION_INIT_ARGS:
+            return
+        # Clear first so a failed init is retried on the next call.
+        _SESSION_INIT_ARGS = None
+        agentscope.init(**kwargs)
+        _SESSION_INIT_ARGS = key
+
+
 def init_session_with_statsbomb_tools(
     *,
     project: Optional[str] = None,
@@ -538,10 +650,12 @@ def init_session_with_statsbomb_tools(
 
     This helper combines :func:`agentscope.init` with
     :func:`register_statsbomb_tools`, returning the prepared toolkit for use
-    in agent sessions.
+    in agent sessions. When ``name`` is given, a repeat call with identical
+    arguments reuses the existing run instead of re-initialising AgentScope;
+    calling :func:`agentscope.init` elsewhere in between is not detected.
     """
 
-    agentscope.init(
+    _init_agentscope_once(
         project=project,
         name=name,
         logging_path=logging_path,
@@ -574,7 +688,7 @@ def list_competitions_tool(
     if name:
         resolved = resolve_competition_id(name)
         if resolved is not None and not country and not only_with_data:
-            entry = next((item for item in POPULAR_COMPETITIONS if item["competition_id"] == resolved), None)
+            entry = _POPULAR_COMPETITIONS_BY_ID.get(resolved)
             if entry:
                 season_rows = [
                     {"season_label": label, "season_id": sid}
@@ -617,8 +731,7 @@ def list_competitions_tool(
         preview or "- None",
         "Full results available in metadata['competitions'].",
     ]
-    metadata = {"competitions": competitions}
-    metadata.update(known_metadata)
+    metadata = {"competitions": competitions, **known_metadata}
     return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=metadata)
 
 
@@ -795,11 +908,11 @@ def count_player_passes_by_body_part_tool(
             "No matches identified. Provide match_ids or sufficient filters."
         )
 
-    filters = EventFilters(
-        periods=list(periods) if periods else None,
+    filters = EventFilters.from_options(
+        periods=periods,
         minute_range=_normalize_range(minute_range),
         time_range=_normalize_range(time_range),
-        score_states=list(score_states) if score_states else None,
+        score_states=score_states,
         zone=zone,
         location_key=location_key,
     )
@@ -852,6 +965,7 @@ def fetch_match_events(
     include_frames: bool = False,
     limit: int = 25,
     use_cache: bool = True,
+    verbose_metadata: bool = True,
 ) -> ToolResponse:
     """
     Retrieve match events with optional filters applied.
@@ -877,23 +991,26 @@ def fetch_match_events(
         include_frames: Whether to include 360 freeze-frame data.
         limit: Maximum number of events to include in the textual preview.
         use_cache: Honour the local cache when available.
+        verbose_metadata: When ``False``, requested lineups and frames are
+            withheld from the metadata and referenced via ``lineups_ref`` /
+            ``frames_ref`` (see :func:`get_full_records`).
 
     Returns:
         ToolResponse with a textual summary and structured metadata containing
         the filtered events.
     """
-    filters = EventFilters(
-        event_types=list(event_types) if event_types else None,
-        team_names=[team_name] if team_name else None,
-        opponent_names=[opponent_name] if opponent_name else None,
-        player_names=list(player_names) if player_names else None,
-        possession_team_names=list(possession_team_names) if possession_team_names else None,
-        periods=list(periods) if periods else None,
+    filters = EventFilters.from_options(
+        event_types=event_types,
+        team_names=team_name,
+        opponent_names=opponent_name,
+        player_names=player_names,
+        possession_team_names=possession_team_names,
+        periods=periods,
         minute_range=_normalize_range(minute_range),
         time_range=_normalize_range(time_range),
-        score_states=list(score_states) if score_states else None,
-        play_patterns=list(play_patterns) if play_patterns else None,
-        outcome_names=list(outcome_names) if outcome_names else None,
+        score_states=score_states,
+        play_patterns=play_patterns,
+        outcome_names=outcome_names,
         zone=zone,
         location_key=location_key,
     )
@@ -911,10 +1028,7 @@ def fetch_match_events(
     )
 
     preview_rows = _preview_events(dataset, limit)
-    preview = _format_rows(
-        preview_rows,
-        fields=["event_id", "type", "team", "player", "minute", "second", "score_state"],
-    )
+    preview = _format_rows(preview_rows, fields=EVENT_PREVIEW_FIELDS)
     lines = [
         f"Retrieved {len(dataset.events)} event(s) for match {match_id}.",
         "Preview (event_id, type, team, player, minute, second, score_state):",
@@ -924,8 +1038,17 @@ def fetch_match_events(
     metadata = {
         "match": _descriptor_to_dict(dataset.descriptor),
         "preview_events": preview_rows,
-        "lineups": dataset.lineups if include_lineups else None,
-        "frames": dataset.frames if include_frames else None,
+        # Payloads that were not requested are reported as None, never withheld.
+        **_payload_metadata(
+            "lineups",
+            dataset.lineups if include_lineups else None,
+            verbose_metadata or not include_lineups,
+        ),
+        **_payload_metadata(
+            "frames",
+            dataset.frames if include_frames else None,
+            verbose_metadata or not include_frames,
+        ),
     }
     return ToolResponse(
         content=[TextBlock(type="text", text="\n".join(lines))],
@@ -945,6 +1068,7 @@ def fetch_player_season_aggregates(
     top_n: Optional[int] = 10,
     metrics: Optional[List[str]] = None,
     use_cache: bool = True,
+    verbose_metadata: bool = True,
 ) -> ToolResponse:
     """Fetch player season aggregates for a competition season."""
 
@@ -961,9 +1085,9 @@ def fetch_player_season_aggregates(
         use_cache=use_cache,
     )
     preview_limit = min(len(records), 5) if records else 5
-    field_list = list(metrics) if metrics else sorted(records[0].keys())
+    field_list = _preview_fields(metrics, records[0] if records else None)
     text_preview = _format_rows(records, fields=field_list, limit=preview_limit)
-    summary_lines = _summarise_metrics(records[0], PLAYER_SEASON_SUMMARY_MAP)
+    summary_lines = _summarise_metrics(records[0], PLAYER_SEASON_SUMMARY_MAP) if records else ""
     lines = [
         f"Retrieved {len(records)} player season record(s) for competition {competition_id} season {season_id}.",
         "Key metrics:",
@@ -975,7 +1099,7 @@ def fetch_player_season_aggregates(
     metadata = {
         "competition_id": competition_id,
         "season_id": season_id,
-        "records": records,
+        **_payload_metadata("records", records, verbose_metadata),
         "sort_by": sort_by,
     }
     return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=metadata)
@@ -990,6 +1114,7 @@ def fetch_team_season_aggregates(
     top_n: Optional[int] = 10,
     metrics: Optional[List[str]] = None,
     use_cache: bool = True,
+    verbose_metadata: bool = True,
 ) -> ToolResponse:
     """Fetch team season aggregates for a competition season."""
 
@@ -1003,9 +1128,9 @@ def fetch_team_season_aggregates(
         use_cache=use_cache,
     )
     preview_limit = min(len(records), 5) if records else 5
-    field_list = list(metrics) if metrics else sorted(records[0].keys())
+    field_list = _preview_fields(metrics, records[0] if records else None)
     text_preview = _format_rows(records, fields=field_list, limit=preview_limit)
-    summary_lines = _summarise_metrics(records[0], TEAM_SEASON_SUMMARY_MAP)
+    summary_lines = _summarise_metrics(records[0], TEAM_SEASON_SUMMARY_MAP) if records else ""
     lines = [
         f"Retrieved {len(records)} team season record(s) for competition {competition_id} season {season_id}.",
         "Key metrics:",
@@ -1017,7 +1142,7 @@ def fetch_team_season_aggregates(
     metadata = {
         "competition_id": competition_id,
         "season_id": season_id,
-        "records": records,
+        **_payload_metadata("records", records, verbose_metadata),
         "sort_by": sort_by,
     }
     return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=metadata)
@@ -1032,6 +1157,7 @@ def fetch_player_match_aggregates(
     top_n: Optional[int] = 10,
     metrics: Optional[List[str]] = None,
     use_cache: bool = True,
+    verbose_metadata: bool = True,
 ) -> ToolResponse:
     """Fetch per-player match aggregates for a single match."""
 
@@ -1045,7 +1171,7 @@ def fetch_player_match_aggregates(
         use_cache=use_cache,
     )
     preview_limit = min(len(rows), 5) if rows else 5
-    field_list = list(metrics) if metrics else sorted(rows[0].keys())
+    field_list = _preview_fields(metrics, rows[0] if rows else None)
     text_preview = _format_rows(rows, fields=field_list, limit=preview_limit)
     summary_lines = _summarise_metrics(rows[0], PLAYER_MATCH_SUMMARY_MAP) if rows else ""
     lines = [
@@ -1059,7 +1185,7 @@ def fetch_player_match_aggregates(
     metadata = {
         "match_id": match_id,
         "team_name": team_name,
-        "records": rows,
+        **_payload_metadata("records", rows, verbose_metadata),
         "sort_by": sort_by,
     }
     return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=metadata)
@@ -1077,6 +1203,7 @@ def list_team_players_tool(
     top_n: Optional[int] = None,
     metrics: Optional[List[str]] = None,
     use_cache: bool = True,
+    verbose_metadata: bool = True,
 ) -> ToolResponse:
     """List players for a specific team in a competition season."""
 
@@ -1112,7 +1239,7 @@ def list_team_players_tool(
         "season_id": season_id,
         "season_label": season_label,
         "team_name": team_name,
-        "players": players,
+        **_payload_metadata("players", players, verbose_metadata),
     }
 
     preview_fields = metrics or PLAYER_LIST_DEFAULT_FIELDS
@@ -1138,6 +1265,7 @@ def list_competition_players_tool(
     top_n: Optional[int] = None,
     metrics: Optional[List[str]] = None,
     use_cache: bool = True,
+    verbose_metadata: bool = True,
 ) -> ToolResponse:
     """List players across a competition season, optionally filtered to a team."""
 
@@ -1173,7 +1301,7 @@ def list_competition_players_tool(
         "season_id": season_id,
         "season_label": season_label,
         "team_name": team_name,
-        "players": players,
+        **_payload_metadata("players", players, verbose_metadata),
     }
 
     preview_fields = metrics or PLAYER_LIST_DEFAULT_FIELDS
@@ -1238,10 +1366,8 @@ def resolve_player_current_team_tool(
     minutes = best.get("player_season_minutes")
     if minutes:
         lines.append(f"Minutes played: {minutes:.0f}")
-    competition_name = next(
-        (item.get("competition_name") for item in POPULAR_COMPETITIONS if item["competition_id"] == best.get("competition_id")),
-        None,
-    )
+    competition_entry = _POPULAR_COMPETITIONS_BY_ID.get(best.get("competition_id"))
+    competition_name = competition_entry.get("name") if competition_entry else None
     if competition_name:
         lines.append(f"Competition name: {competition_name}")
 
@@ -1294,7 +1420,15 @@ def player_season_summary_tool(
             use_cache=use_cache,
         )
 
+    # The resolver inputs are fixed for this call, so resolve at most once.
+    resolved_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+
     def _resolve_and_fetch() -> Optional[Dict[str, Any]]:
+        if "summary" not in resolved_cache:
+            resolved_cache["summary"] = _resolve_uncached()
+        return resolved_cache["summary"]
+
+    def _resolve_uncached() -> Optional[Dict[str, Any]]:
         nonlocal resolver_metadata
         best, candidates = resolve_player_current_team(
             player_name,
@@ -1321,6 +1455,7 @@ def player_season_summary_tool(
         )
 
     target_name = _canonical(player_name)
+    canonical_team = _canonical(team_name) if team_name else None
     try:
         summary = _fetch_summary(resolved_competition_id, season_label)
     except ValueError as exc:
@@ -1336,18 +1471,14 @@ def player_season_summary_tool(
                 },
             )
 
-    def _maybe_resolve() -> Optional[Dict[str, Any]]:
-        resolved = _resolve_and_fetch()
-        return resolved
-
     if _canonical(summary.get("player_name", "")) != target_name:
-        resolved_summary = _maybe_resolve()
+        resolved_summary = _resolve_and_fetch()
         if resolved_summary is not None:
             summary = resolved_summary
 
-    if team_name and _canonical(summary.get("team_name", "")) != _canonical(team_name):
+    if team_name and _canonical(summary.get("team_name", "")) != canonical_team:
         fallback_summary = _resolve_and_fetch()
-        if fallback_summary is None or _canonical(fallback_summary.get("team_name", "")) != _canonical(team_name):
+        if fallback_summary is None or _canonical(fallback_summary.get("team_name", "")) != canonical_team:
             return _error_response(
                 f"Player {player_name} belongs to {summary.get('team_name')}, not {team_name}.",
                 {
@@ -1362,15 +1493,17 @@ def player_season_summary_tool(
 
     summary = _augment_player_record(dict(summary), metrics)
 
-    display_fields = metrics or sorted(summary.keys())
-    preview = _format_rows([summary], fields=display_fields, limit=1)
-    summary_lines = _summarise_metrics(summary, PLAYER_SEASON_SUMMARY_MAP)
-    summary_season = summary.get("season_name") or season_label
-    text = (
-        f"Season summary for {summary.get('player_name')} in {summary_season}"
-        f" ({summary.get('team_name')}).\nKey metrics:\n{summary_lines or '- N/A'}\n"
-        f"Raw fields:\n{preview}"
+    summary_lines, preview = _render_summary(
+        summary, PLAYER_SEASON_SUMMARY_MAP, _preview_fields(metrics, summary)
     )
+    summary_season = summary.get("season_name") or season_label
+    lines = [
+        f"Season summary for {summary.get('player_name')} in {summary_season} ({summary.get('team_name')}).",
+        "Key metrics:",
+        summary_lines or "- N/A",
+        "Raw fields:",
+        preview,
+    ]
     final_competition_id = summary.get("competition_id", resolved_competition_id)
     metadata = {
         "player": summary.get("player_name"),
@@ -1380,7 +1513,7 @@ def player_season_summary_tool(
         "record": summary,
         "resolver": resolver_metadata or None,
     }
-    return ToolResponse(content=[TextBlock(type="text", text=text)], metadata=metadata)
+    return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=metadata)
 
 
 def team_season_summary_tool(
@@ -1420,20 +1553,23 @@ def team_season_summary_tool(
             },
         )
 
-    field_list = list(metrics) if metrics else sorted(summary.keys())
-    preview = _format_rows([summary], fields=field_list, limit=1)
-    summary_lines = _summarise_metrics(summary, TEAM_SEASON_SUMMARY_MAP)
-    text = (
-        f"Season summary for {summary.get('team_name')} in {season_label}.\n"
-        f"Key metrics:\n{summary_lines or '- N/A'}\nRaw fields:\n{preview}"
+    summary_lines, preview = _render_summary(
+        summary, TEAM_SEASON_SUMMARY_MAP, _preview_fields(metrics, summary)
     )
+    lines = [
+        f"Season summary for {summary.get('team_name')} in {season_label}.",
+        "Key metrics:",
+        summary_lines or "- N/A",
+        "Raw fields:",
+        preview,
+    ]
     metadata = {
         "team": summary.get("team_name"),
         "competition_id": resolved_competition_id,
         "season_label": season_label,
         "record": summary,
     }
-    return ToolResponse(content=[TextBlock(type="text", text=text)], metadata=metadata)
+    return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=metadata)
 
 
 def summarise_match_performance(
@@ -1458,82 +1594,61 @@ def summarise_match_performance(
         include_frames=False,
         use_cache=use_cache,
     )
-    events_df = events_to_dataframe(dataset)
-    player_summary = summarise_player_events(events_df)
-    team_summary = summarise_team_events(events_df) if include_team_summary else None
+    # The header line only needs the event count; flatten and aggregate the
+    # events only when a player or team section will be displayed.
+    event_count = len(dataset.events)
+    need_player = include_leaderboards or top_n > 0
+    need_events = event_count > 0 and (need_player or include_team_summary)
+    events_df = events_to_dataframe(dataset) if need_events else None
+    player_summary = summarise_player_events(events_df) if need_events and need_player else None
+    team_summary = summarise_team_events(events_df) if need_events and include_team_summary else None
     leaderboards = (
         build_player_leaderboards(
             player_summary,
             groups=leaderboard_groups or DEFAULT_LEADERBOARD_GROUPS,
             top_n=top_n,
         )
-        if include_leaderboards
+        if include_leaderboards and player_summary is not None
         else {}
     )
 
     match = dataset.match or {}
-    home = match.get("home_team", {}).get("home_team_name")
-    away = match.get("away_team", {}).get("away_team_name")
-    match_date = match.get("match_date")
+    header = dataset.header
+    home = header.home_team_name
+    away = header.away_team_name
+    match_date = header.match_date
 
     lines = [
         f"Match {match_id}: {home} vs {away}" if home or away else f"Match {match_id}",
         f"Date: {match_date}" if match_date else "",
-        f"Events analysed: {len(events_df)}",
+        f"Events analysed: {event_count}",
     ]
     lines = [line for line in lines if line]
 
-    if not player_summary.empty:
-        top_scorers = (
-            player_summary.sort_values("goals", ascending=False)
-            .head(min(top_n, len(player_summary)))
+    if top_n > 0 and player_summary is not None and not player_summary.empty:
+        scorer_line = _leader_line(
+            player_summary, "goals", top_n, lambda values: values.astype(int).astype(str) + " goals"
         )
-        if top_scorers["goals"].sum() > 0:
-            scorer_line = ", ".join(
-                f"{row.player_name} ({row.team}, {int(row.goals)} goals)"
-                for _, row in top_scorers.iterrows()
-                if row.goals
-            )
-            if scorer_line:
-                lines.append(f"Top scorers: {scorer_line}")
+        if scorer_line:
+            lines.append(f"Top scorers: {scorer_line}")
 
-        top_xg = (
-            player_summary.sort_values("xg", ascending=False)
-            .head(min(top_n, len(player_summary)))
+        xg_line = _leader_line(
+            player_summary, "xg", top_n, lambda values: values.map("{:.2f} xG".format)
         )
-        if top_xg["xg"].sum() > 0:
-            xg_line = ", ".join(
-                f"{row.player_name} ({row.team}, {row.xg:.2f} xG)"
-                for _, row in top_xg.iterrows()
-                if row.xg
-            )
-            if xg_line:
-                lines.append(f"xG leaders: {xg_line}")
+        if xg_line:
+            lines.append(f"xG leaders: {xg_line}")
 
-        progressive = (
-            player_summary.sort_values("progressive_actions", ascending=False)
-            .head(min(top_n, len(player_summary)))
+        prog_line = _leader_line(
+            player_summary,
+            "progressive_actions",
+            top_n,
+            lambda values: values.astype(int).astype(str) + " progressive actions",
         )
-        if progressive["progressive_actions"].sum() > 0:
-            prog_line = ", ".join(
-                f"{row.player_name} ({row.team}, {int(row.progressive_actions)} progressive actions)"
-                for _, row in progressive.iterrows()
-                if row.progressive_actions
-            )
-            if prog_line:
-                lines.append(f"Progression: {prog_line}")
+        if prog_line:
+            lines.append(f"Progression: {prog_line}")
 
     if include_team_summary and team_summary is not None and not team_summary.empty:
-        for _, row in team_summary.iterrows():
-            goals = int(row.get("goals", 0))
-            xg = row.get("xg", 0.0)
-            passes_completed = int(row.get("passes_completed", 0))
-            line = f"{row.get('team')}: Goals {goals}"
-            if xg:
-                line += f", xG {xg:.2f}"
-            if passes_completed:
-                line += f", Passes Completed {passes_completed}"
-            lines.append(line)
+        lines.extend(_team_summary_lines(team_summary))
 
     if leaderboards:
         summary_lines = _summarise_leaderboards(leaderboards)
@@ -1546,7 +1661,7 @@ def summarise_match_performance(
         "competition_id": competition_id,
         "season_id": season_id,
         "match": match,
-        "player_summary": _df_records(player_summary),
+        "player_summary": _df_records(player_summary) if player_summary is not None else [],
         "team_summary": _df_records(team_summary) if team_summary is not None else [],
         "leaderboards": {
             category: {metric: _df_records(table) for metric, table in tables.items()}
@@ -1600,30 +1715,37 @@ def player_multi_season_summary_tool(
             {"competition_ids": resolved_ids, "season_labels": season_labels},
         )
 
+    def _fetch(label: str, comp_id: int) -> Dict[str, Any]:
+        return get_player_season_summary(
+            player_name=player_name,
+            season_label=label,
+            competition_id=comp_id,
+            metrics=metrics,
+            min_minutes=min_minutes,
+            use_cache=use_cache,
+        )
+
+    # Each season is an independent HTTP-bound fetch, so issue them together.
     summaries: List[Dict[str, Any]] = []
-    for label, comp_id in zip(season_labels, resolved_ids):
-        try:
-            summary = get_player_season_summary(
-                player_name=player_name,
-                season_label=label,
-                competition_id=comp_id,
-                metrics=metrics,
-                min_minutes=min_minutes,
-                use_cache=use_cache,
-            )
-            summaries.append(summary)
-        except ValueError as exc:
-            return _error_response(
-                f"No data for {player_name} in season {label}. Detail: {exc}",
-                {
-                    "player": player_name,
-                    "season_label": label,
-                    "competition_id": comp_id,
-                    "error": str(exc),
-                },
-            )
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(season_labels)))) as executor:
+        futures = [executor.submit(_fetch, label, comp_id) for label, comp_id in zip(season_labels, resolved_ids)]
+        for label, comp_id, future in zip(season_labels, resolved_ids, futures):
+            try:
+                summaries.append(future.result())
+            except ValueError as exc:
+                for pending in futures:
+                    pending.cancel()
+                return _error_response(
+                    f"No data for {player_name} in season {label}. Detail: {exc}",
+                    {
+                        "player": player_name,
+                        "season_label": label,
+                        "competition_id": comp_id,
+                        "error": str(exc),
+                    },
+                )
 
-    field_list = list(metrics) if metrics else sorted(summaries[0].keys())
+    field_list = _preview_fields(metrics, summaries[0])
     preview = _format_rows(summaries, fields=field_list, limit=len(season_labels))
     summary_sections = []
     for record, label in zip(summaries, season_labels):
@@ -1631,18 +1753,19 @@ def player_multi_season_summary_tool(
         summary_sections.append(
             f"{label} ({record.get('team_name', 'N/A')}):\n{metrics_text or '- N/A'}"
         )
-    text = (
-        f"Summaries for {player_name} across seasons {', '.join(season_labels)}.\n"
-        + "\n".join(summary_sections)
-        + f"\nRaw fields:\n{preview}"
-    )
+    lines = [
+        f"Summaries for {player_name} across seasons {', '.join(season_labels)}.",
+        *summary_sections,
+        "Raw fields:",
+        preview,
+    ]
     metadata = {
         "player": player_name,
         "competition_ids": resolved_ids,
         "season_labels": season_labels,
         "records": summaries,
     }
-    return ToolResponse(content=[TextBlock(type="text", text=text)], metadata=metadata)
+    return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=metadata)
 
 
 def compare_player_season_summaries_tool(
@@ -1687,7 +1810,9 @@ def compare_player_season_summaries_tool(
             },
         )
 
-    missing = [name for name in missing if name not in summaries]
+    # Derive both lists from the returned keys so they always agree with them.
+    available_names = [name for name in player_names if name in summaries]
+    missing = [name for name in player_names if name not in summaries]
     if not summaries:
         return _error_response(
             f"No comparison data available for {', '.join(player_names)} in {competition} {season_label}.",
@@ -1699,8 +1824,7 @@ def compare_player_season_summaries_tool(
             },
         )
 
-    available_names = [name for name in player_names if name in summaries]
-    field_list = list(metrics) if metrics else sorted(next(iter(summaries.values())).keys())
+    field_list = _preview_fields(metrics, next(iter(summaries.values())))
     preview_rows = [summaries[name] for name in available_names]
     preview = _format_rows(preview_rows, fields=field_list, limit=len(preview_rows))
 
@@ -1712,20 +1836,21 @@ def compare_player_season_summaries_tool(
             f"{name} ({record.get('team_name', 'N/A')}):\n{metrics_text or '- N/A'}"
         )
 
-    text = (
-        f"Comparison for {', '.join(available_names)} in {season_label}.\n"
-        + "\n".join(summary_sections)
-        + f"\nRaw fields:\n{preview}"
-    )
+    lines = [
+        f"Comparison for {', '.join(available_names)} in {season_label}.",
+        *summary_sections,
+        "Raw fields:",
+        preview,
+    ]
     if missing:
-        text += f"\nMissing data for: {', '.join(missing)}."
+        lines.append(f"Missing data for: {', '.join(missing)}.")
     metadata = {
         "competition_id": resolved_competition_id,
         "season_label": season_label,
         "records": summaries,
         "missing": missing,
     }
-    return ToolResponse(content=[TextBlock(type="text", text=text)], metadata=metadata)
+    return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=metadata)
 
 
 # ---------------------------------------------------------------------------
@@ -1823,53 +1948,117 @@ def _summarise_player_passes(
     )
 
 
+@lru_cache(maxsize=64)
+def _sorted_fields(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(sorted(keys))
+
+
+def _preview_fields(
+    metrics: Optional[Sequence[str]],
+    record: Optional[Dict[str, Any]],
+) -> Tuple[str, ...]:
+    """Return the requested metrics, or the record's keys in sorted order."""
+
+    if metrics:
+        return tuple(metrics)
+    if not record:
+        return ()
+    # Records of one kind share a key layout, so the sorted order is memoised.
+    return _sorted_fields(tuple(record))
+
+
 def _format_rows(
     rows: List[Dict[str, object]],
-    fields: Optional[List[str]] = None,
+    fields: Optional[Sequence[str]] = None,
     limit: int = 5,
 ) -> str:
-    if not rows:
+    if not rows or limit <= 0:
         return ""
-    preview_fields = fields or sorted(rows[0].keys())
-    lines: List[str] = []
-    for row in rows[: max(limit, 0)]:
-        parts = []
-        for field in preview_fields:
-            if field in row and row[field] not in (None, ""):
-                parts.append(f"{field}={row[field]}")
-        if parts:
-            lines.append("- " + ", ".join(parts))
-    return "\n".join(lines)
-
-
-def _summarise_metrics(record: Dict[str, Any], mapping: List[Tuple[str, str]]) -> str:
-    lines = []
-    for key, label in mapping:
-        value = record.get(key)
-        if value in (None, ""):
-            continue
-        if isinstance(value, float):
-            value = f"{value:.2f}"
-        lines.append(f"- {label}: {value}")
-    return "\n".join(lines)
+    format_row = _make_row_formatter(tuple(fields) if fields else _preview_fields(None, rows[0]))
+    return "\n".join(line for line in map(format_row, rows[:limit]) if line)
+
+
+@lru_cache(maxsize=64)
+def _make_row_formatter(fields: Tuple[str, ...]) -> Callable[[Dict[str, Any]], str]:
+    """Return a formatter rendering a row as ``- field=value, ...`` over ``fields``."""
+
+    prefixes = tuple((field, f"{field}=") for field in fields)
+
+    def _format_row(row: Dict[str, Any]) -> str:
+        parts = [
+            f"{prefix}{value}"
+            for field, prefix in prefixes
+            for value in (row.get(field),)
+            if value not in (None, "")
+        ]
+        return "- " + ", ".join(parts) if parts else ""
+
+    return _format_row
+
+
+def _format_metric(value: Any, spec: str) -> str:
+    try:
+        return format(value, spec)
+    except (TypeError, ValueError):
+        # Non-numeric values (e.g. labels) are shown as-is.
+        return str(value)
+
+
+def _summarise_metrics(record: Dict[str, Any], mapping: Sequence[Tuple[str, str, str]]) -> str:
+    return "\n".join(
+        f"- {label}: {_format_metric(value, spec)}"
+        for key, label, spec in mapping
+        for value in (record.get(key),)
+        if value not in (None, "")
+    )
+
+
+def _render_summary(
+    record: Dict[str, Any],
+    summary_map: Sequence[Tuple[str, str, str]],
+    preview_fields: Sequence[str],
+) -> Tuple[str, str]:
+    """Render the key-metric lines and the raw-field preview line for one record."""
+
+    preview = _make_row_formatter(tuple(preview_fields))(record)
+    return _summarise_metrics(record, summary_map), preview
+
+
+def _dumps_indented(payload: Any) -> str:
+    """Serialise ``payload`` as two-space indented JSON, via orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+# Shared stand-in for absent nested objects, so no empty dict is built per lookup.
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+def _preview_values(context: Any) -> Tuple[object, ...]:
+    """Extract one event's values in ``EVENT_PREVIEW_FIELDS`` order."""
+
+    event = context.event
+    get = event.get
+    return (
+        get("id"),
+        (get("type") or _EMPTY_MAPPING).get("name"),
+        (get("team") or _EMPTY_MAPPING).get("name"),
+        (get("player") or _EMPTY_MAPPING).get("name"),
+        get("minute"),
+        get("second"),
+        context.score_state,
+    )
 
 
 def _preview_events(dataset: MatchDataset, limit: int) -> List[Dict[str, object]]:
-    preview = []
-    for context in dataset.events[: max(limit, 0)]:
-        event = context.event
-        preview.append(
-            {
-                "event_id": event.get("id"),
-                "type": event.get("type", {}).get("name"),
-                "team": event.get("team", {}).get("name"),
-                "player": event.get("player", {}).get("name"),
-                "minute": event.get("minute"),
-                "second": event.get("second"),
-                "score_state": context.score_state,
-            }
-        )
-    return preview
+    # Only the previewed slice is touched; flattening every event up front
+    # would cost far more than the handful of rows shown.
+    return [
+        dict(zip(EVENT_PREVIEW_FIELDS, _preview_values(context)))
+        for context in dataset.events[: max(limit, 0)]
+    ]
 
 
 def player_report_template_tool(
@@ -1906,7 +2095,7 @@ def player_report_template_tool(
         season_timeframe=season_timeframe,
         utilization=utilization,
     )
-    json_payload = json.dumps(template, indent=2)
+    json_payload = _dumps_indented(template)
     return ToolResponse(
         content=[
             TextBlock(type="text", text=json_payload),
@@ -1935,4 +2124,5 @@ __all__ = [
     "compare_player_season_summaries_tool",
     "player_report_template_tool",
     "init_session_with_statsbomb_tools",
+    "get_full_records",
 ]
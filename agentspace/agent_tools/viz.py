@@ -3,6 +3,9 @@ Agent toolkit for StatsBomb visualizations via mplsoccer.
 """
 
 import base64
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional, Sequence, Tuple
 
@@ -10,7 +13,8 @@ from agentscope.message import Base64Source, ImageBlock, TextBlock
 from agentscope.tool import Toolkit, ToolResponse
 
 from ..analytics.mplsoccer_viz import plot_match_shot_map, plot_event_heatmap, plot_pass_network
-from ..services.statsbomb_tools import MatchDescriptor, fetch_match_dataset
+from ..services.statsbomb_tools import MatchDataset, MatchDescriptor, fetch_match_dataset
+from .images import encode_image_file
 
 
 def _error_response(reason: str, metadata: Optional[dict[str, Any]] = None) -> ToolResponse:
@@ -20,13 +24,76 @@ def _error_response(reason: str, metadata: Optional[dict[str, Any]] = None) -> T
     )
 
 
+# Recent unfiltered datasets keyed on ``(match_id, competition_id, season_id)``.
+# Entries expire after a few minutes so a long-lived process still picks up
+# refreshed StatsBomb data.
+_DATASET_CACHE: "OrderedDict[Tuple[int, Optional[int], Optional[int]], Tuple[float, MatchDataset]]" = OrderedDict()
+_DATASET_CACHE_SIZE = 4
+_DATASET_CACHE_TTL = 300.0
+_DATASET_CACHE_LOCK = threading.Lock()
+
+
+def _cached_dataset(key: Tuple[int, Optional[int], Optional[int]]) -> Optional[MatchDataset]:
+    with _DATASET_CACHE_LOCK:
+        entry = _DATASET_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, dataset = entry
+        if time.monotonic() - stored_at > _DATASET_CACHE_TTL:
+            del _DATASET_CACHE[key]
+            return None
+        _DATASET_CACHE.move_to_end(key)
+        return dataset
+
+
+def _store_dataset(key: Tuple[int, Optional[int], Optional[int]], dataset: MatchDataset) -> None:
+    with _DATASET_CACHE_LOCK:
+        _DATASET_CACHE[key] = (time.monotonic(), dataset)
+        _DATASET_CACHE.move_to_end(key)
+        while len(_DATASET_CACHE) > _DATASET_CACHE_SIZE:
+            _DATASET_CACHE.popitem(last=False)
+
+
+def _match_dataset(
+    match_id: int,
+    competition_id: Optional[int],
+    season_id: Optional[int],
+    use_cache: bool,
+) -> MatchDataset:
+    """Fetch an unfiltered match dataset, shared across the viz tools.
+
+    Agents commonly render several plots for one match, so recent datasets are
+    kept for ``_DATASET_CACHE_TTL`` seconds. ``use_cache=False`` bypasses them.
+    """
+    key = (match_id, competition_id, season_id)
+    if use_cache:
+        cached = _cached_dataset(key)
+        if cached is not None:
+            return cached
+    descriptor = MatchDescriptor(
+        match_id=match_id,
+        competition_id=competition_id,
+        season_id=season_id,
+    )
+    dataset = fetch_match_dataset(descriptor, use_cache=use_cache)
+    if use_cache:
+        _store_dataset(key, dataset)
+    return dataset
+
+
 def _image_payload(
     path: Path,
     *,
+    png_bytes: Optional[bytes] = None,
     mime_type: str = "image/png",
     alt: Optional[str] = None,
 ) -> Tuple[ImageBlock, dict[str, Any]]:
-    data_encoded = base64.b64encode(path.read_bytes()).decode("ascii")
+    # Plot helpers hand back the rendered bytes; only fall back to the file
+    # when they are missing.
+    if png_bytes is not None:
+        data_encoded = base64.b64encode(png_bytes).decode("ascii")
+    else:
+        data_encoded = encode_image_file(path)
     block = ImageBlock(
         type="image",
         source=Base64Source(
@@ -59,16 +126,8 @@ def plot_match_shot_map_tool(
     Generate a shot map for the specified match.
     """
 
-    descriptor = MatchDescriptor(
-        match_id=match_id,
-        competition_id=competition_id,
-        season_id=season_id,
-    )
     try:
-        dataset = fetch_match_dataset(
-            descriptor,
-            use_cache=use_cache,
-        )
+        dataset = _match_dataset(match_id, competition_id, season_id, use_cache)
     except Exception as exc:  # pragma: no cover - network failures
         return _error_response(f"Failed to fetch match data: {exc}")
 
@@ -95,13 +154,13 @@ def plot_match_shot_map_tool(
     alt_text = f"Shot map for {team_label} vs {opponent_label}" if result.opponent_name else f"Shot map for {team_label}"
     image_block, image_meta = _image_payload(
         Path(result.path),
+        png_bytes=result.png_bytes,
         alt=alt_text,
     )
 
     metadata = {
         "image_path": str(result.path),
         "image_mime_type": "image/png",
-        "image_data": image_meta.get("data"),
         "team_name": result.team_name,
         "opponent_name": result.opponent_name,
         "match_id": result.match_id,
@@ -140,16 +199,8 @@ def plot_event_heatmap_tool(
     Generate an on-ball action heatmap for a team in a given match.
     """
 
-    descriptor = MatchDescriptor(
-        match_id=match_id,
-        competition_id=competition_id,
-        season_id=season_id,
-    )
     try:
-        dataset = fetch_match_dataset(
-            descriptor,
-            use_cache=use_cache,
-        )
+        dataset = _match_dataset(match_id, competition_id, season_id, use_cache)
     except Exception as exc:  # pragma: no cover
         return _error_response(f"Failed to fetch match data: {exc}")
 
@@ -173,13 +224,13 @@ def plot_event_heatmap_tool(
     team_label = result.team_name or team_name
     image_block, image_meta = _image_payload(
         Path(result.path),
+        png_bytes=result.png_bytes,
         alt=f"Event heatmap for {team_label}",
     )
 
     metadata = {
         "image_path": str(result.path),
         "image_mime_type": "image/png",
-        "image_data": image_meta.get("data"),
         "team_name": result.team_name,
         "match_id": result.match_id,
         "competition_id": result.competition_id,
@@ -213,16 +264,8 @@ def plot_pass_network_tool(
     Generate a pass network visual for a team's completed passes.
     """
 
-    descriptor = MatchDescriptor(
-        match_id=match_id,
-        competition_id=competition_id,
-        season_id=season_id,
-    )
     try:
-        dataset = fetch_match_dataset(
-            descriptor,
-            use_cache=use_cache,
-        )
+        dataset = _match_dataset(match_id, competition_id, season_id, use_cache)
     except Exception as exc:  # pragma: no cover
         return _error_response(f"Failed to fetch match data: {exc}")
 
@@ -245,13 +288,13 @@ def plot_pass_network_tool(
     team_label = result.team_name or team_name
     image_block, image_meta = _image_payload(
         Path(result.path),
+        png_bytes=result.png_bytes,
         alt=f"Pass network for {team_label}",
     )
 
     metadata = {
         "image_path": str(result.path),
         "image_mime_type": "image/png",
-        "image_data": image_meta.get("data"),
         "team_name": result.team_name,
         "match_id": result.match_id,
         "competition_id": result.competition_id,
@@ -283,20 +326,17 @@ def register_statsbomb_viz_tools(
     """
 
     toolkit = toolkit or Toolkit()
-    try:
+    if group_name in toolkit.groups:
+        # Group already exists; continue registering functions.
+        if activate:
+            toolkit.update_tool_groups([group_name], active=True)
+    else:
         toolkit.create_tool_group(
             group_name,
             description="Visualization tools rendering StatsBomb data via mplsoccer.",
             active=activate,
             notes="Generates PNG pitch plots; ensure mplsoccer/matplotlib dependencies are installed.",
         )
-    except ValueError:
-        # Group already exists; continue registering functions.
-        if activate:
-            toolkit.update_tool_groups([group_name], active=True)
-    else:
-        if activate:
-            toolkit.update_tool_groups([group_name], active=True)
     toolkit.register_tool_function(
         plot_match_shot_map_tool,
         group_name=group_name,
@@ -5,21 +5,102 @@ from __future__ import annotations
 
 import html
 import re
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 from urllib.parse import quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from agentscope.message import TextBlock
 from agentscope.tool import ToolResponse, Toolkit
 
+# Shared keep-alive session so repeat lookups skip the TCP/TLS handshake;
+# transient proxy failures are retried with a short backoff.
+_RETRY = Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
 
-def _clean_text(raw: str) -> str:
-    text = html.unescape(raw)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text)
+# (connect, read) timeouts in seconds.
+_TIMEOUT = (3, 10)
+
+# Cleaned results keyed on ``(query, max_chars)``; the proxy answers identical
+# queries identically, so recent lookups are served from memory.
+_RESULT_CACHE: "OrderedDict[Tuple[str, int], Tuple[float, str]]" = OrderedDict()
+_RESULT_CACHE_SIZE = 256
+_RESULT_CACHE_TTL = 300.0
+_RESULT_CACHE_LOCK = threading.Lock()
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Raw characters scanned per output character before falling back to the full
+# body, and the slack kept for an entity split at the cut (``&...;`` <= 32).
+_RAW_WINDOW_FACTOR = 8
+_CUT_MARGIN = 32
+
+
+def _cached_result(key: Tuple[str, int]) -> Optional[str]:
+    with _RESULT_CACHE_LOCK:
+        entry = _RESULT_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, cleaned = entry
+        if time.monotonic() - stored_at > _RESULT_CACHE_TTL:
+            del _RESULT_CACHE[key]
+            return None
+        _RESULT_CACHE.move_to_end(key)
+        return cleaned
+
+
+def _store_result(key: Tuple[str, int], cleaned: str) -> None:
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = (time.monotonic(), cleaned)
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+
+
+def _strip_markup(text: str) -> str:
+    text = _TAG_RE.sub(" ", text)
+    text = _WS_RE.sub(" ", text)
     return text.strip()
 
 
+def _clean_text(raw: str) -> str:
+    return _strip_markup(html.unescape(raw))
+
+
+def _clean_excerpt(raw: str, max_chars: int) -> str:
+    """
+    Return ``_clean_text(raw)[:max_chars]`` while cleaning only a raw prefix.
+
+    Cleaning never lengthens text, so a prefix whose cleaned form comfortably
+    exceeds ``max_chars`` yields the same excerpt as the full body.
+    """
+    window = max_chars * _RAW_WINDOW_FACTOR
+    if len(raw) > window:
+        # Unescape before looking for tags: ``&lt;`` becomes a tag opener in
+        # the full clean too.
+        prefix = html.unescape(raw[:window])
+        # Drop a tag left open by the cut; its ``>`` may lie far past the window.
+        open_tag = prefix.rfind("<")
+        if open_tag > prefix.rfind(">"):
+            prefix = prefix[:open_tag]
+        cleaned = _strip_markup(prefix)
+        if len(cleaned) >= max_chars + _CUT_MARGIN:
+            return cleaned[:max_chars]
+    return _clean_text(raw)[:max_chars]
+
+
 def web_search(query: str, *, max_chars: int = 1500) -> ToolResponse:
     """
     Perform a lightweight web lookup via a text-only proxy.
@@ -31,20 +112,24 @@ def web_search(query: str, *, max_chars: int = 1500) -> ToolResponse:
             metadata={"query": query, "results": None},
         )
 
-    endpoint = f"https://r.jina.ai/https://duckduckgo.com/?q={quote_plus(query)}"
-    try:
-        response = requests.get(endpoint, timeout=15)
-        response.raise_for_status()
-        body = response.text
-    except Exception as exc:  # pragma: no cover - network dependencies
-        return ToolResponse(
-            content=[TextBlock(type="text", text=f"Web search failed: {exc}")],
-            metadata={"query": query, "results": None},
-        )
+    cache_key = (query, max_chars)
+    cleaned = _cached_result(cache_key)
+    if cleaned is None:
+        endpoint = f"https://r.jina.ai/https://duckduckgo.com/?q={quote_plus(query)}"
+        try:
+            response = _SESSION.get(endpoint, timeout=_TIMEOUT)
+            response.raise_for_status()
+            body = response.text
+        except Exception as exc:  # pragma: no cover - network dependencies
+            return ToolResponse(
+                content=[TextBlock(type="text", text=f"Web search failed: {exc}")],
+                metadata={"query": query, "results": None},
+            )
 
-    cleaned = _clean_text(body)[:max_chars]
-    if not cleaned:
-        cleaned = "No readable content returned from search proxy."
+        cleaned = _clean_excerpt(body, max_chars)
+        if not cleaned:
+            cleaned = "No readable content returned from search proxy."
+        _store_result(cache_key, cleaned)
     metadata = {"query": query, "results": cleaned}
     return ToolResponse(
         content=[TextBlock(type="text", text=cleaned)],
@@ -54,15 +139,13 @@ def web_search(query: str, *, max_chars: int = 1500) -> ToolResponse:
 
 def register_web_search_tools(toolkit: Optional[Toolkit] = None, *, group_name: str = "web", activate: bool = True) -> Toolkit:
     toolkit = toolkit or Toolkit()
-    try:
+    if group_name not in toolkit.groups:
         toolkit.create_tool_group(
             group_name,
             description="Lightweight web search fallback.",
             active=activate,
             notes="Proxy-powered text search useful for quick cross-checks.",
         )
-    except ValueError:
-        pass
 
     toolkit.register_tool_function(
         web_search,
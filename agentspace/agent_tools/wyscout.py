@@ -2,7 +2,11 @@
 Agentscope toolkit integration for Wyscout data helpers.
 """
 
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Sized, Tuple
 
 from agentscope.message import TextBlock
 from agentscope.tool import Toolkit, ToolResponse
@@ -27,44 +31,109 @@ WYSCOUT_COMPETITION_IDS: Dict[str, Dict[str, int]] = {
     },
 }
 
+# Lower-cased competition name -> (country, competition id), flattened once.
+_COMPETITION_NAME_INDEX: Dict[str, Tuple[str, int]] = {
+    name.lower(): (country, competition_id)
+    for country, competitions in WYSCOUT_COMPETITION_IDS.items()
+    for name, competition_id in competitions.items()
+}
+
+
+def resolve_competition_by_name(name: str) -> Optional[Tuple[str, int]]:
+    """Return ``(country, competition_id)`` for a known competition name."""
 
+    return _COMPETITION_NAME_INDEX.get(name.strip().lower())
+
+
+@lru_cache(maxsize=1)
 def _client():
+    # data_fetch already hands out a singleton; holding it here skips the
+    # facade dispatch on every tool call. Use ``_client.cache_clear()`` to reset.
     return data_fetch.get_wyscout_client()
 
 
+# Resolved area names. Only hits are kept: a miss may be answered by the live
+# ``list_areas`` fallback on a later call, so it must not stick for the process.
+_AREA_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_AREA_CACHE_SIZE = 256
+_AREA_CACHE_LOCK = threading.Lock()
+
+
+def _resolve_area(area_id: Optional[int | str], use_cache: bool) -> Optional[Dict[str, Any]]:
+    # Agents repeat the same country names across calls; memoise string lookups.
+    if area_id is None:
+        return None
+    if not (isinstance(area_id, str) and use_cache):
+        return data_fetch.resolve_wyscout_area(area_id)
+    with _AREA_CACHE_LOCK:
+        area = _AREA_CACHE.get(area_id)
+        if area is not None:
+            _AREA_CACHE.move_to_end(area_id)
+            # Hand out a copy so callers cannot mutate the memoised entry.
+            return dict(area)
+    area = data_fetch.resolve_wyscout_area(area_id)
+    if area is None:
+        return None
+    with _AREA_CACHE_LOCK:
+        _AREA_CACHE[area_id] = dict(area)
+        _AREA_CACHE.move_to_end(area_id)
+        while len(_AREA_CACHE) > _AREA_CACHE_SIZE:
+            _AREA_CACHE.popitem(last=False)
+    return area
+
+
+# Joins leaves in a search blob; queries never contain it, so a match can
+# never straddle two leaves.
+_BLOB_SEPARATOR = "\x1f"
+
+
 def _flatten_strings(value: Any) -> Iterable[str]:
-    if isinstance(value, str):
-        yield value
-    elif isinstance(value, dict):
-        for item in value.values():
-            yield from _flatten_strings(item)
-    elif isinstance(value, list):
-        for item in value:
-            yield from _flatten_strings(item)
+    # Iterative depth-first walk (no generator frame per nesting level); leaves
+    # are yielded in the same order as a recursive traversal.
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            stack.extend(reversed(list(item.values())))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+
+
+def _search_blob(value: Any) -> str:
+    """Lowercased string leaves of ``value`` joined into one searchable buffer."""
+
+    return _BLOB_SEPARATOR.join(_flatten_strings(value)).lower()
 
 
 def _string_matches(value: Any, query: str) -> bool:
     q = query.strip().lower()
     if not q:
         return True
-    for text in _flatten_strings(value):
-        if q in text.lower():
-            return True
-    return False
+    return q in _search_blob(value)
+
+
+_MATCH_ID_KEYS = ("match_id", "matchId", "id")
 
 
 def _extract_match_id(match: Dict[str, Any]) -> Optional[int]:
-    for key in ("match_id", "matchId", "id"):
+    for key in _MATCH_ID_KEYS:
         val = match.get(key)
-        if isinstance(val, int):
-            return val
-        if isinstance(val, str) and val.isdigit():
+        if val is None:
+            continue
+        try:
             return int(val)
+        except (TypeError, ValueError):
+            continue
     return None
 
 
-def _extract_team_name(match: Dict[str, Any], role: str) -> Optional[str]:
-    candidates: Sequence[str] = (
+@lru_cache(maxsize=None)
+def _role_keys(role: str) -> Tuple[str, ...]:
+    """Candidate match keys holding the ``role`` team, built once per role."""
+
+    return (
         f"{role}_team",
         f"{role}Team",
         f"{role}team",
@@ -72,52 +141,83 @@ def _extract_team_name(match: Dict[str, Any], role: str) -> Optional[str]:
         f"{role}teamName",
         role,
     )
-    for key in candidates:
+
+
+_NAME_ATTRS = ("name", "teamName", "shortName", "officialName", "label")
+_DATE_KEYS = ("date", "matchDate", "gameDate", "startTime", "kickoff")
+
+
+def _entry_name(entry: Dict[str, Any]) -> Optional[str]:
+    for attr in _NAME_ATTRS:
+        val = entry.get(attr)
+        if isinstance(val, str):
+            return val
+    return None
+
+
+def _extract_team_name(match: Dict[str, Any], role: str) -> Optional[str]:
+    for key in _role_keys(role):
         if key in match:
             entry = match[key]
             if isinstance(entry, str):
                 return entry
             if isinstance(entry, dict):
-                for attr in ("name", "teamName", "shortName", "officialName", "label"):
-                    val = entry.get(attr)
-                    if isinstance(val, str):
-                        return val
+                name = _entry_name(entry)
+                if name is not None:
+                    return name
     # team1/team2 mapping
     alt_key = "team1" if role == "home" else "team2"
     entry = match.get(alt_key)
     if isinstance(entry, dict):
-        for attr in ("name", "teamName", "shortName", "officialName", "label"):
-            val = entry.get(attr)
-            if isinstance(val, str):
-                return val
+        name = _entry_name(entry)
+        if name is not None:
+            return name
     # nested teams dict
     teams = match.get("teams")
     if isinstance(teams, dict):
         sub = teams.get(role)
         if isinstance(sub, dict):
-            for attr in ("name", "teamName", "shortName", "officialName", "label"):
-                val = sub.get(attr)
-                if isinstance(val, str):
-                    return val
+            return _entry_name(sub)
     return None
 
 
 def _extract_match_date(match: Dict[str, Any]) -> Optional[str]:
-    for key in ("date", "matchDate", "gameDate", "startTime", "kickoff"):
+    for key in _DATE_KEYS:
         val = match.get(key)
         if isinstance(val, str):
             return val
     return None
 
 
+def _summarize_match(match: Dict[str, Any]) -> Tuple[Optional[int], Optional[str], Optional[str], Optional[str]]:
+    """Return ``(match_id, date, home, away)`` for a preview row."""
+
+    return (
+        _extract_match_id(match),
+        _extract_match_date(match),
+        _extract_team_name(match, "home"),
+        _extract_team_name(match, "away"),
+    )
+
+
+def _count_player_records(stats: Dict[str, Any]) -> int:
+    payload = stats.get("players") or stats.get("items")
+    return len(payload) if isinstance(payload, list) else 0
+
+
+def _no_records(stats: Any) -> int:
+    return 0
+
+
+# Parsed JSON payloads are plain dicts/lists, so dispatch on the exact type.
+_RECORD_COUNTERS: Dict[type, Callable[[Any], int]] = {
+    dict: _count_player_records,
+    list: len,
+}
+
+
 def _format_rows(rows: Sequence[Dict[str, Any]], fields: Sequence[str]) -> str:
-    lines: List[str] = []
-    for row in rows[:5]:
-        parts = []
-        for field in fields:
-            parts.append(str(row.get(field, "")))
-        lines.append(", ".join(parts))
-    return "\n".join(lines)
+    return "\n".join(", ".join(str(row.get(field, "")) for field in fields) for row in rows[:5])
 
 
 def list_wyscout_areas(
@@ -134,13 +234,12 @@ def list_wyscout_areas(
     elif source_key in ("combined", "all"):
         client = _client()
         live = client.list_areas(use_cache=use_cache) or []
-        combined: Dict[int, Dict[str, Any]] = {}
-        for entry in data_fetch.get_wyscout_common_areas():
-            combined[entry.get("id")] = entry
-        for entry in live:
-            identifier = entry.get("id")
-            if isinstance(identifier, int):
-                combined[identifier] = entry
+        combined: Dict[int, Dict[str, Any]] = {
+            entry.get("id"): entry for entry in data_fetch.get_wyscout_common_areas()
+        }
+        combined.update(
+            (entry["id"], entry) for entry in live if isinstance(entry.get("id"), int)
+        )
         areas = list(combined.values())
         resolved_source = "combined"
     else:
@@ -152,13 +251,13 @@ def list_wyscout_areas(
         areas,
         fields=["id", "name", "alpha2code"],
     )
-    lines = [
+    lines = (
         f"Found {len(areas)} Wyscout area(s).",
         f"Source: {resolved_source}",
         "Sample (id, name, alpha2code):",
         preview or "- None",
         "Full list in metadata['areas'].",
-    ]
+    )
     meta = {"areas": areas, "source": resolved_source}
     return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=meta)
 
@@ -171,16 +270,15 @@ def list_wyscout_competitions(
     """List competitions available via the Wyscout API."""
 
     client = _client()
-    resolved_area = None
+    resolved_area = _resolve_area(area_id, use_cache)
     query_area_id: Optional[int] = None
 
     if isinstance(area_id, str):
-        resolved_area = data_fetch.resolve_wyscout_area(area_id)
         if resolved_area is None:
-            lines = [
+            lines = (
                 f"Unable to resolve Wyscout area from '{area_id}'.",
                 "Try list_wyscout_areas(source='common') for available IDs.",
-            ]
+            )
             meta = {
                 "competitions": [],
                 "filters": {
@@ -193,8 +291,6 @@ def list_wyscout_competitions(
         query_area_id = resolved_area.get("id")
     else:
         query_area_id = area_id
-        if area_id is not None:
-            resolved_area = data_fetch.resolve_wyscout_area(area_id)
 
     competitions = client.list_competitions(area_id=query_area_id, use_cache=use_cache) or []
     preview = _format_rows(
@@ -206,13 +302,13 @@ def list_wyscout_competitions(
         area_summary = f"{resolved_area.get('name')} (id={resolved_area.get('id')})"
     elif query_area_id is not None:
         area_summary = f"id={query_area_id}"
-    lines = [
+    lines = (
         f"Found {len(competitions)} Wyscout competition(s).",
         f"Filter area: {area_summary}",
         "Sample (competitionId, name, category):",
         preview or "- None",
         "Full list in metadata['competitions'].",
-    ]
+    )
     meta = {
         "competitions": competitions,
         "filters": {
@@ -226,11 +322,27 @@ def list_wyscout_competitions(
 
 
 def list_wyscout_seasons(
-    competition_id: int,
+    competition_id: int | str,
     *,
     use_cache: bool = True,
 ) -> ToolResponse:
-    """List seasons for a Wyscout competition."""
+    """List seasons for a Wyscout competition (by id or known competition name)."""
+
+    if isinstance(competition_id, str):
+        if competition_id.strip().isdigit():
+            competition_id = int(competition_id)
+        else:
+            resolved = resolve_competition_by_name(competition_id)
+            if resolved is None:
+                lines = (
+                    f"Unable to resolve Wyscout competition from '{competition_id}'.",
+                    "Known names: " + ", ".join(
+                        name for competitions in WYSCOUT_COMPETITION_IDS.values() for name in competitions
+                    ),
+                )
+                meta = {"competition_id": None, "competition_input": competition_id, "seasons": []}
+                return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=meta)
+            competition_id = resolved[1]
 
     client = _client()
     seasons = client.list_seasons(competition_id, use_cache=use_cache) or []
@@ -238,12 +350,12 @@ def list_wyscout_seasons(
         seasons,
         fields=["seasonId", "name", "status"],
     )
-    lines = [
+    lines = (
         f"Found {len(seasons)} season(s) for Wyscout competition {competition_id}.",
         "Sample (seasonId, name, status):",
         preview or "- None",
         "Full list in metadata['seasons'].",
-    ]
+    )
     meta = {"competition_id": competition_id, "seasons": seasons}
     return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=meta)
 
@@ -260,40 +372,39 @@ def list_wyscout_matches(
     """List Wyscout matches for a competition season with optional team filters."""
 
     client = _client()
-    matches = client.list_matches(competition_id, season_id, use_cache=use_cache) or []
+    matches: Iterable[Dict[str, Any]] = client.list_matches(competition_id, season_id, use_cache=use_cache) or []
     if limit is not None:
-        matches = matches[: max(limit, 0)]
+        # Consume the limited prefix lazily so it fuses with the filter pass below.
+        matches = islice(matches, max(limit, 0))
+
+    # Normalise the needles once and flatten each match a single time for all of them.
+    needles = [
+        needle
+        for needle in (name.strip().lower() for name in (team_name, opponent_name) if name)
+        if needle
+    ]
+    if needles:
+        filtered = [
+            match
+            for match in matches
+            for blob in (_search_blob(match),)
+            if all(needle in blob for needle in needles)
+        ]
+    else:
+        filtered = list(matches)
 
-    filtered: List[Dict[str, Any]] = []
-    for match in matches:
-        if team_name and not _string_matches(match, team_name):
-            continue
-        if opponent_name and not _string_matches(match, opponent_name):
-            continue
-        filtered.append(match)
-
-    preview_rows: List[Dict[str, Any]] = []
-    for match in filtered[:5]:
-        match_id = _extract_match_id(match)
-        home = _extract_team_name(match, "home")
-        away = _extract_team_name(match, "away")
-        date = _extract_match_date(match)
-        preview_rows.append(
-            {
-                "match_id": match_id,
-                "date": date or "",
-                "home": home or "?",
-                "away": away or "?",
-            }
-        )
-    preview = _format_rows(preview_rows, fields=["match_id", "date", "home", "away"])
+    # Format the sample straight from the extractors; no per-row dicts needed.
+    preview = "\n".join(
+        ", ".join((str(match_id), date or "", home or "?", away or "?"))
+        for match_id, date, home, away in map(_summarize_match, filtered[:5])
+    )
 
-    lines = [
+    lines = (
         f"Found {len(filtered)} Wyscout match(es) for competition {competition_id} season {season_id}.",
         "Sample (match_id, date, home, away):",
         preview or "- None",
         "Full matches in metadata['matches'].",
-    ]
+    )
     meta = {
         "competition_id": competition_id,
         "season_id": season_id,
@@ -333,13 +444,13 @@ def list_wyscout_competition_players(
     ) or []
 
     preview = _format_rows(players, fields=["wyId", "shortName", "role"])
-    lines = [
+    lines = (
         f"Found {len(players)} player(s) in competition {competition_id}"
         f"{' season ' + str(season_id) if season_id else ''}.",
         "Sample (wyId, shortName, role):",
         preview or "- None",
         "Full list in metadata['players'].",
-    ]
+    )
     meta = {
         "competition_id": competition_id,
         "season_id": season_id,
@@ -374,10 +485,10 @@ def get_wyscout_player_advanced_stats(
         use_cache=use_cache,
     )
     summary_keys = ", ".join(stats.keys()) if isinstance(stats, dict) else str(type(stats))
-    lines = [
+    lines = (
         f"Advanced stats retrieved for player {player_id}.",
         f"Keys: {summary_keys}",
-    ]
+    )
     meta = {
         "player_id": player_id,
         "competition_id": competition_id,
@@ -414,10 +525,10 @@ def get_wyscout_match_advanced_stats(
         use_cache=use_cache,
     )
     summary_keys = ", ".join(stats.keys()) if isinstance(stats, dict) else str(type(stats))
-    lines = [
+    lines = (
         f"Advanced stats retrieved for match {match_id}.",
         f"Keys: {summary_keys}",
-    ]
+    )
     meta = {
         "match_id": match_id,
         "competition_id": competition_id,
@@ -456,18 +567,12 @@ def get_wyscout_match_player_advanced_stats(
         params=params or None,
         use_cache=use_cache,
     )
-    total = 0
-    if isinstance(stats, dict):
-        payload = stats.get("players") or stats.get("items")
-        if isinstance(payload, list):
-            total = len(payload)
-    elif isinstance(stats, list):
-        total = len(stats)
-
-    lines = [
+    total = _RECORD_COUNTERS.get(type(stats), _no_records)(stats)
+
+    lines = (
         f"Player advanced stats retrieved for match {match_id}.",
         f"Records: {total}",
-    ]
+    )
     meta = {
         "match_id": match_id,
         "competition_id": competition_id,
@@ -496,16 +601,18 @@ def get_wyscout_events(
     count = 0
     if isinstance(events, dict):
         payload = events.get("events")
-        if isinstance(payload, Iterable):
+        if isinstance(payload, Sized):
+            count = len(payload)
+        elif isinstance(payload, Iterable):
             count = sum(1 for _ in payload)
     elif isinstance(events, list):
         count = len(events)
 
-    lines = [
+    lines = (
         f"Wyscout events fetched for match {match_id}.",
         f"Event count (if available): {count}",
         "Payload stored in metadata['events'].",
-    ]
+    )
     meta = {
         "match_id": match_id,
         "events": events,
@@ -514,6 +621,44 @@ def get_wyscout_events(
     return ToolResponse(content=[TextBlock(type="text", text="\n".join(lines))], metadata=meta)
 
 
+# Tool functions registered by ``register_wyscout_tools``, with their descriptions.
+_TOOL_DESCRIPTIONS: Tuple[Tuple[Callable[..., ToolResponse], str], ...] = (
+    (list_wyscout_areas, "List areas supported by Wyscout."),
+    (
+        list_wyscout_competitions,
+        "List competitions exposed via Wyscout (area_id required).",
+    ),
+    (list_wyscout_seasons, "List seasons for a Wyscout competition."),
+    (
+        list_wyscout_matches,
+        "List matches for a competition season with optional team/opponent filters.",
+    ),
+    (
+        list_wyscout_competition_players,
+        "List players registered for a competition (optionally scoped to a season).",
+    ),
+    (
+        get_wyscout_events,
+        "Fetch event payload for a specific Wyscout match (v4 endpoints).",
+    ),
+    (
+        get_wyscout_player_advanced_stats,
+        "Fetch advanced statistics for a single player.",
+    ),
+    (get_wyscout_match_advanced_stats, "Fetch match-level advanced statistics."),
+    (
+        get_wyscout_match_player_advanced_stats,
+        "Fetch player-level advanced statistics for a match.",
+    ),
+)
+
+_GROUP_NOTES = (
+    "Use these tools to pull competitions, seasons, player lists, match schedules, "
+    "advanced statistics, and event payloads from the Wyscout API. Provide filters "
+    "to minimise payload sizes when possible."
+)
+
+
 def register_wyscout_tools(
     toolkit: Optional[Toolkit] = None,
     *,
@@ -525,64 +670,19 @@ def register_wyscout_tools(
     """
 
     toolkit = toolkit or Toolkit()
-    try:
+    if group_name not in toolkit.groups:
         toolkit.create_tool_group(
             group_name,
             description="Wyscout data access helpers.",
             active=activate,
-            notes=(
-                "Use these tools to pull competitions, seasons, player lists, match schedules, "
-                "advanced statistics, and event payloads from the Wyscout API. Provide filters "
-                "to minimise payload sizes when possible."
-            ),
+            notes=_GROUP_NOTES,
         )
-    except ValueError:
-        pass
 
-    toolkit.register_tool_function(
-        list_wyscout_areas,
-        group_name=group_name,
-        func_description="List areas supported by Wyscout.",
-    )
-    toolkit.register_tool_function(
-        list_wyscout_competitions,
-        group_name=group_name,
-        func_description="List competitions exposed via Wyscout (area_id required).",
-    )
-    toolkit.register_tool_function(
-        list_wyscout_seasons,
-        group_name=group_name,
-        func_description="List seasons for a Wyscout competition.",
-    )
-    toolkit.register_tool_function(
-        list_wyscout_matches,
-        group_name=group_name,
-        func_description="List matches for a competition season with optional team/opponent filters.",
-    )
-    toolkit.register_tool_function(
-        list_wyscout_competition_players,
-        group_name=group_name,
-        func_description="List players registered for a competition (optionally scoped to a season).",
-    )
-    toolkit.register_tool_function(
-        get_wyscout_events,
-        group_name=group_name,
-        func_description="Fetch event payload for a specific Wyscout match (v4 endpoints).",
-    )
-    toolkit.register_tool_function(
-        get_wyscout_player_advanced_stats,
-        group_name=group_name,
-        func_description="Fetch advanced statistics for a single player.",
-    )
-    toolkit.register_tool_function(
-        get_wyscout_match_advanced_stats,
-        group_name=group_name,
-        func_description="Fetch match-level advanced statistics.",
-    )
-    toolkit.register_tool_function(
-        get_wyscout_match_player_advanced_stats,
-        group_name=group_name,
-        func_description="Fetch player-level advanced statistics for a match.",
-    )
+    for func, description in _TOOL_DESCRIPTIONS:
+        toolkit.register_tool_function(
+            func,
+            group_name=group_name,
+            func_description=description,
+        )
 
     return toolkit
@@ -2,12 +2,18 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
+import re
 import sys
+import threading
+from collections import OrderedDict
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Sequence
+from types import MappingProxyType
+from typing import AsyncIterator, Mapping, Sequence
 
 from requests.exceptions import RequestException
 
@@ -15,36 +21,32 @@ if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from agentscope.agent import ReActAgent
-from agentscope.message import Msg
+from agentscope.message import Msg, TextBlock
 from agentscope.model import OpenAIChatModel, AnthropicChatModel
+from agentscope.pipeline import stream_printing_messages
 from agentscope.formatter import OpenAIChatFormatter, AnthropicChatFormatter
 from agentscope.plan import PlanNotebook
-from agentscope.tool import Toolkit
+from agentscope.tool import Toolkit, ToolResponse
 
 from agentspace import init_session_with_statsbomb_tools
+from agentspace.config import _load_env_from_file
 from agentspace.agent_tools.index_lookup import register_statsbomb_index_tools
-from agentspace.agent_tools.online_index import register_statsbomb_online_index_tools
 from agentspace.agent_tools.offline_sqlite import register_offline_index_tools
-from agentspace.agent_tools.viz import register_statsbomb_viz_tools
-from agentspace.agent_tools.advanced_viz import register_advanced_viz_tools
-from agentspace.agent_tools.event_analysis import register_event_analysis_tools
-from agentspace.agent_tools.wyscout import register_wyscout_tools
-from agentspace.agent_tools.web_search import register_web_search_tools
 from agentspace.agent_tools.rankings import register_ranking_tools
 
+LOGGER = logging.getLogger(__name__)
 
-def _load_env_from_file(env_path: Path) -> None:
-    if not env_path.exists():
-        return
-    for line in env_path.read_text().splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#") or "=" not in stripped:
-            continue
-        key, value = stripped.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        if key and key not in os.environ:
-            os.environ[key] = value
+
+# Tool groups imported and registered only when the agent asks for them via
+# ``discover_tools_tool``; keeps their modules and schemas out of every build.
+_LAZY_TOOL_GROUPS = {
+    "statsbomb-online-index": ("agentspace.agent_tools.online_index", "register_statsbomb_online_index_tools"),
+    "wyscout": ("agentspace.agent_tools.wyscout", "register_wyscout_tools"),
+    "statsbomb-viz": ("agentspace.agent_tools.viz", "register_statsbomb_viz_tools"),
+    "advanced-viz": ("agentspace.agent_tools.advanced_viz", "register_advanced_viz_tools"),
+    "event-analysis": ("agentspace.agent_tools.event_analysis", "register_event_analysis_tools"),
+    "web": ("agentspace.agent_tools.web_search", "register_web_search_tools"),
+}
 
 
 def _season_label_for_today(today: date) -> str:
@@ -55,72 +57,77 @@ def _season_label_for_today(today: date) -> str:
     return f"{start_year}/{start_year + 1}"
 
 
-def _system_prompt() -> str:
-    """
-    Build a dynamic system prompt that reflects current date context.
-    """
-    today = datetime.now(timezone.utc).astimezone()
-    season_label = _season_label_for_today(today.date())
-    current_year = today.year
-    next_year = current_year + 1
-    competition_reference = "\n".join(
-        [
-            "Competition reference (hard-coded):",
-            "- Premier League — competition_id=2; season ids: 2025/26=318, 2024/25=317, 2023/24=281, 2022/23=235, 2021/22=108.",
-            "- La Liga — competition_id=11; use list_seasons_tool if a season id is missing.",
-            "- Bundesliga — competition_id=9.",
-            "- Serie A — competition_id=12; fallback season id 318.",
-            "- Ligue 1 — competition_id=7.",
-            "- Eredivisie — competition_id=6.",
-            "- Primeira Liga — competition_id=13.",
-            "- Jupiler Pro League — competition_id=46.",
-            "- MLS — competition_id=37.",
-            "- UEFA Champions League — competition_id=16.",
-            "- UEFA Europa League — competition_id=35.",
-            "- UEFA Europa Conference League — competition_id=353.",
-            "- FA Cup — competition_id=69.",
-            "- Copa del Rey — competition_id=87.",
-            "- Coppa Italia — competition_id=66.",
-            "- Coupe de France — competition_id=86.",
-            "- DFB Pokal — competition_id=165.",
-            "- Danish Superliga — competition_id=77.",
-            "- Allsvenskan — competition_id=75.",
-            "- J1 League — competition_id=108.",
-            "- 2. Bundesliga — competition_id=10.",
-            "- Serie B — competition_id=1281.",
-        ]
-    )
-    api_versions = (
-        "StatsBomb API versions: competitions=v4, seasons=v6, matches=v6, events=v8, "
-        "lineups=v4, 360=v2, player season stats=v4, team season stats=v2, "
-        "player match stats=v5, team match stats=v1."
-    )
-    retrieval_checklist = "\n".join(
-        [
-            "Retrieval checklist (run in this order before drafting an answer):",
-            "1. Inspect prior messages and tool metadata in memory for existing competition, season, team, or player identifiers. Reuse them if they satisfy the new question.",
-            "2. If identifiers are missing, query the offline SQLite index helpers (`search_competitions_tool`, `search_teams_tool`, `search_players_tool`, `search_matches_tool`, `search_match_players_tool`) to resolve them with the tightest filters possible.",
-            "3. When IDs are resolved, prefer aggregate StatsBomb helpers (`player_season_summary_tool`, `team_season_summary_tool`, `player_multi_season_summary_tool`, `compare_player_season_summaries_tool`) before any heavy event downloads.",
-            "4. For leaderboard or 'best X' prompts, call the season ranking coverage helpers (`list_ranking_coverage_tool`, `list_ranking_metrics_tool`) to confirm cached seasons/metrics, then use `rank_players_by_metric_tool` / `player_percentile_snapshot_tool` before touching network-heavy endpoints.",
-            "5. Only if the offline route fails, walk the fallbacks exactly in this order: StatsBomb JSON index (group 'statsbomb-index'), StatsBomb online index helpers (group 'statsbomb-online-index'), StatsBomb network APIs, Wyscout, and finally web search.",
-            "6. After each retrieval hop, store the identifiers in memory so future turns can skip repeated work.",
-        ]
-    )
+# Static prompt sections, built once at import; only the date line and the
+# season label vary between agent builds.
+_DISCOVER_TOOLS_HINT = (
+    "- The tool groups "
+    + ", ".join(f"'{group}'" for group in _LAZY_TOOL_GROUPS)
+    + " load on demand: call `discover_tools_tool` with the group name before using their tools."
+)
+
+_COMPETITION_REFERENCE = "\n".join(
+    [
+        "Competition reference (hard-coded):",
+        "- Premier League — competition_id=2; season ids: 2025/26=318, 2024/25=317, 2023/24=281, 2022/23=235, 2021/22=108.",
+        "- La Liga — competition_id=11; use list_seasons_tool if a season id is missing.",
+        "- Bundesliga — competition_id=9.",
+        "- Serie A — competition_id=12; fallback season id 318.",
+        "- Ligue 1 — competition_id=7.",
+        "- Eredivisie — competition_id=6.",
+        "- Primeira Liga — competition_id=13.",
+        "- Jupiler Pro League — competition_id=46.",
+        "- MLS — competition_id=37.",
+        "- UEFA Champions League — competition_id=16.",
+        "- UEFA Europa League — competition_id=35.",
+        "- UEFA Europa Conference League — competition_id=353.",
+        "- FA Cup — competition_id=69.",
+        "- Copa del Rey — competition_id=87.",
+        "- Coppa Italia — competition_id=66.",
+        "- Coupe de France — competition_id=86.",
+        "- DFB Pokal — competition_id=165.",
+        "- Danish Superliga — competition_id=77.",
+        "- Allsvenskan — competition_id=75.",
+        "- J1 League — competition_id=108.",
+        "- 2. Bundesliga — competition_id=10.",
+        "- Serie B — competition_id=1281.",
+    ]
+)
+
+_API_VERSIONS = (
+    "StatsBomb API versions: competitions=v4, seasons=v6, matches=v6, events=v8, "
+    "lineups=v4, 360=v2, player season stats=v4, team season stats=v2, "
+    "player match stats=v5, team match stats=v1."
+)
+
+_CHAT_RETRIEVAL_CHECKLIST = "\n".join(
+    [
+        "Retrieval checklist (run in this order before drafting an answer):",
+        "1. Inspect prior messages and tool metadata in memory for existing competition, season, team, or player identifiers. Reuse them if they satisfy the new question.",
+        "2. If identifiers are missing, query the offline SQLite index helpers (`search_competitions_tool`, `search_teams_tool`, `search_players_tool`, `search_matches_tool`, `search_match_players_tool`) to resolve them with the tightest filters possible.",
+        "3. When IDs are resolved, prefer aggregate StatsBomb helpers (`player_season_summary_tool`, `team_season_summary_tool`, `player_multi_season_summary_tool`, `compare_player_season_summaries_tool`) before any heavy event downloads.",
+        "4. For leaderboard or 'best X' prompts, call the season ranking coverage helpers (`list_ranking_coverage_tool`, `list_ranking_metrics_tool`) to confirm cached seasons/metrics, then use `rank_players_by_metric_tool` / `player_percentile_snapshot_tool` before touching network-heavy endpoints.",
+        "5. Only if the offline route fails, walk the fallbacks exactly in this order: StatsBomb JSON index (group 'statsbomb-index'), StatsBomb online index helpers (group 'statsbomb-online-index'), StatsBomb network APIs, Wyscout, and finally web search.",
+        "6. After each retrieval hop, store the identifiers in memory so future turns can skip repeated work.",
+    ]
+)
+
+_CHAT_TOOL_HIERARCHY = "\n".join(
+    [
+        "Tool selection hierarchy:",
+        "1. Leaderboards / 'best X' / top-performer queries → `list_ranking_coverage_tool` → `list_ranking_metrics_tool` → `rank_players_by_metric_tool` or `player_percentile_snapshot_tool` (reuse the metric names returned).",
+        "2. ID resolution → offline index (`search_competitions_tool`, `search_teams_tool`, `search_players_tool`, `search_matches_tool`, `search_match_players_tool`).",
+        "3. Season or player summaries → StatsBomb aggregate helpers (`player_season_summary_tool`, `team_season_summary_tool`, `player_multi_season_summary_tool`, `compare_player_season_summaries_tool`).",
+        "4. If aggregates miss coverage → StatsBomb JSON index, then StatsBomb online index helpers, then network StatsBomb APIs.",
+        "5. Remaining gaps → Wyscout tool group, then web search as the final resort (explain the gap).",
+        "6. Visual explanations → StatsBomb viz / advanced viz once IDs and metrics are locked in.",
+    ]
+)
 
-    tool_hierarchy = "\n".join(
-        [
-            "Tool selection hierarchy:",
-            "1. Leaderboards / 'best X' / top-performer queries → `list_ranking_coverage_tool` → `list_ranking_metrics_tool` → `rank_players_by_metric_tool` or `player_percentile_snapshot_tool` (reuse the metric names returned).",
-            "2. ID resolution → offline index (`search_competitions_tool`, `search_teams_tool`, `search_players_tool`, `search_matches_tool`, `search_match_players_tool`).",
-            "3. Season or player summaries → StatsBomb aggregate helpers (`player_season_summary_tool`, `team_season_summary_tool`, `player_multi_season_summary_tool`, `compare_player_season_summaries_tool`).",
-            "4. If aggregates miss coverage → StatsBomb JSON index, then StatsBomb online index helpers, then network StatsBomb APIs.",
-            "5. Remaining gaps → Wyscout tool group, then web search as the final resort (explain the gap).",
-            "6. Visual explanations → StatsBomb viz / advanced viz once IDs and metrics are locked in.",
-        ]
-    )
-    guidelines_lines = [
+_CHAT_GUIDELINES_TEMPLATE = "\n".join(
+    [
         "Guidelines:",
         "- Before any other lookup, default to the offline SQLite index for resolving identifiers.",
+        _DISCOVER_TOOLS_HINT,
         "- For player, team, or match queries, use the offline SQLite helpers (`search_competitions_tool`, `search_teams_tool`, `search_players_tool`, `search_matches_tool`, `search_match_players_tool`) in the fastest logical combination before touching other tool families. Only move onward when those checks cannot supply the IDs you need.",
         "- Minimise tool calls: check existing metadata before reaching for another tool, and avoid repeating the same lookup with identical arguments.",
         "- Prefer aggregate helpers (season summaries, player lists) before drilling into match-level detail; only fetch full event datasets when required for deeper analysis.",
@@ -143,7 +150,7 @@ def _system_prompt() -> str:
         "- For player or team statistics, prefer `fetch_player_season_aggregates`, `fetch_team_season_aggregates`, or `fetch_player_match_aggregates`.",
         "- Use `list_team_players_tool` or `list_competition_players_tool` to resolve player ids, positions, and minutes before drilling into individual metrics.",
         "- When competition or season context is missing, resolve it (rather than assuming the Premier League) before calling summary tools.",
-        f"- When you need match identifiers, call `list_team_matches` with `season_name` set to {season_label} (or the user-specified season) and `match_status=['played']` unless they explicitly want future fixtures.",
+        "- When you need match identifiers, call `list_team_matches` with `season_name` set to {season_label} (or the user-specified season) and `match_status=['played']` unless they explicitly want future fixtures.",
         "- Use `summarise_match_performance` for quick FotMob-style match overviews (player summaries, team totals, leaderboards).",
         "- Summarise final answers with key numbers and match identifiers so the user can verify the results.",
         "- Prefer the quick summary tools (`player_season_summary_tool`, `team_season_summary_tool`, `player_multi_season_summary_tool`, `compare_player_season_summaries_tool`) for straightforward stat requests.",
@@ -151,109 +158,69 @@ def _system_prompt() -> str:
         "- When a requested season is missing from the cache, describe the fallback path instead of repeating the same failing lookup.",
         "Refer to the competition reference section below instead of firing extra lookups when it already covers the user's request.",
     ]
-    guidelines = "\n".join(guidelines_lines)
-    return (
-        "You are a football data analyst with live access to StatsBomb's Data API via "
-        "Agentspace tools. Use the provided tools to answer questions about competitions, "
-        "seasons, matches, player statistics, team aggregates, and events.\n\n"
-        f"Today's date: {today.strftime('%Y-%m-%d %H:%M %Z')} (current year {current_year}). "
-        f"When users mention 'this season' default to {season_label} unless context dictates otherwise. "
-        f"If a future season is referenced, consider {current_year}/{next_year} next.\n"
-        f"{api_versions}\n"
-        f"{retrieval_checklist}\n"
-        f"{tool_hierarchy}\n"
-        f"{guidelines}\n\n"
-        f"{competition_reference}"
-    )
-
-
-def _scouting_system_prompt() -> str:
-    today = datetime.now(timezone.utc).astimezone()
-    current_year = today.year
-    next_year = current_year + 1
-    season_label = _season_label_for_today(today.date())
-    competition_reference = "\n".join(
-        [
-            "Competition reference (hard-coded):",
-            "- Premier League — competition_id=2; season ids: 2025/26=318, 2024/25=317, 2023/24=281, 2022/23=235, 2021/22=108.",
-            "- La Liga — competition_id=11; use list_seasons_tool if a season id is missing.",
-            "- Bundesliga — competition_id=9.",
-            "- Serie A — competition_id=12; fallback season id 318.",
-            "- Ligue 1 — competition_id=7.",
-            "- Eredivisie — competition_id=6.",
-            "- Primeira Liga — competition_id=13.",
-            "- Jupiler Pro League — competition_id=46.",
-            "- MLS — competition_id=37.",
-            "- UEFA Champions League — competition_id=16.",
-            "- UEFA Europa League — competition_id=35.",
-            "- UEFA Europa Conference League — competition_id=353.",
-            "- FA Cup — competition_id=69.",
-            "- Copa del Rey — competition_id=87.",
-            "- Coppa Italia — competition_id=66.",
-            "- Coupe de France — competition_id=86.",
-            "- DFB Pokal — competition_id=165.",
-            "- Danish Superliga — competition_id=77.",
-            "- Allsvenskan — competition_id=75.",
-            "- J1 League — competition_id=108.",
-            "- 2. Bundesliga — competition_id=10.",
-            "- Serie B — competition_id=1281.",
-        ]
-    )
-    modules = "\n".join(
-        [
-            "Mental profiling — evaluate mindset, resilience, decision focus.",
-            "Team profiling — map the player's fit within team styles, emotional and tactical archetypes.",
-            "Zones of Impact — chart where and how the player drives ball progression or control.",
-            "Gravity-Angle analysis — assess how body orientation, angles, and gravity manipulation create advantages.",
-            "Compact-speed analysis — judge tempo control, quickness of execution, and ability to operate in tight spaces.",
-            "Dead-motion analysis — study athleticism in set-piece or stationary-to-explosive scenarios.",
-        ]
-    )
-    profiling = (
-        "Player profiling must consider Action range (what the player attempts and where), "
-        "Athletic range (physical toolkit enabling those actions), and Execution range (quality, intensity, efficiency)."
-    )
-    outputs = "\n".join(
-        [
-            "- Provide comparisons (past or current players) grounded in role, traits, or data.",
-            "- Suggest tactical deployment ideas, including combinations with current squad members.",
-            "- Highlight risks, developmental needs, and squad-building implications.",
-            "- Reference team context from metadata when available to ground recommendations.",
-            "- Default to Markdown with section emojis (e.g., 🎯, 🧠, ⚙️)."
-        ]
-    )
-    retrieval_checklist = "\n".join(
-        [
-            "Retrieval checklist (follow strictly before synthesising scouting insight):",
-            "1. Scan conversation memory for previously resolved IDs (competitions, seasons, matches, players) and reuse them whenever they match the new brief.",
-            "2. Run the offline SQLite index helpers (`search_competitions_tool`, `search_teams_tool`, `search_players_tool`, `search_matches_tool`, `search_match_players_tool`) with specific filters to fetch missing IDs.",
-            "3. With IDs in hand, prefer aggregate StatsBomb helpers (`player_season_summary_tool`, `team_season_summary_tool`, `player_multi_season_summary_tool`, `compare_player_season_summaries_tool`) to build the scouting baseline.",
-            "4. For any shortlist or 'best option' brief, call the season ranking coverage helpers (`list_ranking_coverage_tool`, `list_ranking_metrics_tool`) and then `rank_players_by_metric_tool` / `player_percentile_snapshot_tool` before escalating to heavier event datasets.",
-            "5. Escalate only if coverage is missing, honouring this sequence: StatsBomb JSON index → StatsBomb online index helpers → StatsBomb network APIs → Wyscout → web search.",
-            "6. Cache the identifiers you discover so subsequent turns can skip redundant lookups.",
-        ]
-    )
+)
+
+_SCOUTING_MODULES = "\n".join(
+    [
+        "Mental profiling — evaluate mindset, resilience, decision focus.",
+        "Team profiling — map the player's fit within team styles, emotional and tactical archetypes.",
+        "Zones of Impact — chart where and how the player drives ball progression or control.",
+        "Gravity-Angle analysis — assess how body orientation, angles, and gravity manipulation create advantages.",
+        "Compact-speed analysis — judge tempo control, quickness of execution, and ability to operate in tight spaces.",
+        "Dead-motion analysis — study athleticism in set-piece or stationary-to-explosive scenarios.",
+    ]
+)
+
+_PLAYER_PROFILING = (
+    "Player profiling must consider Action range (what the player attempts and where), "
+    "Athletic range (physical toolkit enabling those actions), and Execution range (quality, intensity, efficiency)."
+)
+
+_SCOUTING_OUTPUTS = "\n".join(
+    [
+        "- Provide comparisons (past or current players) grounded in role, traits, or data.",
+        "- Suggest tactical deployment ideas, including combinations with current squad members.",
+        "- Highlight risks, developmental needs, and squad-building implications.",
+        "- Reference team context from metadata when available to ground recommendations.",
+        "- Default to Markdown with section emojis (e.g., 🎯, 🧠, ⚙️)."
+    ]
+)
+
+_SCOUTING_RETRIEVAL_CHECKLIST = "\n".join(
+    [
+        "Retrieval checklist (follow strictly before synthesising scouting insight):",
+        "1. Scan conversation memory for previously resolved IDs (competitions, seasons, matches, players) and reuse them whenever they match the new brief.",
+        "2. Run the offline SQLite index helpers (`search_competitions_tool`, `search_teams_tool`, `search_players_tool`, `search_matches_tool`, `search_match_players_tool`) with specific filters to fetch missing IDs.",
+        "3. With IDs in hand, prefer aggregate StatsBomb helpers (`player_season_summary_tool`, `team_season_summary_tool`, `player_multi_season_summary_tool`, `compare_player_season_summaries_tool`) to build the scouting baseline.",
+        "4. For any shortlist or 'best option' brief, call the season ranking coverage helpers (`list_ranking_coverage_tool`, `list_ranking_metrics_tool`) and then `rank_players_by_metric_tool` / `player_percentile_snapshot_tool` before escalating to heavier event datasets.",
+        "5. Escalate only if coverage is missing, honouring this sequence: StatsBomb JSON index → StatsBomb online index helpers → StatsBomb network APIs → Wyscout → web search.",
+        "6. Cache the identifiers you discover so subsequent turns can skip redundant lookups.",
+    ]
+)
+
+_SCOUTING_TOOL_HIERARCHY = "\n".join(
+    [
+        "Tool selection hierarchy:",
+        "1. Shortlists / best-fit / ranking briefs → `list_ranking_coverage_tool` → `list_ranking_metrics_tool` → `rank_players_by_metric_tool` or `player_percentile_snapshot_tool` (reuse returned metric names).",
+        "2. ID resolution for competitions/teams/players → offline index (`search_competitions_tool`, `search_teams_tool`, `search_players_tool`, `search_matches_tool`, `search_match_players_tool`).",
+        "3. Baseline scouting summaries → StatsBomb aggregates (`player_season_summary_tool`, `team_season_summary_tool`, `player_multi_season_summary_tool`, `compare_player_season_summaries_tool`).",
+        "4. If aggregates lack data → StatsBomb JSON index, then StatsBomb online index helpers, then network StatsBomb APIs.",
+        "5. Remaining gaps → Wyscout, then web search as a last resort (always explain remaining questions).",
+        "6. Visual or tactical diagrams → StatsBomb viz / advanced viz once IDs and metrics are locked.",
+    ]
+)
 
-    tool_hierarchy = "\n".join(
-        [
-            "Tool selection hierarchy:",
-            "1. Shortlists / best-fit / ranking briefs → `list_ranking_coverage_tool` → `list_ranking_metrics_tool` → `rank_players_by_metric_tool` or `player_percentile_snapshot_tool` (reuse returned metric names).",
-            "2. ID resolution for competitions/teams/players → offline index (`search_competitions_tool`, `search_teams_tool`, `search_players_tool`, `search_matches_tool`, `search_match_players_tool`).",
-            "3. Baseline scouting summaries → StatsBomb aggregates (`player_season_summary_tool`, `team_season_summary_tool`, `player_multi_season_summary_tool`, `compare_player_season_summaries_tool`).",
-            "4. If aggregates lack data → StatsBomb JSON index, then StatsBomb online index helpers, then network StatsBomb APIs.",
-            "5. Remaining gaps → Wyscout, then web search as a last resort (always explain remaining questions).",
-            "6. Visual or tactical diagrams → StatsBomb viz / advanced viz once IDs and metrics are locked.",
-        ]
-    )
-    expectations_lines = [
+_SCOUTING_EXPECTATIONS_TEMPLATE = "\n".join(
+    [
         "- Before any deeper analysis, always start with the offline SQLite index. For player, team, or match work, apply the relevant combination of `search_competitions_tool`, `search_teams_tool`, `search_players_tool`, and `search_matches_tool`/`search_match_players_tool` to obtain IDs before touching other tool families.",
+        _DISCOVER_TOOLS_HINT,
         "- Minimise tool calls: review existing context and combine StatsBomb queries so you extract what you need in one pass.",
         "- Use cached or aggregate helpers before drilling into per-match detail; avoid re-fetching the same dataset with identical arguments.",
         "- Season ranking tools (group 'season-rankings') are the default path to cached leaderboards and percentiles—consult the coverage/metric tools before ranking to ensure the cache covers the brief, then surface rankings or snapshots before building new datasets.",
         "- When ranking, rely on metric names returned by `list_ranking_metrics_tool`; aliases such as 'shots on target', 'progressive passes', or 'pressures' map automatically.",
         "- Lean on the offline SQLite index (group 'offline-index') for top league and continental cup rosters before issuing new API calls.",
         "- Gather evidence via StatsBomb tools first. If the offline sequence misses coverage, fall back to StatsBomb JSON indices, then StatsBomb online helpers, then network StatsBomb APIs before considering Wyscout or web search.",
-        f"- When you need match identifiers, call `list_team_matches` with `season_name` set to {season_label} (or the user's specified season) and `match_status=['played']` unless they explicitly want future fixtures.",
+        "- When you need match identifiers, call `list_team_matches` with `season_name` set to {season_label} (or the user's specified season) and `match_status=['played']` unless they explicitly want future fixtures.",
         "- Never reach for web search until StatsBomb online/offline (including player mapping) options are exhausted and you've explained the gap.",
         "- Translate metrics into the six scouting modules, then synthesise into club-specific insights.",
         "- Evaluate the scouting club's current roster (from metadata) to judge fit, role competition, and tactical combinations.",
@@ -264,26 +231,103 @@ def _scouting_system_prompt() -> str:
         "- Always explain reasoning when data is sparse, and propose follow-up scouting actions when confidence is low.",
         "Refer to the competition reference section below instead of firing extra lookups when it already answers the question.",
     ]
-    expectations = "\n".join(expectations_lines)
+)
+
+
+@lru_cache(maxsize=1)
+def _minute_context(minute: datetime) -> tuple[str, int, str]:
+    today = minute.astimezone()
+    return today.strftime("%Y-%m-%d %H:%M %Z"), today.year, _season_label_for_today(today.date())
+
+
+def _prompt_clock() -> tuple[str, int, str]:
+    """
+    Return ``(formatted local time, current year, season label)``, cached per minute.
+    """
+    now = datetime.now(timezone.utc)
+    return _minute_context(now.replace(second=0, microsecond=0))
+
+
+@lru_cache(maxsize=4)
+def _chat_prompt_sections(season_label: str) -> str:
+    guidelines = _CHAT_GUIDELINES_TEMPLATE.format(season_label=season_label)
+    return (
+        f"{_API_VERSIONS}\n"
+        f"{_CHAT_RETRIEVAL_CHECKLIST}\n"
+        f"{_CHAT_TOOL_HIERARCHY}\n"
+        f"{guidelines}\n\n"
+        f"{_COMPETITION_REFERENCE}"
+    )
+
+
+@lru_cache(maxsize=4)
+def _scouting_prompt_sections(season_label: str) -> str:
+    expectations = _SCOUTING_EXPECTATIONS_TEMPLATE.format(season_label=season_label)
+    return (
+        "Scouting modules to cover:\n"
+        f"{_SCOUTING_MODULES}\n\n"
+        f"{_PLAYER_PROFILING}\n\n"
+        "Expectations:\n"
+        f"{_SCOUTING_RETRIEVAL_CHECKLIST}\n"
+        f"{_SCOUTING_TOOL_HIERARCHY}\n"
+        f"{expectations}\n"
+        f"{_SCOUTING_OUTPUTS}\n\n"
+        f"{_COMPETITION_REFERENCE}"
+    )
+
+
+def _system_prompt() -> str:
+    """
+    Build a dynamic system prompt that reflects current date context.
+    """
+    now_label, current_year, season_label = _prompt_clock()
+    next_year = current_year + 1
+    return (
+        "You are a football data analyst with live access to StatsBomb's Data API via "
+        "Agentspace tools. Use the provided tools to answer questions about competitions, "
+        "seasons, matches, player statistics, team aggregates, and events.\n\n"
+        f"Today's date: {now_label} (current year {current_year}). "
+        f"When users mention 'this season' default to {season_label} unless context dictates otherwise. "
+        f"If a future season is referenced, consider {current_year}/{next_year} next.\n"
+        f"{_chat_prompt_sections(season_label)}"
+    )
+
+
+def _scouting_system_prompt() -> str:
+    now_label, current_year, season_label = _prompt_clock()
+    next_year = current_year + 1
     return (
         "You are an elite scouting strategist blending quantitative analysis with nuanced "
         "observational frameworks. Assess players comprehensively while referencing the "
         "recruiting team's current context.\n\n"
-        f"Today's date: {today.strftime('%Y-%m-%d %H:%M %Z')} (current year {current_year}). "
+        f"Today's date: {now_label} (current year {current_year}). "
         f"Use {season_label} as the active season by default; if discussions point to future projections, "
         f"consider {current_year}/{next_year}.\n\n"
-        "Scouting modules to cover:\n"
-        f"{modules}\n\n"
-        f"{profiling}\n\n"
-        "Expectations:\n"
-        f"{retrieval_checklist}\n"
-        f"{tool_hierarchy}\n"
-        f"{expectations}\n"
-        f"{outputs}\n\n"
-        f"{competition_reference}"
+        f"{_scouting_prompt_sections(season_label)}"
     )
 
 
+_VALID_PROVIDERS = frozenset({"anthropic", "openai"})
+_ANTHROPIC_MODEL_RE = re.compile(r"claude|opus|sonnet")
+# Friendly model aliases, keyed lower-case.
+_MODEL_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        "sonnet": "claude-sonnet-4-20250514",
+        "sonnet-4": "claude-sonnet-4-20250514",
+        "sonnet4": "claude-sonnet-4-20250514",
+        "claude-sonnet-4": "claude-sonnet-4-20250514",
+        "claude-sonnet-4-2025": "claude-sonnet-4-20250514",
+        "sonnet-4.5": "claude-3-5-sonnet-20241022",
+        "sonnet4.5": "claude-3-5-sonnet-20241022",
+        "claude-3.5-sonnet-4.5": "claude-3-5-sonnet-20241022",
+        "claude-3-5-sonnet-4-5": "claude-3-5-sonnet-20241022",
+        "sonnet-3.5": "claude-3-5-sonnet-20241022",
+        "sonnet3.5": "claude-3-5-sonnet-20241022",
+        "opus": "claude-3-opus-20240229",
+    }
+)
+
+
 def _resolve_provider_and_model(
     *,
     model: str | None,
@@ -300,7 +344,7 @@ def _resolve_provider_and_model(
 
     # If model explicitly looks like a Claude family model or mentions opus/sonnet, pick Anthropic.
     m_lower = candidate_model.lower()
-    if any(k in m_lower for k in ("claude", "opus", "sonnet")):
+    if _ANTHROPIC_MODEL_RE.search(m_lower):
         env_provider = env_provider or "anthropic"
 
     # If provider still unspecified, infer from API keys present.
@@ -310,7 +354,7 @@ def _resolve_provider_and_model(
         else:
             env_provider = "openai"
 
-    if env_provider not in {"anthropic", "openai"}:
+    if env_provider not in _VALID_PROVIDERS:
         raise ValueError(f"Unsupported LLM provider '{env_provider}'. Use 'anthropic' or 'openai'.")
 
     if not candidate_model:
@@ -328,21 +372,7 @@ def _resolve_provider_and_model(
             candidate_model = os.getenv("OPENAI_MODEL", "gpt-4o")
 
     # Map friendly aliases
-    alias_map = {
-        "sonnet": "claude-sonnet-4-20250514",
-        "sonnet-4": "claude-sonnet-4-20250514",
-        "sonnet4": "claude-sonnet-4-20250514",
-        "claude-sonnet-4": "claude-sonnet-4-20250514",
-        "claude-sonnet-4-2025": "claude-sonnet-4-20250514",
-        "sonnet-4.5": "claude-3-5-sonnet-20241022",
-        "sonnet4.5": "claude-3-5-sonnet-20241022",
-        "claude-3.5-sonnet-4.5": "claude-3-5-sonnet-20241022",
-        "claude-3-5-sonnet-4-5": "claude-3-5-sonnet-20241022",
-        "sonnet-3.5": "claude-3-5-sonnet-20241022",
-        "sonnet3.5": "claude-3-5-sonnet-20241022",
-        "opus": "claude-3-opus-20240229",
-    }
-    candidate_model = alias_map.get(candidate_model.lower(), candidate_model)
+    candidate_model = _MODEL_ALIASES.get(candidate_model.lower(), candidate_model)
 
     return env_provider, candidate_model
 
@@ -356,6 +386,31 @@ def _ensure_credentials() -> None:
         raise RuntimeError("STATSBOMB_PASSWORD environment variable is required.")
 
 
+# Process-wide record of the one-off environment setup shared by the agent builders.
+_ENV_STATE: dict[str, str | bool | None] = {"loaded_path": None, "creds_checked": False}
+_ENV_LOCK = threading.Lock()
+
+
+def _prepare_environment(env_path: Path) -> None:
+    """
+    Load ``env_path`` and verify credentials once per process.
+    """
+    path_key = str(env_path)
+    if _ENV_STATE["loaded_path"] == path_key and _ENV_STATE["creds_checked"]:
+        return
+    with _ENV_LOCK:
+        if _ENV_STATE["loaded_path"] != path_key:
+            _load_env_from_file(env_path)
+            _ENV_STATE["loaded_path"] = path_key
+        if not _ENV_STATE["creds_checked"]:
+            _ensure_credentials()
+            _ENV_STATE["creds_checked"] = True
+
+
+def _first_non_empty(*values: str | None) -> str | None:
+    return next((stripped for value in values if value and (stripped := value.strip())), None)
+
+
 def _resolve_backend_urls(
     *,
     studio_url: str | None = None,
@@ -365,35 +420,22 @@ def _resolve_backend_urls(
     Resolve AgentScope Studio and tracing endpoints from explicit args or env.
     """
 
-    def _first_non_empty(values: Sequence[str | None]) -> str | None:
-        for value in values:
-            if not value:
-                continue
-            stripped = value.strip()
-            if stripped:
-                return stripped
-        return None
-
     resolved_studio = _first_non_empty(
-        [studio_url, os.getenv("AGENTSPACE_STUDIO_URL"), os.getenv("AGENTSCOPE_STUDIO_URL")]
+        studio_url, os.getenv("AGENTSPACE_STUDIO_URL"), os.getenv("AGENTSCOPE_STUDIO_URL")
     )
     resolved_tracing = _first_non_empty(
-        [tracing_url, os.getenv("AGENTSPACE_TRACING_URL"), os.getenv("AGENTSCOPE_TRACING_URL")]
+        tracing_url, os.getenv("AGENTSPACE_TRACING_URL"), os.getenv("AGENTSCOPE_TRACING_URL")
     )
     return resolved_studio, resolved_tracing
 
 
-def _build_toolkit(
+def _init_session_with_fallback(
     project: str | None,
     activate_tool_group: bool,
     *,
-    studio_url: str | None = None,
-    tracing_url: str | None = None,
+    resolved_studio: str | None,
+    resolved_tracing: str | None,
 ) -> Toolkit:
-    resolved_studio, resolved_tracing = _resolve_backend_urls(
-        studio_url=studio_url,
-        tracing_url=tracing_url,
-    )
     try:
         toolkit = init_session_with_statsbomb_tools(
             project=project,
@@ -402,7 +444,7 @@ def _build_toolkit(
             activate=activate_tool_group,
         )
     except RequestException as exc:
-        logging.warning(
+        LOGGER.warning(
             "AgentScope Studio unavailable at %s (%s); proceeding without Studio/Tracing hooks.",
             resolved_studio,
             exc,
@@ -421,18 +463,96 @@ def _build_toolkit(
             tracing_url=fallback_tracing,
             activate=activate_tool_group,
         )
-    register_statsbomb_online_index_tools(toolkit, group_name="statsbomb-online-index", activate=True)
-    register_offline_index_tools(toolkit, group_name="offline-index", activate=True)
-    register_statsbomb_index_tools(toolkit, group_name="statsbomb-index", activate=True)
-    register_wyscout_tools(toolkit, group_name="wyscout", activate=True)
-    register_statsbomb_viz_tools(toolkit, group_name="statsbomb-viz", activate=True)
-    register_advanced_viz_tools(toolkit, group_name="advanced-viz", activate=True)
-    register_ranking_tools(toolkit, group_name="season-rankings", activate=True)
-    register_event_analysis_tools(toolkit, group_name="event-analysis", activate=True)
-    register_web_search_tools(toolkit, group_name="web", activate=True)
     return toolkit
 
 
+def _build_toolkit(
+    project: str | None,
+    activate_tool_group: bool,
+    *,
+    studio_url: str | None = None,
+    tracing_url: str | None = None,
+) -> Toolkit:
+    resolved_studio, resolved_tracing = _resolve_backend_urls(
+        studio_url=studio_url,
+        tracing_url=tracing_url,
+    )
+    if resolved_studio is None and resolved_tracing is None:
+        # Nothing to connect to, so there is no Studio failure to recover from.
+        toolkit = init_session_with_statsbomb_tools(
+            project=project,
+            studio_url=None,
+            tracing_url=None,
+            activate=activate_tool_group,
+        )
+    else:
+        toolkit = _init_session_with_fallback(
+            project,
+            activate_tool_group,
+            resolved_studio=resolved_studio,
+            resolved_tracing=resolved_tracing,
+        )
+    core_groups = (
+        ("offline-index", register_offline_index_tools),
+        ("statsbomb-index", register_statsbomb_index_tools),
+        ("season-rankings", register_ranking_tools),
+    )
+    for group_name, register in core_groups:
+        # A reused toolkit already carries its groups; registering again is wasted work.
+        if group_name not in toolkit.groups:
+            register(toolkit, group_name=group_name, activate=True)
+    if "discover_tools_tool" not in toolkit.tools:
+        _register_tool_discovery(toolkit)
+    return toolkit
+
+
+def _load_tool_group(toolkit: Toolkit, group_name: str) -> list[str]:
+    """
+    Import and register one of the on-demand tool groups, returning its tool names.
+    """
+    if group_name in toolkit.groups:
+        toolkit.update_tool_groups([group_name], active=True)
+    else:
+        module_name, attr_name = _LAZY_TOOL_GROUPS[group_name]
+        module = __import__(module_name, fromlist=[attr_name])
+        getattr(module, attr_name)(toolkit, group_name=group_name, activate=True)
+    return [name for name, tool in toolkit.tools.items() if tool.group == group_name]
+
+
+def _register_tool_discovery(toolkit: Toolkit) -> None:
+    def discover_tools_tool(group_name: str) -> ToolResponse:
+        """
+        Load an on-demand tool group so its tools become callable.
+
+        Args:
+            group_name (`str`):
+                Name of the tool group to load.
+        """
+
+        if group_name not in _LAZY_TOOL_GROUPS:
+            available = ", ".join(_LAZY_TOOL_GROUPS)
+            return ToolResponse(
+                content=[TextBlock(type="text", text=f"Unknown tool group '{group_name}'. Available: {available}.")],
+                metadata={"group_name": group_name, "tools": []},
+            )
+        tools = _load_tool_group(toolkit, group_name)
+        lines = [
+            f"Tool group '{group_name}' is ready ({len(tools)} tool(s)).",
+            f"Tools: {', '.join(tools) or 'None'}",
+        ]
+        return ToolResponse(
+            content=[TextBlock(type="text", text="\n".join(lines))],
+            metadata={"group_name": group_name, "tools": tools},
+        )
+
+    toolkit.register_tool_function(
+        discover_tools_tool,
+        func_description=(
+            "Load an on-demand tool group (" + ", ".join(_LAZY_TOOL_GROUPS) + ") and list its tools."
+        ),
+    )
+
+
 def _build_model_formatter(
     *,
     model: str | None,
@@ -467,9 +587,7 @@ def build_chat_agent(
     if openai_api_key:
         os.environ.setdefault("OPENAI_API_KEY", openai_api_key)
 
-    repo_root = Path(__file__).resolve().parents[2]
-    _load_env_from_file(repo_root / ".env")
-    _ensure_credentials()
+    _prepare_environment(Path(__file__).resolve().parents[2] / ".env")
 
     toolkit = _build_toolkit(
         project,
@@ -507,9 +625,7 @@ def build_scouting_agent(
     if openai_api_key:
         os.environ.setdefault("OPENAI_API_KEY", openai_api_key)
 
-    repo_root = Path(__file__).resolve().parents[2]
-    _load_env_from_file(repo_root / ".env")
-    _ensure_credentials()
+    _prepare_environment(Path(__file__).resolve().parents[2] / ".env")
 
     toolkit = _build_toolkit(
         project,
@@ -532,7 +648,158 @@ def build_scouting_agent(
     )
 
 
-def chat(
+async def _run_dialog(agent: ReActAgent, messages: Sequence[str]) -> list[str]:
+    # Turns share the agent's memory, so they run in order rather than concurrently.
+    outputs: list[str] = []
+    for user_text in messages:
+        user_msg = Msg(
+            name="user",
+            role="user",
+            content=user_text,
+        )
+        try:
+            reply_msg = await agent.reply(user_msg)
+            outputs.append(reply_msg.get_text_content() or "")
+        except Exception as exc:  # pylint: disable=broad-except
+            outputs.append(f"Agent execution error: {exc}")
+            break
+    return outputs
+
+
+_DIALOG_LOOP: asyncio.AbstractEventLoop | None = None
+_DIALOG_LOOP_LOCK = threading.Lock()
+
+
+def _dialog_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the background event loop used by ``chat``, starting it on first use.
+    """
+    global _DIALOG_LOOP
+    with _DIALOG_LOOP_LOCK:
+        if _DIALOG_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="statsbomb-chat-loop", daemon=True).start()
+            _DIALOG_LOOP = loop
+    return _DIALOG_LOOP
+
+
+# Agents reused by ``chat``/``achat``, keyed on their build arguments and the
+# event loop they run on: each model keeps an async HTTP connection pool that is
+# only valid on the loop it was first used from. Each entry carries a lock so an
+# agent is never shared by two dialogues at once; the least recently used
+# entries are dropped beyond ``_CHAT_AGENTS_SIZE``.
+_CHAT_AGENTS: "OrderedDict[tuple, tuple[ReActAgent, threading.Lock]]" = OrderedDict()
+_CHAT_AGENTS_SIZE = 8
+_CHAT_AGENTS_LOCK = threading.Lock()
+
+
+def invalidate_chat_agent_cache() -> None:
+    """
+    Drop the agents reused by ``chat``/``achat`` so the next call builds fresh ones.
+    """
+    with _CHAT_AGENTS_LOCK:
+        _CHAT_AGENTS.clear()
+
+
+def _checkout_chat_agent(
+    loop: asyncio.AbstractEventLoop,
+    *,
+    project: str | None,
+    model: str | None,
+    provider: str | None,
+    openai_api_key: str | None,
+    studio_url: str | None,
+    tracing_url: str | None,
+) -> tuple[ReActAgent, threading.Lock]:
+    """
+    Return a chat agent and its held lock, reusing an idle cached agent when possible.
+    """
+    # Key on a digest so agents built for different API keys are never mixed up
+    # without keeping the raw credential in the cache key.
+    key_digest = hashlib.sha256(openai_api_key.encode("utf-8")).hexdigest() if openai_api_key else None
+    key = (loop, project, model, provider, key_digest, studio_url, tracing_url)
+    with _CHAT_AGENTS_LOCK:
+        for stale in [cached for cached in _CHAT_AGENTS if cached[0].is_closed()]:
+            del _CHAT_AGENTS[stale]
+        entry = _CHAT_AGENTS.get(key)
+        if entry is not None and entry[1].acquire(blocking=False):
+            _CHAT_AGENTS.move_to_end(key)
+            return entry
+    agent = build_chat_agent(
+        project=project,
+        model=model,
+        provider=provider,
+        openai_api_key=openai_api_key,
+        studio_url=studio_url,
+        tracing_url=tracing_url,
+    )
+    lock = threading.Lock()
+    lock.acquire()
+    with _CHAT_AGENTS_LOCK:
+        _CHAT_AGENTS.setdefault(key, (agent, lock))
+        while len(_CHAT_AGENTS) > _CHAT_AGENTS_SIZE:
+            _CHAT_AGENTS.popitem(last=False)
+    return agent, lock
+
+
+def _release_abandoned_checkout(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result()[1].release()
+
+
+async def _acheckout_chat_agent(**build_kwargs: str | None) -> tuple[ReActAgent, threading.Lock]:
+    """
+    Check out a chat agent for the running loop without blocking it.
+
+    Building an agent is blocking I/O, so it runs in a worker thread; concurrent
+    ``chat_batch`` prompts then overlap their builds too.
+    """
+    loop = asyncio.get_running_loop()
+    checkout = asyncio.ensure_future(asyncio.to_thread(_checkout_chat_agent, loop, **build_kwargs))
+    try:
+        return await asyncio.shield(checkout)
+    except asyncio.CancelledError:
+        # The worker thread still finishes the checkout; hand the agent back.
+        checkout.add_done_callback(_release_abandoned_checkout)
+        raise
+
+
+async def _reset_agent(agent: ReActAgent) -> None:
+    # Start every dialogue from a clean conversation.
+    await agent.memory.clear()
+    if agent.plan_notebook is not None:
+        agent.plan_notebook.current_plan = None
+
+
+async def _run_checked_out_dialog(agent: ReActAgent, lock: threading.Lock, messages: Sequence[str]) -> list[str]:
+    try:
+        await _reset_agent(agent)
+        return await _run_dialog(agent, messages)
+    finally:
+        lock.release()
+
+
+async def _stream_turn(agent: ReActAgent, user_text: str) -> AsyncIterator[str]:
+    """Yield the text the agent adds to its assistant messages while replying to one turn."""
+
+    user_msg = Msg(name="user", role="user", content=user_text)
+    streamed: dict[str, str] = {}
+    async for msg, _ in stream_printing_messages(agents=[agent], coroutine_task=agent.reply(user_msg)):
+        if msg.role != "assistant":
+            continue
+        text = msg.get_text_content() or ""
+        previous = streamed.get(msg.id)
+        if previous is None and text and any(streamed.values()):
+            yield "\n"
+        previous = previous or ""
+        # Streaming chunks carry the accumulated text of the message so far.
+        delta = text[len(previous) :] if text.startswith(previous) else text
+        streamed[msg.id] = text
+        if delta:
+            yield delta
+
+
+async def achat(
     messages: Sequence[str],
     *,
     project: str | None = "statsbomb-chat",
@@ -542,9 +809,9 @@ def chat(
     studio_url: str | None = None,
     tracing_url: str | None = None,
 ) -> list[str]:
-    """Convenience function to run a short scripted dialogue."""
+    """Async variant of ``chat`` for callers that already run an event loop."""
 
-    agent = build_chat_agent(
+    agent, lock = await _acheckout_chat_agent(
         project=project,
         model=model,
         provider=provider,
@@ -552,29 +819,167 @@ def chat(
         studio_url=studio_url,
         tracing_url=tracing_url,
     )
+    return await _run_checked_out_dialog(agent, lock, messages)
+
 
-    async def _run_dialog() -> list[str]:
-        outputs: list[str] = []
-        for turn, user_text in enumerate(messages, start=1):
-            user_msg = Msg(
-                name="user",
-                role="user",
-                content=user_text,
+async def chat_batch(
+    prompts: Sequence[str],
+    *,
+    max_concurrent: int = 4,
+    project: str | None = "statsbomb-chat",
+    model: str | None = None,
+    provider: str | None = None,
+    openai_api_key: str | None = None,
+    studio_url: str | None = None,
+    tracing_url: str | None = None,
+) -> list[str | BaseException]:
+    """
+    Answer independent single-turn prompts concurrently, one agent per in-flight prompt.
+
+    At most ``max_concurrent`` prompts run at once. Results keep the order of
+    ``prompts``; an error raised outside the agent's reply (for example while
+    building the agent) is returned in place of that prompt's reply.
+    """
+
+    if max_concurrent <= 0:
+        raise ValueError("max_concurrent must be greater than zero.")
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _answer(prompt: str) -> str:
+        async with semaphore:
+            replies = await achat(
+                [prompt],
+                project=project,
+                model=model,
+                provider=provider,
+                openai_api_key=openai_api_key,
+                studio_url=studio_url,
+                tracing_url=tracing_url,
             )
-            try:
-                reply_msg = await agent.reply(user_msg)
-                outputs.append(reply_msg.get_text_content() or "")
-            except Exception as exc:  # pylint: disable=broad-except
-                outputs.append(f"Agent execution error: {exc}")
-                break
-        return outputs
+        return replies[-1]
+
+    return await asyncio.gather(*(_answer(prompt) for prompt in prompts), return_exceptions=True)
+
+
+class ChatStream:
+    """
+    Async iterator over the reply text of a streamed dialogue.
+
+    The agent is checked out on the first iteration and returned to the cache
+    when the stream is exhausted or closed. Use it as an async context manager
+    so that breaking out of the loop early releases the agent straight away.
+    """
+
+    def __init__(self, messages: Sequence[str], **build_kwargs: str | None) -> None:
+        self._messages = messages
+        self._build_kwargs = build_kwargs
+        self._chunks: AsyncIterator[str] | None = None
+
+    def __aiter__(self) -> "ChatStream":
+        return self
+
+    async def __anext__(self) -> str:
+        if self._chunks is None:
+            self._chunks = self._generate()
+        return await self._chunks.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop the dialogue and release its agent."""
+        if self._chunks is not None:
+            await self._chunks.aclose()
+
+    async def __aenter__(self) -> "ChatStream":
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.aclose()
+
+    async def _generate(self) -> AsyncIterator[str]:
+        agent, lock = await _acheckout_chat_agent(**self._build_kwargs)
+        try:
+            await _reset_agent(agent)
+            # The caller renders the chunks, so the agent's own console echo is muted.
+            agent.set_console_output_enabled(False)
+            for turn, user_text in enumerate(self._messages):
+                if turn:
+                    yield "\n\n"
+                try:
+                    async for chunk in _stream_turn(agent, user_text):
+                        yield chunk
+                except Exception as exc:  # pylint: disable=broad-except
+                    yield f"Agent execution error: {exc}"
+                    break
+        finally:
+            agent.set_console_output_enabled(True)
+            agent.set_msg_queue_enabled(False)
+            lock.release()
+
+
+def chat_stream(
+    messages: Sequence[str],
+    *,
+    project: str | None = "statsbomb-chat",
+    model: str | None = None,
+    provider: str | None = None,
+    openai_api_key: str | None = None,
+    studio_url: str | None = None,
+    tracing_url: str | None = None,
+) -> ChatStream:
+    """
+    Streaming variant of ``achat`` that yields reply text as the model produces it.
 
-    return asyncio.run(_run_dialog())
+    Turns are separated by a blank line; an error ends the dialogue with an
+    ``Agent execution error`` chunk, mirroring ``chat``. Iterate the result
+    inside ``async with`` (or call ``aclose()``) when the loop may stop early.
+    """
+
+    return ChatStream(
+        messages,
+        project=project,
+        model=model,
+        provider=provider,
+        openai_api_key=openai_api_key,
+        studio_url=studio_url,
+        tracing_url=tracing_url,
+    )
+
+
+def chat(
+    messages: Sequence[str],
+    *,
+    project: str | None = "statsbomb-chat",
+    model: str | None = None,
+    provider: str | None = None,
+    openai_api_key: str | None = None,
+    studio_url: str | None = None,
+    tracing_url: str | None = None,
+) -> list[str]:
+    """Convenience function to run a short scripted dialogue."""
+
+    loop = _dialog_loop()
+    agent, lock = _checkout_chat_agent(
+        loop,
+        project=project,
+        model=model,
+        provider=provider,
+        openai_api_key=openai_api_key,
+        studio_url=studio_url,
+        tracing_url=tracing_url,
+    )
+    # Reuse one long-lived loop instead of creating and tearing one down per call.
+    dialog = _run_checked_out_dialog(agent, lock, messages)
+    return asyncio.run_coroutine_threadsafe(dialog, loop).result()
 
 
 if __name__ == "__main__":  # pragma: no cover - manual smoke test
     import sys
 
     prompt = sys.argv[1] if len(sys.argv) > 1 else "List Arsenal matches vs Everton last season"
-    answer = chat([prompt])[-1]
-    print(answer)
+
+    async def _print_stream() -> None:
+        async with chat_stream([prompt]) as stream:
+            async for chunk in stream:
+                print(chunk, end="", flush=True)
+        print()
+
+    asyncio.run(_print_stream())
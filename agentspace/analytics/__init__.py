@@ -13,7 +13,9 @@ from .mplsoccer_viz import (
     ShotMapResult,
     HeatmapResult,
     plot_pass_network,
+    plot_match_pack,
     PassNetworkResult,
+    PitchRenderer,
 )
 from .season_summary_store import (
     SeasonSummaryStore,
@@ -32,9 +34,11 @@ __all__ = [
     "plot_match_shot_map",
     "plot_event_heatmap",
     "plot_pass_network",
+    "plot_match_pack",
     "ShotMapResult",
     "HeatmapResult",
     "PassNetworkResult",
+    "PitchRenderer",
     "SeasonSummaryStore",
     "ingest_from_config",
     "load_season_tracking_config",
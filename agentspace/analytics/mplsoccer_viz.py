@@ -3,8 +3,13 @@ Visualization helpers using the mplsoccer toolkit.
 """
 from __future__ import annotations
 
+import asyncio
+import io
+import logging
 import os
-from dataclasses import dataclass
+import re
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, Optional, Sequence, Tuple, Union
 
@@ -14,6 +19,8 @@ import pandas as pd
 from .statsbomb_processors import events_to_dataframe
 from ..services.statsbomb_tools import MatchDataset, MatchDescriptor
 
+LOGGER = logging.getLogger(__name__)
+
 StatsFrame = Union[pd.DataFrame, MatchDataset]
 
 
@@ -31,6 +38,7 @@ class ShotMapResult:
     total_goals: int
     opponent_shots: int
     opponent_goals: int
+    png_bytes: Optional[bytes] = field(default=None, repr=False, compare=False)
 
 
 @dataclass(frozen=True)
@@ -44,6 +52,7 @@ class HeatmapResult:
     competition_id: Optional[int]
     season_id: Optional[int]
     sample_size: int
+    png_bytes: Optional[bytes] = field(default=None, repr=False, compare=False)
 
 
 @dataclass(frozen=True)
@@ -58,6 +67,7 @@ class PassNetworkResult:
     edge_count: int
     node_count: int
     total_passes: int
+    png_bytes: Optional[bytes] = field(default=None, repr=False, compare=False)
 
 
 def _load_mplsoccer():
@@ -76,10 +86,34 @@ def _load_mplsoccer():
     return Pitch, plt
 
 
+# pyplot keeps a process-wide figure registry; creating and closing figures is
+# serialised so renders can run on worker threads (see ``plot_match_pack``).
+_PYPLOT_LOCK = threading.Lock()
+
+# The normalised events frame is memoised on the dataset itself, so it lives
+# exactly as long as the dataset and needs no process-wide cache.
+_EVENTS_ATTR = "_prepared_events"
+
+
 def _ensure_dataframe(data: StatsFrame) -> Tuple[pd.DataFrame, Optional[MatchDataset]]:
+    """
+    Return a private, coordinate-normalised copy of the events and the source dataset.
+    """
+
     if isinstance(data, pd.DataFrame):
-        return data.copy(), None
-    return events_to_dataframe(data), data
+        # A shallow copy suffices: preparation swaps in new columns rather than
+        # writing into the caller's arrays.
+        return _prepare_events(data.copy(deep=False)), None
+
+    events_df = getattr(data, _EVENTS_ATTR, None)
+    if events_df is None:
+        events_df = _prepare_events(events_to_dataframe(data))
+        try:
+            # MatchDataset is frozen; bypass its __setattr__ as it does for ``header``.
+            object.__setattr__(data, _EVENTS_ATTR, events_df)
+        except (AttributeError, TypeError):
+            pass
+    return events_df.copy(), data
 
 
 def _ensure_output_dir(output_dir: Optional[Union[str, Path]]) -> Path:
@@ -92,57 +126,105 @@ def _ensure_output_dir(output_dir: Optional[Union[str, Path]]) -> Path:
     return output_dir
 
 
+# zlib level 0-9; 6 is Pillow's default, lower trades larger files for faster batch renders.
+_DEFAULT_PNG_COMPRESS_LEVEL = 6
+
+
+def _parse_compress_level(raw: Optional[str]) -> int:
+    """Parse a zlib level, clamped to 0-9; unparseable values fall back to 6."""
+
+    if raw is None or not raw.strip():
+        return _DEFAULT_PNG_COMPRESS_LEVEL
+    try:
+        level = int(raw)
+    except ValueError:
+        LOGGER.warning(
+            "Ignoring invalid AGENTSPACE_PNG_COMPRESS_LEVEL=%r; using %d",
+            raw,
+            _DEFAULT_PNG_COMPRESS_LEVEL,
+        )
+        return _DEFAULT_PNG_COMPRESS_LEVEL
+    clamped = min(max(level, 0), 9)
+    if clamped != level:
+        LOGGER.warning("Clamping AGENTSPACE_PNG_COMPRESS_LEVEL=%d to %d", level, clamped)
+    return clamped
+
+
+_PNG_COMPRESS_LEVEL = _parse_compress_level(os.getenv("AGENTSPACE_PNG_COMPRESS_LEVEL"))
+
+
+def _save_figure(fig, output_path: Path) -> bytes:
+    """Render ``fig`` to PNG once, write it to ``output_path`` and return the bytes."""
+
+    buffer = io.BytesIO()
+    fig.savefig(
+        buffer,
+        format="png",
+        dpi=180,
+        bbox_inches="tight",
+        facecolor=fig.get_facecolor(),
+        pil_kwargs={"compress_level": _PNG_COMPRESS_LEVEL, "optimize": False},
+    )
+    png_bytes = buffer.getvalue()
+    output_path.write_bytes(png_bytes)
+    return png_bytes
+
+
+# Low-cardinality label columns the plots filter on; as categoricals the
+# comparisons run on integer codes and case folding runs once per category.
+_LABEL_COLUMNS = ("team", "event_type", "shot_outcome", "pass_outcome")
+
+
+def _prepare_events(df: pd.DataFrame) -> pd.DataFrame:
+    df = _normalize_coordinates(df)
+    for column in _LABEL_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("category")
+    return df
+
+
+def _label_mask(labels: pd.Series, value: str) -> pd.Series:
+    """Case-insensitive match of a categorical label column against ``value``."""
+
+    wanted = value.lower()
+    return labels.isin([label for label in labels.cat.categories if str(label).lower() == wanted])
+
+
+_X_COLUMNS = ("location_x", "pass_end_x", "carry_end_x", "shot_end_x")
+_Y_COLUMNS = ("location_y", "pass_end_y", "carry_end_y", "shot_end_y")
+
+
 def _normalize_coordinates(df: pd.DataFrame) -> pd.DataFrame:
     """
     Scale positional columns to StatsBomb's 120x80 pitch if required.
     """
 
-    coords = df[
-        [
-            col
-            for col in (
-                "location_x",
-                "pass_end_x",
-                "carry_end_x",
-                "shot_end_x",
-            )
-            if col in df
-        ]
-    ].to_numpy(dtype=float, copy=True)
-    all_x = coords[~np.isnan(coords)]
-    scale_x = _estimate_scale(all_x, target=120.0)
-
-    coords_y = df[
-        [
-            col
-            for col in (
-                "location_y",
-                "pass_end_y",
-                "carry_end_y",
-                "shot_end_y",
-            )
-            if col in df
-        ]
-    ].to_numpy(dtype=float, copy=True)
-    all_y = coords_y[~np.isnan(coords_y)]
-    scale_y = _estimate_scale(all_y, target=80.0)
-
-    if scale_x != 1.0:
-        for column in ("location_x", "pass_end_x", "carry_end_x", "shot_end_x"):
-            if column in df:
-                df[column] = df[column].astype(float) * scale_x
-
-    if scale_y != 1.0:
-        for column in ("location_y", "pass_end_y", "carry_end_y", "shot_end_y"):
-            if column in df:
-                df[column] = df[column].astype(float) * scale_y
+    present = set(df.columns)
+    for columns, target in ((_X_COLUMNS, 120.0), (_Y_COLUMNS, 80.0)):
+        columns = [col for col in columns if col in present]
+        if not columns:
+            continue
+        # float32 is all matplotlib draws with and halves what the plots scan.
+        coords = df[columns].to_numpy(dtype=np.float32)
+        scale = _estimate_scale(_nan_max(coords), target=target)
+        if scale != 1.0:
+            coords = coords * np.float32(scale)
+        # Column-by-column assignment always replaces the column; a multi-column
+        # assignment may write into existing same-dtype arrays instead.
+        for index, column in enumerate(columns):
+            df[column] = coords[:, index]
     return df
 
 
-def _estimate_scale(values: np.ndarray, target: float) -> float:
+def _nan_max(values: np.ndarray) -> float:
+    """Largest non-NaN value, or NaN when there is none (without a RuntimeWarning)."""
+
     if values.size == 0:
-        return 1.0
-    max_val = np.nanmax(values)
+        return float("nan")
+    return float(np.fmax.reduce(values, axis=None))
+
+
+def _estimate_scale(max_val: float, target: float) -> float:
     if max_val == 0 or np.isnan(max_val):
         return 1.0
 
@@ -155,6 +237,46 @@ def _estimate_scale(values: np.ndarray, target: float) -> float:
     return 1.0
 
 
+_SHOT_MAP_PITCH = {
+    "pitch_type": "statsbomb",
+    "line_zorder": 2,
+    "pitch_color": "#f9f9f9",
+    "line_color": "#22313f",
+}
+
+
+class PitchRenderer:
+    """
+    Reusable shot-map pitch and figure for batch rendering.
+
+    Each render clears the axes and redraws the pitch instead of creating a
+    new matplotlib figure. Renders through one renderer are serialised; call
+    :meth:`close` when done.
+    """
+
+    def __init__(self, *, figsize: Tuple[float, float] = (10, 7)) -> None:
+        Pitch, self._plt = _load_mplsoccer()
+        self.pitch = Pitch(**_SHOT_MAP_PITCH)
+        with _PYPLOT_LOCK:
+            self.figure, self.ax = self.pitch.draw(figsize=figsize, constrained_layout=True)
+        self.figure.set_facecolor(_SHOT_MAP_PITCH["pitch_color"])
+        self.lock = threading.Lock()
+        self._dirty = False
+
+    def clear(self):
+        """Return the axes with a freshly drawn, empty pitch."""
+
+        if self._dirty:
+            self.ax.cla()
+            self.pitch.draw(ax=self.ax)
+        self._dirty = True
+        return self.ax
+
+    def close(self) -> None:
+        with _PYPLOT_LOCK:
+            self._plt.close(self.figure)
+
+
 def plot_match_shot_map(
     data: StatsFrame,
     *,
@@ -162,16 +284,19 @@ def plot_match_shot_map(
     include_opponent: bool = True,
     output_dir: Optional[Union[str, Path]] = None,
     filename: Optional[str] = None,
+    renderer: Optional[PitchRenderer] = None,
 ) -> ShotMapResult:
     """
     Render a shot map for a match using mplsoccer.
+
+    Pass a :class:`PitchRenderer` to draw onto its reused figure instead of
+    building (and closing) a new one, e.g. when rendering a whole season.
     """
 
     events_df, dataset = _ensure_dataframe(data)
     if events_df.empty:
         raise ValueError("No events available to plot.")
 
-    events_df = _normalize_coordinates(events_df)
     shots = events_df[events_df["event_type"] == "Shot"].copy()
     shots = shots.dropna(subset=["location_x", "location_y"])
     if shots.empty:
@@ -179,7 +304,7 @@ def plot_match_shot_map(
 
     descriptor = dataset.descriptor if dataset else None
     primary_mask = (
-        shots["team"].str.lower().eq(team_name.lower())
+        _label_mask(shots["team"], team_name)
         if team_name
         else pd.Series([True] * len(shots), index=shots.index)
     )
@@ -199,81 +324,97 @@ def plot_match_shot_map(
         "opponent": {"shot": "#d62728", "goal": "#ff7f0e"},
     }
 
-    Pitch, plt = _load_mplsoccer()
-    pitch = Pitch(
-        pitch_type="statsbomb",
-        line_zorder=2,
-        pitch_color="#f9f9f9",
-        line_color="#22313f",
-    )
-    fig, ax = pitch.draw(figsize=(10, 7), constrained_layout=True)
-    fig.set_facecolor("#f9f9f9")
-
-    def _scatter_shots(frame: pd.DataFrame, color_key: str, label_prefix: str) -> Tuple[int, int]:
-        if frame.empty:
-            return 0, 0
-        frame = frame.copy()
-        frame["is_goal"] = frame["shot_outcome"].str.lower() == "goal"
-        frame["marker_size"] = (frame["shot_xg"].fillna(0.05) * 900).clip(lower=80)
-
-        non_goal = frame[~frame["is_goal"]]
-        if not non_goal.empty:
-            pitch.scatter(
-                non_goal["location_x"],
-                non_goal["location_y"],
-                s=non_goal["marker_size"],
-                edgecolors="black",
-                linewidths=0.5,
-                alpha=0.75,
-                c=palette[color_key]["shot"],
-                ax=ax,
-                label=f"{label_prefix} shots",
-                zorder=3,
-            )
-        goals = frame[frame["is_goal"]]
-        if not goals.empty:
-            pitch.scatter(
-                goals["location_x"],
-                goals["location_y"],
-                s=goals["marker_size"] * 1.15,
-                marker="*",
-                edgecolors="black",
-                linewidths=0.8,
-                alpha=0.9,
-                c=palette[color_key]["goal"],
-                ax=ax,
-                label=f"{label_prefix} goals",
-                zorder=4,
-            )
-        return len(frame), int(goals["is_goal"].sum())
-
-    team_label = team_name or "All teams"
-    total_shots, total_goals = _scatter_shots(primary_shots, "primary", team_label)
-    opp_shots_count = 0
-    opp_goals_count = 0
-    if include_opponent and not opponent_shots.empty:
-        opp_name = opponent_shots["team"].mode().iloc[0] if not opponent_shots.empty else "Opponent"
-        opp_shots_count, opp_goals_count = _scatter_shots(opponent_shots, "opponent", f"{opp_name} (flipped)")
-
-    title_segments: list[str] = []
-    if descriptor:
-        teams = _matchup_label(descriptor.match)
-        if teams:
-            title_segments.append(teams)
-    title_segments.append("Shot map")
-    if team_name:
-        title_segments.append(team_name)
-    ax.set_title(" – ".join(title_segments), fontsize=14, weight="bold")
-    ax.legend(loc="upper right", fontsize=10, frameon=False)
-
     output_dir_path = _ensure_output_dir(output_dir)
     if not filename:
         slug_team = _slug(team_name or "all")
         match_id = descriptor.match_id if descriptor else "unknown"
         filename = f"shot-map_match-{match_id}_{slug_team}.png"
     output_path = output_dir_path / filename
-    fig.savefig(output_path, dpi=180, bbox_inches="tight", facecolor=fig.get_facecolor())
-    plt.close(fig)
+
+    def _draw(pitch, fig, ax) -> Tuple[int, int, int, int, bytes]:
+        def _scatter_shots(frame: pd.DataFrame, color_key: str, label_prefix: str) -> Tuple[int, int]:
+            if frame.empty:
+                return 0, 0
+            frame = frame.copy()
+            frame["is_goal"] = _label_mask(frame["shot_outcome"], "goal")
+            xg = frame["shot_xg"].to_numpy(dtype=np.float64, na_value=np.nan)
+            sizes = np.where(np.isnan(xg), 0.05, xg) * 900.0
+            frame["marker_size"] = np.maximum(sizes, 80.0, out=sizes)
+
+            non_goal = frame[~frame["is_goal"]]
+            if not non_goal.empty:
+                pitch.scatter(
+                    non_goal["location_x"],
+                    non_goal["location_y"],
+                    s=non_goal["marker_size"],
+                    edgecolors="black",
+                    linewidths=0.5,
+                    alpha=0.75,
+                    c=palette[color_key]["shot"],
+                    ax=ax,
+                    label=f"{label_prefix} shots",
+                    zorder=3,
+                )
+            goals = frame[frame["is_goal"]]
+            if not goals.empty:
+                pitch.scatter(
+                    goals["location_x"],
+                    goals["location_y"],
+                    s=goals["marker_size"] * 1.15,
+                    marker="*",
+                    edgecolors="black",
+                    linewidths=0.8,
+                    alpha=0.9,
+                    c=palette[color_key]["goal"],
+                    ax=ax,
+                    label=f"{label_prefix} goals",
+                    zorder=4,
+                )
+            return len(frame), int(goals["is_goal"].sum())
+
+        team_label = team_name or "All teams"
+        total_shots, total_goals = _scatter_shots(primary_shots, "primary", team_label)
+        opp_shots_count = 0
+        opp_goals_count = 0
+        if include_opponent and not opponent_shots.empty:
+            opponent_teams = opponent_shots["team"].dropna()
+            # A single match has one opponent; only fall back to the mode for mixed frames.
+            if opponent_teams.nunique() == 1:
+                opp_name = opponent_teams.iat[0]
+            else:
+                opp_name = opponent_teams.mode().iloc[0] if not opponent_teams.empty else "Opponent"
+            opp_shots_count, opp_goals_count = _scatter_shots(
+                opponent_shots, "opponent", f"{opp_name} (flipped)"
+            )
+
+        title_segments: list[str] = []
+        if descriptor:
+            teams = _matchup_label(descriptor.match)
+            if teams:
+                title_segments.append(teams)
+        title_segments.append("Shot map")
+        if team_name:
+            title_segments.append(team_name)
+        ax.set_title(" – ".join(title_segments), fontsize=14, weight="bold")
+        ax.legend(loc="upper right", fontsize=10, frameon=False)
+        png_bytes = _save_figure(fig, output_path)
+        return total_shots, total_goals, opp_shots_count, opp_goals_count, png_bytes
+
+    if renderer is None:
+        Pitch, plt = _load_mplsoccer()
+        pitch = Pitch(**_SHOT_MAP_PITCH)
+        with _PYPLOT_LOCK:
+            fig, ax = pitch.draw(figsize=(10, 7), constrained_layout=True)
+        fig.set_facecolor(_SHOT_MAP_PITCH["pitch_color"])
+        try:
+            rendered = _draw(pitch, fig, ax)
+        finally:
+            with _PYPLOT_LOCK:
+                plt.close(fig)
+    else:
+        with renderer.lock:
+            rendered = _draw(renderer.pitch, renderer.figure, renderer.clear())
+    total_shots, total_goals, opp_shots_count, opp_goals_count, png_bytes = rendered
 
     opponent_name = None
     if descriptor and descriptor.match:
@@ -290,6 +431,7 @@ def plot_match_shot_map(
         total_goals=total_goals,
         opponent_shots=opp_shots_count,
         opponent_goals=opp_goals_count,
+        png_bytes=png_bytes,
     )
 
 
@@ -313,9 +455,8 @@ def plot_event_heatmap(
     if events_df.empty:
         raise ValueError("No events available to plot.")
 
-    events_df = _normalize_coordinates(events_df)
     filtered = events_df[
-        (events_df["team"].str.lower() == team_name.lower())
+        _label_mask(events_df["team"], team_name)
         if team_name
         else pd.Series([True] * len(events_df), index=events_df.index)
     ]
@@ -331,7 +472,8 @@ def plot_event_heatmap(
         pitch_color="#0b132b",
         line_color="#d7d7d7",
     )
-    fig, ax = pitch.draw(figsize=(9, 6))
+    with _PYPLOT_LOCK:
+        fig, ax = pitch.draw(figsize=(9, 6))
     fig.set_facecolor("#0b132b")
 
     bin_statistic = pitch.bin_statistic(
@@ -360,8 +502,9 @@ def plot_event_heatmap(
         match_id = dataset.descriptor.match_id if dataset else "unknown"
         filename = f"heatmap_match-{match_id}_{slug_team}_{_slug('_'.join(event_types))}.png"
     output_path = output_dir_path / filename
-    fig.savefig(output_path, dpi=180, bbox_inches="tight", facecolor=fig.get_facecolor())
-    plt.close(fig)
+    png_bytes = _save_figure(fig, output_path)
+    with _PYPLOT_LOCK:
+        plt.close(fig)
 
     descriptor = dataset.descriptor if dataset else None
     return HeatmapResult(
@@ -372,6 +515,7 @@ def plot_event_heatmap(
         competition_id=descriptor.competition_id if descriptor else None,
         season_id=descriptor.season_id if descriptor else None,
         sample_size=len(filtered),
+        png_bytes=png_bytes,
     )
 
 
@@ -394,19 +538,17 @@ def plot_pass_network(
     if events_df.empty:
         raise ValueError("No events available to plot.")
 
-    events_df = _normalize_coordinates(events_df)
     passes = events_df[
-        (events_df["team"].str.lower() == team_name.lower())
+        _label_mask(events_df["team"], team_name)
         & (events_df["event_type"] == "Pass")
-    ].copy()
-    passes["pass_outcome"] = passes["pass_outcome"].fillna("Complete")
+    ]
+    # StatsBomb leaves ``pass_outcome`` empty for completed passes.
+    outcome = passes["pass_outcome"]
     passes = passes[
-        (passes["pass_outcome"] == "Complete")
-        & passes["pass_recipient_id"].notna()
-        & passes["location_x"].notna()
-        & passes["location_y"].notna()
-        & passes["pass_end_x"].notna()
-        & passes["pass_end_y"].notna()
+        (outcome.isna() | (outcome == "Complete"))
+        & passes[["pass_recipient_id", "location_x", "location_y", "pass_end_x", "pass_end_y"]]
+        .notna()
+        .all(axis=1)
     ]
     if passes.empty:
         raise ValueError(f"No completed passes found for team '{team_name}'.")
@@ -422,21 +564,19 @@ def plot_pass_network(
             f"No pass links meet the minimum threshold of {min_pass_count} for '{team_name}'."
         )
 
-    player_positions = passes.groupby("player_id").agg(
+    player_positions = passes.groupby("player_id", sort=False, observed=True).agg(
         start_x=("location_x", "mean"),
         start_y=("location_y", "mean"),
         player_name=("player_name", "first"),
+        passes_made=("location_x", "size"),
     )
-    passes_made = passes.groupby("player_id").size().rename("passes_made")
-    player_positions = player_positions.join(passes_made)
 
-    recipient_positions = passes.groupby("pass_recipient_id").agg(
+    recipient_positions = passes.groupby("pass_recipient_id", sort=False, observed=True).agg(
         recv_x=("pass_end_x", "mean"),
         recv_y=("pass_end_y", "mean"),
         recipient_name=("pass_recipient_name", "first"),
+        passes_received=("pass_end_x", "size"),
     )
-    passes_received = passes.groupby("pass_recipient_id").size().rename("passes_received")
-    recipient_positions = recipient_positions.join(passes_received)
     recipient_positions.index.name = "player_id"
 
     combined = player_positions.join(recipient_positions, how="outer")
@@ -463,7 +603,8 @@ def plot_pass_network(
         pitch_color="#13293d",
         line_color="#f3f5f4",
     )
-    fig, ax = pitch.draw(figsize=(10, 7), constrained_layout=True)
+    with _PYPLOT_LOCK:
+        fig, ax = pitch.draw(figsize=(10, 7), constrained_layout=True)
     fig.set_facecolor("#13293d")
 
     node_sizes = nodes["passes_total"]
@@ -491,11 +632,13 @@ def plot_pass_network(
         zorder=4,
     )
 
-    for _, row in nodes.iterrows():
+    for x, y, label in zip(
+        nodes["x"].to_numpy(), nodes["y"].to_numpy(), nodes["label"].to_numpy()
+    ):
         ax.text(
-            row["x"],
-            row["y"],
-            row["label"],
+            x,
+            y,
+            label,
             ha="center",
             va="center",
             fontsize=9,
@@ -504,20 +647,29 @@ def plot_pass_network(
             zorder=5,
         )
 
-    for edge in pass_counts.itertuples():
-        if edge.player_id not in combined.index or edge.pass_recipient_id not in combined.index:
-            continue
-        origin = combined.loc[edge.player_id]
-        target = combined.loc[edge.pass_recipient_id]
-        width = max(1.2, float(edge.pass_count))
-        alpha = min(0.9, 0.35 + 0.08 * edge.pass_count)
-        edge_intensity = min(1.0, edge.pass_count / pass_counts["pass_count"].max())
-        edge_color = plt.cm.magma(edge_intensity)
+    positions = combined[["x", "y"]]
+    edges = pass_counts.join(positions, on="player_id", how="inner").join(
+        positions, on="pass_recipient_id", how="inner", rsuffix="_end"
+    )
+    counts = edges["pass_count"].to_numpy(dtype=float)
+    edge_widths = np.maximum(1.2, counts)
+    edge_alphas = np.minimum(0.9, 0.35 + 0.08 * counts)
+    # One colormap lookup for every edge instead of one call per edge.
+    edge_colors = plt.cm.magma(np.minimum(1.0, counts / pass_counts["pass_count"].max()))
+    for origin_x, origin_y, target_x, target_y, edge_color, width, alpha in zip(
+        edges["x"].to_numpy(),
+        edges["y"].to_numpy(),
+        edges["x_end"].to_numpy(),
+        edges["y_end"].to_numpy(),
+        edge_colors,
+        edge_widths,
+        edge_alphas,
+    ):
         pitch.lines(
-            origin["x"],
-            origin["y"],
-            target["x"],
-            target["y"],
+            origin_x,
+            origin_y,
+            target_x,
+            target_y,
             color=edge_color,
             lw=width,
             alpha=alpha,
@@ -541,8 +693,9 @@ def plot_pass_network(
         match_id = descriptor.match_id if descriptor else "unknown"
         filename = f"pass-network_match-{match_id}_{slug_team}.png"
     output_path = output_dir_path / filename
-    fig.savefig(output_path, dpi=180, bbox_inches="tight", facecolor=fig.get_facecolor())
-    plt.close(fig)
+    png_bytes = _save_figure(fig, output_path)
+    with _PYPLOT_LOCK:
+        plt.close(fig)
 
     return PassNetworkResult(
         path=output_path,
@@ -553,9 +706,39 @@ def plot_pass_network(
         edge_count=len(pass_counts),
         node_count=len(nodes),
         total_passes=int(pass_counts["pass_count"].sum()),
+        png_bytes=png_bytes,
     )
 
 
+async def plot_match_pack(
+    data: StatsFrame,
+    *,
+    team_name: str,
+    event_types: Sequence[str] = ("Pass", "Carry", "Dribble"),
+    min_pass_count: int = 3,
+    output_dir: Optional[Union[str, Path]] = None,
+) -> Tuple[ShotMapResult, HeatmapResult, PassNetworkResult]:
+    """
+    Render the shot map, heatmap and pass network for one team concurrently.
+
+    Each render runs on a worker thread with its own figure; the normalised
+    events are prepared once up front and shared through the events cache.
+    """
+
+    if not isinstance(data, pd.DataFrame):
+        await asyncio.to_thread(_ensure_dataframe, data)
+    shot_map, heatmap, pass_network = await asyncio.gather(
+        asyncio.to_thread(plot_match_shot_map, data, team_name=team_name, output_dir=output_dir),
+        asyncio.to_thread(
+            plot_event_heatmap, data, team_name=team_name, event_types=event_types, output_dir=output_dir
+        ),
+        asyncio.to_thread(
+            plot_pass_network, data, team_name=team_name, min_pass_count=min_pass_count, output_dir=output_dir
+        ),
+    )
+    return shot_map, heatmap, pass_network
+
+
 def _short_name(name: str) -> str:
     parts = (name or "").split()
     if not parts:
@@ -588,8 +771,12 @@ def _opponent_from_match(match: Optional[dict], team_name: Optional[str]) -> Opt
     return None
 
 
+# Any character that ``str.isalnum`` rejects (``\w`` minus the underscore).
+_SLUG_SEPARATOR_RE = re.compile(r"[\W_]")
+
+
 def _slug(value: str) -> str:
-    return "".join(char.lower() if char.isalnum() else "-" for char in value).strip("-")
+    return _SLUG_SEPARATOR_RE.sub("-", value).lower().strip("-")
 
 
 def _heatmap_title(team_name: Optional[str], descriptor: Optional[MatchDescriptor], event_types: Sequence[str]) -> str:
@@ -6,7 +6,7 @@ from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Uni
 
 import pandas as pd
 
-from ..services.statsbomb_tools import MatchDataset
+from ..services.statsbomb_tools import MatchDataset, MatchHeader
 
 Number = Union[int, float]
 PITCH_LENGTH = 120.0
@@ -67,15 +67,13 @@ def _team_name(event: dict) -> Optional[str]:
     return team.get("name")
 
 
-def _opponent_name(team_name: Optional[str], match: dict) -> Optional[str]:
-    if not team_name or not match:
+def _opponent_name(team_name: Optional[str], header: MatchHeader) -> Optional[str]:
+    if not team_name:
         return None
-    home = match.get("home_team", {}).get("home_team_name")
-    away = match.get("away_team", {}).get("away_team_name")
-    if team_name == home:
-        return away
-    if team_name == away:
-        return home
+    if team_name == header.home_team_name:
+        return header.away_team_name
+    if team_name == header.away_team_name:
+        return header.home_team_name
     return None
 
 
@@ -161,11 +159,11 @@ def events_to_dataframe(datasets: Union[MatchDataset, Sequence[MatchDataset]]) -
 
     records: List[dict] = []
     for dataset in _ensure_iterable(datasets):
-        match = dataset.match or {}
+        header = dataset.header
         match_id = dataset.descriptor.match_id
         competition_id = dataset.descriptor.competition_id
         season_id = dataset.descriptor.season_id
-        match_date = match.get("match_date")
+        match_date = header.match_date
         for context in dataset.events:
             event = context.event
             start_x, start_y = _extract_location(event, "start")
@@ -208,7 +206,7 @@ def events_to_dataframe(datasets: Union[MatchDataset, Sequence[MatchDataset]]) -
                 "season_id": season_id,
                 "match_date": match_date,
                 "team": _team_name(event),
-                "opponent": _opponent_name(_team_name(event), match),
+                "opponent": _opponent_name(_team_name(event), header),
                 "player_id": _player_id(event),
                 "player_name": _player_name(event),
                 "event_type": event.get("type", {}).get("name"),
@@ -391,19 +389,19 @@ def summarise_player_events(
     grouped = df.groupby(group_cols, dropna=False).agg(**agg_spec).reset_index()
     grouped["passes_attempted"] = grouped["passes_attempted"].astype(float)
     grouped["passes_completed"] = grouped["passes_completed"].astype(float)
-    grouped["pass_accuracy"] = grouped.apply(
-        lambda row: row["passes_completed"] / row["passes_attempted"] if row["passes_attempted"] else 0.0,
-        axis=1,
-    )
+    grouped["pass_accuracy"] = _safe_ratio(grouped["passes_completed"], grouped["passes_attempted"])
     grouped["shots_total"] = grouped["shots_total"].astype(float)
     grouped["shots_on_target"] = grouped["shots_on_target"].astype(float)
-    grouped["shot_accuracy"] = grouped.apply(
-        lambda row: row["shots_on_target"] / row["shots_total"] if row["shots_total"] else 0.0,
-        axis=1,
-    )
+    grouped["shot_accuracy"] = _safe_ratio(grouped["shots_on_target"], grouped["shots_total"])
     return grouped.fillna(0)
 
 
+def _safe_ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """Column-wise ``numerator / denominator`` with zero where the denominator is zero."""
+
+    return (numerator / denominator.where(denominator != 0)).fillna(0.0)
+
+
 def summarise_team_events(events_df: pd.DataFrame) -> pd.DataFrame:
     """Aggregate event DataFrame into per-team match summaries."""
 
@@ -431,23 +429,30 @@ def build_player_leaderboards(
         return {}
 
     leaderboards: Dict[str, Dict[str, pd.DataFrame]] = {}
-    base = player_summary.copy()
-    base = base.sort_values("match_date", ascending=False)
+    base = player_summary.sort_values("match_date", ascending=False)
+
+    # Ratio metrics only rank players above a volume threshold; evaluate the
+    # masks once so ineligible metrics are skipped before any table is built.
+    eligible: Dict[str, pd.Series] = {}
+    if "pass_accuracy" in base.columns:
+        eligible["pass_accuracy"] = base["passes_attempted"] >= min_attempts
+    if "shot_accuracy" in base.columns:
+        eligible["shot_accuracy"] = base["shots_total"] >= max(1, min_attempts / 4)
 
     for category, metrics in groups.items():
         metric_tables: Dict[str, pd.DataFrame] = {}
         for metric in metrics:
             if metric not in base.columns:
                 continue
-            table = base[["player_name", "team", metric]].copy()
-            if metric == "pass_accuracy":
-                table = table[base["passes_attempted"] >= min_attempts]
-            if metric == "shot_accuracy":
-                table = table[base["shots_total"] >= max(1, min_attempts / 4)]
-            if table.empty:
+            columns = ["player_name", "team", metric]
+            mask = eligible.get(metric)
+            if mask is None:
+                table = base[columns]
+            elif mask.any():
+                table = base.loc[mask, columns]
+            else:
                 continue
-            table = table.sort_values(metric, ascending=False).head(top_n)
-            metric_tables[metric] = table.reset_index(drop=True)
+            metric_tables[metric] = table.nlargest(top_n, metric).reset_index(drop=True)
         if metric_tables:
             leaderboards[category] = metric_tables
     return leaderboards
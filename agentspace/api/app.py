@@ -205,10 +205,10 @@ async def _extract_tool_visualizations_from_memory(
         has_metadata = isinstance(metadata, Mapping)
         has_viz_marker = False
         if has_metadata:
-            has_viz_marker = bool(metadata.get("viz_type") or metadata.get("image_data") or metadata.get("images"))
+            has_viz_marker = bool(metadata.get("viz_type") or metadata.get("images"))
             print(f"  - Has metadata: {has_metadata}, has_viz_marker: {has_viz_marker}")
             if has_viz_marker:
-                print(f"    viz_type={metadata.get('viz_type')}, has_image_data={bool(metadata.get('image_data'))}, has_images={bool(metadata.get('images'))}")
+                print(f"    viz_type={metadata.get('viz_type')}, has_images={bool(metadata.get('images'))}")
 
         has_content = content is not None
         content_type = type(content).__name__ if has_content else None
@@ -240,7 +240,7 @@ async def _extract_tool_visualizations_from_memory(
 
         # Extract from metadata first – reliable indicator of visualization tools
         if isinstance(metadata, Mapping):
-            if metadata.get("viz_type") or metadata.get("image_data") or metadata.get("images"):
+            if metadata.get("viz_type") or metadata.get("images"):
                 # Merge useful fields
                 for key in (
                     "viz_type",
@@ -258,13 +258,6 @@ async def _extract_tool_visualizations_from_memory(
                     if key in metadata and key not in merged_metadata:
                         merged_metadata[key] = metadata[key]
 
-                # Inline base64 data
-                image_data = metadata.get("image_data")
-                if isinstance(image_data, str) and image_data:
-                    mime = metadata.get("image_mime_type") or "image/png"
-                    alt = metadata.get("viz_type")
-                    _add_src(f"data:{mime};base64,{image_data}", mime=mime, alt=alt)
-
                 image_path = metadata.get("image_path")
                 if isinstance(image_path, str) and image_path:
                     normalized_path = image_path.replace("\\", "/")
@@ -350,7 +343,7 @@ async def _extract_tool_visualizations_from_memory(
                     # Extract from tool result metadata
                     if isinstance(tool_metadata, Mapping):
                         print(f"      Tool result has metadata with keys: {list(tool_metadata.keys())}")
-                        if tool_metadata.get("viz_type") or tool_metadata.get("image_data") or tool_metadata.get("images"):
+                        if tool_metadata.get("viz_type") or tool_metadata.get("images"):
                             print(f"      Found viz data in tool result!")
                             # Merge metadata
                             for key in (
@@ -369,14 +362,6 @@ async def _extract_tool_visualizations_from_memory(
                                 if key in tool_metadata and key not in merged_metadata:
                                     merged_metadata[key] = tool_metadata[key]
 
-                            # Extract image_data
-                            image_data = tool_metadata.get("image_data")
-                            if isinstance(image_data, str) and image_data:
-                                mime = tool_metadata.get("image_mime_type") or "image/png"
-                                alt = tool_metadata.get("viz_type")
-                                _add_src(f"data:{mime};base64,{image_data}", mime=mime, alt=alt)
-                                print(f"        Added base64 image from metadata")
-
                             # Extract image_path
                             image_path = tool_metadata.get("image_path")
                             if isinstance(image_path, str) and image_path:
@@ -5,10 +5,13 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Any, Optional
 
+from .json_utils import loads_json
+
 
 class DataCache:
     """
@@ -39,9 +42,8 @@ class DataCache:
                 return None
 
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
-        except json.JSONDecodeError:
+            return loads_json(path.read_bytes())
+        except ValueError:
             return None
 
     def set(self, key: str, value: Any) -> None:
@@ -49,7 +51,7 @@ class DataCache:
         Store value in the cache.
         """
         path = self._path_for_key(key)
-        tmp_path = Path(f"{path}.{os.getpid()}.tmp")
+        tmp_path = Path(f"{path}.{os.getpid()}.{threading.get_ident()}.tmp")
         with tmp_path.open("w", encoding="utf-8") as handle:
             json.dump(value, handle)
         tmp_path.replace(path)
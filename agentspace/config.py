@@ -4,12 +4,41 @@ Configuration helpers for API clients.
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 _ENV_LOADED = False
 
+# ``KEY=value`` assignments with the whitespace around key and value left outside
+# the groups; blank lines, comments and lines without ``=`` never match.
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*([^\n]*?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
+@lru_cache(maxsize=8)
+def _parse_env_file(path: str, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    text = Path(path).read_text()
+    return tuple((key, value.strip('"').strip("'")) for key, value in _ENV_LINE_RE.findall(text))
+
+
+def _load_env_from_file(env_path: Path) -> None:
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+    environ = os.environ
+    pending: dict[str, str] = {}
+    for key, value in _parse_env_file(str(env_path), mtime_ns):
+        # Existing variables win, and so does the first assignment of a repeated key.
+        if key not in environ:
+            pending.setdefault(key, value)
+    environ.update(pending)
+
 
 def _ensure_env_loaded() -> None:
     """
@@ -30,18 +59,8 @@ def _ensure_env_loaded() -> None:
         candidates.append(repo_env)
 
     for path in candidates:
-        if not path or not path.exists():
-            continue
         try:
-            for line in path.read_text().splitlines():
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#") or "=" not in stripped:
-                    continue
-                key, value = stripped.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                if key and key not in os.environ:
-                    os.environ[key] = value
+            _load_env_from_file(path)
         except OSError:
             continue
 
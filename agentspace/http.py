@@ -17,6 +17,7 @@ except ImportError:  # pragma: no cover - optional dependency
     AWS4Auth = None  # type: ignore
 
 from .exceptions import APIClientError, APINotFoundError, APIRateLimitError
+from .json_utils import loads_json
 
 
 class HTTPClient:
@@ -101,7 +102,7 @@ class HTTPClient:
                 f"Unexpected content type '{content_type or 'unknown'}' from API response."
             )
         try:
-            return response.json()
+            return loads_json(response.content)
         except ValueError as exc:
             raise APIClientError("Failed to parse JSON response from API.") from exc
 
@@ -0,0 +1,35 @@
+"""
+JSON decoding shared by the HTTP client and the disk cache.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+# Runs of 19+ digits may be integers beyond 64 bits, which orjson decodes as
+# lossy floats; stdlib json keeps them exact.
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def loads_json(data: bytes) -> Any:
+    """
+    Decode ``data`` with orjson when installed, otherwise with stdlib json.
+
+    Documents orjson rejects but stdlib json accepts (``NaN``, ``Infinity``,
+    out-of-range floats, lone surrogate escapes) and documents that may hold
+    integers wider than 64 bits are decoded with stdlib json, so the result
+    never depends on whether orjson is installed. Raises ``ValueError`` on
+    invalid JSON.
+    """
+    if orjson is not None and _LONG_DIGITS_RE.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
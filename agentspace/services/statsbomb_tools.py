@@ -4,8 +4,10 @@ High level StatsBomb query helpers optimised for quick reuse.
 from __future__ import annotations
 
 import dataclasses
+import heapq
 import re
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import lru_cache
@@ -31,6 +33,9 @@ WIDE_RIGHT_Y = (62.0, 80.0)
 
 ScoreState = str
 
+# Upper bound on concurrent StatsBomb requests issued by a single call.
+MAX_FETCH_WORKERS = 8
+
 _SEQUENCE_FILTER_FIELDS = {
     "event_types",
     "team_names",
@@ -73,9 +78,13 @@ _NON_ASCII_REPLACEMENTS = {
 }
 
 
+@lru_cache(maxsize=4096)
 def _canonical(value: str) -> str:
     """
     Lowercase, collapse whitespace, and replace diacritics or special characters.
+
+    Memoised because the same player and team names are canonicalised
+    repeatedly across lookups within a session.
     """
     if not value:
         return ""
@@ -384,9 +393,11 @@ _season_cache: Dict[Tuple[int, str], int] = {}
 
 _POPULAR_ALIAS_INDEX: Dict[str, int] = {}
 _HARDCODED_SEASON_IDS: Dict[Tuple[int, str], int] = {}
+_POPULAR_COMPETITIONS_BY_ID: Dict[int, Dict[str, Any]] = {}
 
 for entry in POPULAR_COMPETITIONS:
     comp_id = entry["competition_id"]
+    _POPULAR_COMPETITIONS_BY_ID.setdefault(comp_id, entry)
     aliases = set(entry.get("aliases", []))
     aliases.add(entry.get("name", ""))
     for alias in aliases:
@@ -451,7 +462,7 @@ _POPULAR_ALIAS_INDEX.update(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchDescriptor:
     """
     Identify a match and optionally provide known metadata.
@@ -484,6 +495,26 @@ class EventFilters:
     location_key: str = "start"
     custom_filter: Optional[Callable[[Dict[str, Any], Dict[str, Any]], bool]] = None
 
+    @classmethod
+    def from_options(cls, **options: Any) -> "EventFilters":
+        """
+        Build filters from optional tool arguments.
+
+        Empty sequence filters are dropped and the rest are frozen into tuples,
+        so caller-owned lists are neither copied twice nor shared mutably.
+        """
+        values: Dict[str, Any] = {}
+        for key, value in options.items():
+            if key in _SEQUENCE_FILTER_FIELDS:
+                if not value:
+                    value = None
+                elif isinstance(value, str):
+                    value = (value,)
+                else:
+                    value = tuple(value)
+            values[key] = value
+        return cls(**values)
+
 
 @dataclass(frozen=True)
 class EventContext:
@@ -499,6 +530,29 @@ class EventContext:
     elapsed_seconds: float
 
 
+@dataclass(frozen=True, slots=True)
+class MatchHeader:
+    """
+    Typed view of the match fields read on every summary and event pass.
+    """
+
+    home_team_name: Optional[str] = None
+    away_team_name: Optional[str] = None
+    match_date: Optional[str] = None
+
+    @classmethod
+    def from_match(cls, match: Optional[Dict[str, Any]]) -> "MatchHeader":
+        match = match or {}
+        return cls(
+            home_team_name=(match.get("home_team") or {}).get("home_team_name"),
+            away_team_name=(match.get("away_team") or {}).get("away_team_name"),
+            match_date=match.get("match_date"),
+        )
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return dataclasses.asdict(self)
+
+
 @dataclass(frozen=True)
 class MatchDataset:
     """
@@ -510,6 +564,10 @@ class MatchDataset:
     events: List[EventContext]
     lineups: Optional[List[Dict[str, Any]]] = None
     frames: Optional[List[Dict[str, Any]]] = None
+    header: MatchHeader = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "header", MatchHeader.from_match(self.match))
 
 
 @dataclass(frozen=True)
@@ -529,6 +587,29 @@ def _to_float(value: Any) -> float:
         return 0.0
 
 
+def _sort_and_limit(
+    rows: List[Dict[str, Any]],
+    *,
+    sort_by: Optional[str],
+    descending: bool,
+    top_n: Optional[int],
+) -> List[Dict[str, Any]]:
+    """
+    Order ``rows`` by ``sort_by`` and keep the first ``top_n``.
+
+    When only a prefix is needed the rows are selected with a bounded heap,
+    which matches a stable full sort followed by slicing.
+    """
+    if sort_by and top_n is not None and 0 <= top_n < len(rows):
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(top_n, rows, key=lambda item: _to_float(item.get(sort_by)))
+    if sort_by:
+        rows.sort(key=lambda item: _to_float(item.get(sort_by)), reverse=descending)
+    if top_n is not None:
+        rows = rows[:top_n]
+    return rows
+
+
 def _select_columns(row: Dict[str, Any], metrics: Optional[Sequence[str]]) -> Dict[str, Any]:
     if not metrics:
         return row
@@ -854,8 +935,13 @@ def fetch_team_events(
     return results
 
 
+@lru_cache(maxsize=128)
 def resolve_competition_id(name: str) -> Optional[int]:
-    """Resolve a competition alias to an ID using the built-in index."""
+    """Resolve a competition alias to an ID using the built-in index.
+
+    Memoised because the index is static and tools resolve the same few
+    competition names on every call.
+    """
 
     canonical = _canonical(name)
     match = _POPULAR_ALIAS_INDEX.get(canonical)
@@ -1002,8 +1088,9 @@ def get_team_season_summary(
         metrics=metrics,
         use_cache=use_cache,
     )
+    target_team = _canonical(team_name)
     for row in rows:
-        if _canonical(row.get("team_name", "")) == _canonical(team_name):
+        if _canonical(row.get("team_name", "")) == target_team:
             return row
     raise ValueError(
         f"No record returned for team '{team_name}' in season '{season_label}'."
@@ -1052,43 +1139,43 @@ def get_players_season_summary(
             f"No season_id found for label '{season_label}' in competition {competition_id}."
         )
 
-    rows = fetch_player_season_stats_data(
+    # Load the season once; the name-filtered view is projected from it and the
+    # full frame doubles as the fallback when the filter misses someone.
+    season_rows = fetch_player_season_stats_data(
         competition_id,
         season_id,
-        player_names=player_names,
+        player_names=None,
         min_minutes=min_minutes,
         metrics=metrics,
         use_cache=use_cache,
     )
+    matches_player = _player_name_matcher(player_names)
+    rows = season_rows
+    if matches_player is not None:
+        rows = [row for row in season_rows if matches_player(row.get("player_name", ""))]
     if not rows or len(rows) < len(player_names):
-        rows = fetch_player_season_stats_data(
-            competition_id,
-            season_id,
-            player_names=None,
-            min_minutes=min_minutes,
-            metrics=metrics,
-            use_cache=use_cache,
-        )
+        rows = season_rows
 
     summaries: Dict[str, Dict[str, Any]] = {}
-    lookup_names = {_canonical(name): name for name in player_names}
+    # Canonical forms and token sets are computed once per requested name
+    # rather than once per (row, name) pair.
+    lookups = [
+        (canonical_query, set(canonical_query.split()), original)
+        for canonical_query, original in {_canonical(name): name for name in player_names}.items()
+    ]
 
     for row in rows:
-        player_label = row.get("player_name", "")
-        canonical_row = _canonical(player_label)
+        canonical_row = _canonical(row.get("player_name", ""))
         row_tokens = set(canonical_row.split())
-        for canonical_query, original in lookup_names.items():
+        for canonical_query, query_tokens, original in lookups:
             if (
                 canonical_query == canonical_row
                 or canonical_query in canonical_row
                 or canonical_row in canonical_query
+                or query_tokens & row_tokens
             ):
                 summaries[original] = row
                 break
-            query_tokens = set(canonical_query.split())
-            if query_tokens & row_tokens:
-                summaries[original] = row
-                break
 
     missing = [name for name in player_names if name not in summaries]
     return summaries, missing
@@ -1370,6 +1457,45 @@ def get_competition_players(
     return rows
 
 
+def _player_name_matcher(
+    player_names: Optional[Sequence[str]],
+) -> Optional[Callable[[str], bool]]:
+    """
+    Build a predicate accepting player names that loosely match any requested name.
+
+    Returns ``None`` when no names were requested so callers can skip filtering.
+    """
+    # Build a selection list with canonical names and token sets for matching.
+    # We will also use a lightweight similarity check to catch close variants
+    # (diacritics already handled by _canonical, this helps spacing/order).
+    from difflib import SequenceMatcher  # local import to avoid top-level dep
+    selected_players: List[Tuple[str, set[str]]] = []
+    for name in player_names or []:
+        canonical_name = _canonical(name)
+        if canonical_name:
+            selected_players.append((canonical_name, set(canonical_name.split())))
+    if not selected_players:
+        return None
+
+    def _similar(a: str, b: str) -> float:
+        return SequenceMatcher(a=a.replace(" ", ""), b=b.replace(" ", "")).ratio()
+
+    def _matches(player_name: str) -> bool:
+        row_player = _canonical(player_name)
+        row_tokens = set(row_player.split())
+        # similarity check across all requested players; accept if any hit
+        return any(
+            canonical == row_player
+            or canonical in row_player
+            or row_player in canonical
+            or (tokens and row_tokens and tokens & row_tokens)
+            or (_similar(canonical, row_player) >= 0.85)
+            for canonical, tokens in selected_players
+        )
+
+    return _matches
+
+
 def fetch_player_season_stats_data(
     competition_id: int,
     season_id: int,
@@ -1396,15 +1522,7 @@ def fetch_player_season_stats_data(
     except APINotFoundError:
         return []
     filtered: List[Dict[str, Any]] = []
-    # Build a selection list with canonical names and token sets for matching.
-    # We will also use a lightweight similarity check to catch close variants
-    # (diacritics already handled by _canonical, this helps spacing/order).
-    from difflib import SequenceMatcher  # local import to avoid top-level dep
-    selected_players: List[Tuple[str, set[str]]] = []
-    for name in player_names or []:
-        canonical_name = _canonical(name)
-        if canonical_name:
-            selected_players.append((canonical_name, set(canonical_name.split())))
+    matches_player = _player_name_matcher(player_names)
 
     target_team = _canonical(team_name) if team_name else None
     for row in rows:
@@ -1413,31 +1531,13 @@ def fetch_player_season_stats_data(
         row_team = _canonical(row_data.get("team_name", ""))
         if target_team and row_team != target_team:
             continue
-        row_player = _canonical(row_data.get("player_name", ""))
-        if selected_players:
-            row_tokens = set(row_player.split())
-            # similarity check across all requested players; accept if any hit
-            def _similar(a: str, b: str) -> float:
-                return SequenceMatcher(a=a.replace(" ", ""), b=b.replace(" ", "")).ratio()
-
-            if not any(
-                canonical == row_player
-                or canonical in row_player
-                or row_player in canonical
-                or (tokens and row_tokens and tokens & row_tokens)
-                or (_similar(canonical, row_player) >= 0.85)
-                for canonical, tokens in selected_players
-            ):
-                continue
+        if matches_player is not None and not matches_player(row_data.get("player_name", "")):
+            continue
         if min_minutes is not None and _to_float(row_data.get("player_season_minutes")) < float(min_minutes):
             continue
         filtered.append(_select_columns(row_data, metrics))
 
-    if sort_by:
-        filtered.sort(key=lambda item: _to_float(item.get(sort_by)), reverse=descending)
-    if top_n is not None:
-        filtered = filtered[:top_n]
-    return filtered
+    return _sort_and_limit(filtered, sort_by=sort_by, descending=descending, top_n=top_n)
 
 
 def fetch_team_season_stats_data(
@@ -1463,11 +1563,7 @@ def fetch_team_season_stats_data(
     except APINotFoundError:
         return []
     processed = [_select_columns(row, metrics) for row in rows]
-    if sort_by:
-        processed.sort(key=lambda item: _to_float(item.get(sort_by)), reverse=descending)
-    if top_n is not None:
-        processed = processed[:top_n]
-    return processed
+    return _sort_and_limit(processed, sort_by=sort_by, descending=descending, top_n=top_n)
 
 
 def fetch_player_match_stats_data(
@@ -1494,11 +1590,7 @@ def fetch_player_match_stats_data(
         if target_team and row.get("team_name", "").lower() != target_team:
             continue
         filtered.append(_select_columns(row, metrics))
-    if sort_by:
-        filtered.sort(key=lambda item: _to_float(item.get(sort_by)), reverse=descending)
-    if top_n is not None:
-        filtered = filtered[:top_n]
-    return filtered
+    return _sort_and_limit(filtered, sort_by=sort_by, descending=descending, top_n=top_n)
 
 
 def fetch_player_events_for_matches(
@@ -1530,9 +1622,8 @@ def fetch_player_events_for_matches(
     if opponent_name:
         augmented = _augment_filters(augmented, opponent_names=[opponent_name])
 
-    datasets: Dict[int, MatchDataset] = {}
-    for descriptor in match_descriptors:
-        dataset = fetch_match_dataset(
+    def _fetch(descriptor: MatchDescriptor) -> MatchDataset:
+        return fetch_match_dataset(
             descriptor,
             filters=augmented,
             include_lineups=include_lineups,
@@ -1540,8 +1631,14 @@ def fetch_player_events_for_matches(
             use_cache=use_cache,
             client=statsbomb,
         )
-        datasets[descriptor.match_id] = dataset
-    return datasets
+
+    # Each match is an independent round-trip, so fetch them concurrently;
+    # ``map`` preserves descriptor order in the returned mapping.
+    workers = max(1, min(MAX_FETCH_WORKERS, len(match_descriptors)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        fetched = list(executor.map(_fetch, match_descriptors))
+
+    return {descriptor.match_id: dataset for descriptor, dataset in zip(match_descriptors, fetched)}
 
 
 def count_player_passes_by_body_part(
@@ -425,7 +425,6 @@ export function ChatPanel() {
       };
 
       registerImagePath((metadata as Record<string, unknown>).image_path, defaultAlt);
-      registerImageData((metadata as Record<string, unknown>).image_data, (metadata as Record<string, unknown>).image_mime_type, defaultAlt);
 
       const imagePaths = (metadata as Record<string, unknown>).image_paths;
       if (Array.isArray(imagePaths)) {
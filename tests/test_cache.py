@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
+import math
 import time
 
+import pytest
+
+from agentspace import json_utils
 from agentspace.cache import DataCache
 
 
@@ -19,3 +23,29 @@ def test_cache_respects_ttl(tmp_path):
     assert cache.get("key") == {"a": 1}
     time.sleep(1.2)
     assert cache.get("key") is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_cache_reads_back_what_it_writes(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    cache = DataCache(str(tmp_path))
+    value = {"nan": float("nan"), "inf": float("inf"), "big": 2**70, "text": "café", "lone": "\ud800"}
+
+    cache.set("key", value)
+    loaded = cache.get("key")
+
+    assert math.isnan(loaded["nan"])
+    assert loaded["inf"] == float("inf")
+    assert loaded["big"] == 2**70 and isinstance(loaded["big"], int)
+    assert loaded["text"] == "café"
+    assert loaded["lone"] == "\ud800"
+
+
+def test_cache_treats_corrupt_entry_as_miss(tmp_path):
+    cache = DataCache(str(tmp_path))
+    (tmp_path / "key.json").write_text("{not json")
+
+    assert cache.get("key") is None
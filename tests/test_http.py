@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+import requests
+
+from agentspace import json_utils
+from agentspace.exceptions import APIClientError
+from agentspace.http import HTTPClient
+
+
+def _client_returning(monkeypatch, body: bytes, content_type: str = "application/json") -> HTTPClient:
+    client = HTTPClient("https://api.example.com")
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers["Content-Type"] = content_type
+    monkeypatch.setattr(client.session, "request", lambda **_: response)
+    return client
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_request_decodes_what_stdlib_json_accepts(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    body = b'{"score": NaN, "limit": Infinity, "huge": 1e400, "id": 123456789012345678901234567890, "name": "\\ud800"}'
+    client = _client_returning(monkeypatch, body)
+
+    payload = client.request("GET", "/items")
+
+    assert math.isnan(payload["score"])
+    assert payload["limit"] == payload["huge"] == float("inf")
+    assert payload["id"] == 123456789012345678901234567890
+    assert payload["name"] == "\ud800"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_request_rejects_invalid_json(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    client = _client_returning(monkeypatch, b"{broken")
+
+    with pytest.raises(APIClientError):
+        client.request("GET", "/items")
@@ -4,7 +4,9 @@ Tests for mplsoccer visualization helpers.
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Tuple
 
 import numpy as np
@@ -21,22 +23,31 @@ class DummyFig:
     def set_facecolor(self, color: str) -> None:
         self.facecolor = color
 
-    def savefig(self, path: Path | str, **_: Any) -> None:
-        Path(path).write_bytes(b"png")
+    def savefig(self, target: Any, **_: Any) -> None:
+        if hasattr(target, "write"):
+            target.write(b"png")
+        else:
+            Path(target).write_bytes(b"png")
 
     def get_facecolor(self) -> str:
         return self.facecolor
 
 
 class DummyAx:
+    def __init__(self) -> None:
+        self.labels: list[Tuple[float, float, str]] = []
+
     def set_title(self, *_: Any, **__: Any) -> None:
         return None
 
     def legend(self, *_: Any, **__: Any) -> None:
         return None
 
-    def text(self, *_: Any, **__: Any) -> None:
-        return None
+    def cla(self) -> None:
+        self.labels.clear()
+
+    def text(self, x: float, y: float, label: str, **__: Any) -> None:
+        self.labels.append((x, y, label))
 
 
 class DummyPitch:
@@ -55,8 +66,10 @@ class DummyPitch:
     def heatmap(self, *_: Any, **__: Any) -> None:
         return None
 
-    def lines(self, *_: Any, **__: Any) -> None:
-        return None
+    lines_drawn: list[Tuple[float, ...]] = []
+
+    def lines(self, *coords: Any, **__: Any) -> None:
+        self.lines_drawn.append(tuple(float(value) for value in coords))
 
 
 class DummyPlt:
@@ -115,6 +128,7 @@ def test_plot_match_shot_map_from_dataframe(tmp_path: Path) -> None:
     assert result.opponent_shots == 1
     assert result.path == tmp_path / "shot-map.png"
     assert result.path.exists()
+    assert result.png_bytes == result.path.read_bytes() == b"png"
 
 
 def test_plot_event_heatmap(tmp_path: Path) -> None:
@@ -207,3 +221,253 @@ def test_plot_pass_network(tmp_path: Path) -> None:
     assert result.total_passes == 3
     assert result.path == tmp_path / "pass-network.png"
     assert result.path.exists()
+
+
+def test_normalize_coordinates_scales_each_axis_once() -> None:
+    df = pd.DataFrame(
+        {
+            "location_x": [0.5, np.nan, 1.0],
+            "pass_end_x": [0.25, 0.75, np.nan],
+            "location_y": [52.5, 68.0, np.nan],
+            "pass_end_y": [np.nan, np.nan, np.nan],
+        }
+    )
+
+    result = viz._normalize_coordinates(df)
+
+    assert result["location_x"].tolist()[::2] == [60.0, 120.0]
+    assert result["pass_end_x"].tolist()[:2] == [30.0, 90.0]
+    assert result["location_y"].iloc[1] == pytest.approx(80.0)
+    assert result["pass_end_y"].isna().all()
+    assert set(result.dtypes) == {np.dtype(np.float32)}
+
+
+def test_normalize_coordinates_leaves_statsbomb_pitch_untouched() -> None:
+    df = pd.DataFrame({"location_x": [np.nan, np.nan], "location_y": [10, 75]})
+
+    result = viz._normalize_coordinates(df)
+
+    assert result["location_x"].isna().all()
+    assert result["location_y"].tolist() == [10, 75]
+
+
+def test_ensure_dataframe_caches_normalised_events_per_dataset(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[object] = []
+
+    def fake_events_to_dataframe(dataset: object) -> pd.DataFrame:
+        calls.append(dataset)
+        return pd.DataFrame({"location_x": [0.5], "location_y": [0.5]})
+
+    monkeypatch.setattr(viz, "events_to_dataframe", fake_events_to_dataframe)
+    dataset, other = SimpleNamespace(), SimpleNamespace()
+
+    first, source = viz._ensure_dataframe(dataset)
+    first.loc[0, "location_x"] = -1.0
+    second, _ = viz._ensure_dataframe(dataset)
+    viz._ensure_dataframe(other)
+
+    assert source is dataset
+    assert calls == [dataset, other]
+    assert second.loc[0, "location_x"] == 60.0
+    assert second.loc[0, "location_y"] == 40.0
+
+
+def test_plot_pass_network_draws_edges_between_mean_positions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(DummyPitch, "lines_drawn", [])
+    axes: list[DummyAx] = []
+    original_draw = DummyPitch.draw
+
+    def draw(self: DummyPitch, **kwargs: Any) -> Tuple[DummyFig, DummyAx]:
+        fig, ax = original_draw(self, **kwargs)
+        axes.append(ax)
+        return fig, ax
+
+    monkeypatch.setattr(DummyPitch, "draw", draw)
+    rows = [
+        (1, "Martin Odegaard", 40.0, 30.0, 60.0, 30.0, 2.0, "Bukayo Saka"),
+        (1, "Martin Odegaard", 40.0, 30.0, 60.0, 30.0, 2.0, "Bukayo Saka"),
+        (2, "Bukayo Saka", 60.0, 50.0, 40.0, 50.0, 1.0, "Martin Odegaard"),
+        (2, "Bukayo Saka", 60.0, 50.0, 40.0, 50.0, 1.0, "Martin Odegaard"),
+        (2, "Bukayo Saka", 60.0, 50.0, 120.0, 80.0, 3.0, "Ben White"),
+    ]
+    df = pd.DataFrame(
+        [
+            {
+                "event_type": "Pass",
+                "team": "Arsenal",
+                "player_id": player_id,
+                "player_name": player_name,
+                "location_x": start_x,
+                "location_y": start_y,
+                "pass_end_x": end_x,
+                "pass_end_y": end_y,
+                "pass_outcome": None,
+                "pass_recipient_id": recipient_id,
+                "pass_recipient_name": recipient_name,
+            }
+            for player_id, player_name, start_x, start_y, end_x, end_y, recipient_id, recipient_name in rows
+        ]
+    )
+
+    result = viz.plot_pass_network(df, team_name="Arsenal", min_pass_count=2, output_dir=tmp_path)
+
+    assert result.edge_count == 2
+    assert sorted(DummyPitch.lines_drawn) == [(40.0, 40.0, 60.0, 40.0), (60.0, 40.0, 40.0, 40.0)]
+    assert sorted(label for *_, label in axes[0].labels) == ["B. Saka", "M. Odegaard"]
+
+
+def test_plot_match_pack_renders_all_three_from_one_conversion(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events = pd.DataFrame(
+        [
+            {
+                "event_type": "Shot",
+                "team": "Arsenal",
+                "location_x": 108.0,
+                "location_y": 40.0,
+                "shot_outcome": "Goal",
+                "shot_xg": 0.4,
+            },
+            *[
+                {
+                    "event_type": "Pass",
+                    "team": "Arsenal",
+                    "player_id": passer,
+                    "player_name": name,
+                    "location_x": 40.0 + passer,
+                    "location_y": 30.0,
+                    "pass_end_x": 120.0,
+                    "pass_end_y": 80.0,
+                    "pass_outcome": None,
+                    "pass_recipient_id": 3 - passer,
+                    "pass_recipient_name": "Other",
+                }
+                for passer, name in ((1, "Martin Odegaard"), (2, "Bukayo Saka"))
+            ],
+        ]
+    )
+    calls: list[object] = []
+    monkeypatch.setattr(viz, "events_to_dataframe", lambda dataset: calls.append(dataset) or events.copy())
+    descriptor = SimpleNamespace(match_id=7, match=None, competition_id=2, season_id=27)
+    dataset = SimpleNamespace(descriptor=descriptor)
+
+    shot_map, heatmap, pass_network = asyncio.run(
+        viz.plot_match_pack(dataset, team_name="Arsenal", min_pass_count=1, output_dir=tmp_path)
+    )
+
+    assert calls == [dataset]
+    assert (shot_map.total_shots, heatmap.sample_size, pass_network.edge_count) == (1, 2, 2)
+    assert {shot_map.match_id, heatmap.match_id, pass_network.match_id} == {7}
+    assert {shot_map.path, heatmap.path, pass_network.path} == set(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Arsenal", "arsenal"),
+        ("Paris Saint-Germain", "paris-saint-germain"),
+        ("Atlético Madrid_B", "atlético-madrid-b"),
+        (" Pass, Carry ", "pass--carry"),
+    ],
+)
+def test_slug_replaces_non_alphanumerics(value: str, expected: str) -> None:
+    assert viz._slug(value) == expected
+
+
+def test_ensure_dataframe_leaves_caller_frame_untouched() -> None:
+    coords = np.array([0.5, 1.0], dtype=np.float32)
+    df = pd.DataFrame({"location_x": coords, "location_y": coords.copy(), "team": ["A", "B"]})
+
+    result, dataset = viz._ensure_dataframe(df)
+
+    assert dataset is None
+    assert result["location_x"].tolist() == [60.0, 120.0]
+    assert df["location_x"].tolist() == [0.5, 1.0]
+    assert coords.tolist() == [0.5, 1.0]
+
+
+def test_prepared_events_use_categorical_labels(tmp_path: Path) -> None:
+    rows = [
+        ("Arsenal", 100.0, 40.0, "Goal", 0.5),
+        ("ARSENAL", 110.0, 70.0, "Saved", None),
+        ("Chelsea", 120.0, 80.0, "goal", 0.1),
+    ]
+    df = pd.DataFrame(
+        [
+            {
+                "event_type": "Shot",
+                "team": team,
+                "location_x": x,
+                "location_y": y,
+                "shot_outcome": outcome,
+                "shot_xg": xg,
+            }
+            for team, x, y, outcome, xg in rows
+        ]
+    )
+
+    prepared, _ = viz._ensure_dataframe(df)
+    result = viz.plot_match_shot_map(df, team_name="arsenal", output_dir=tmp_path)
+
+    for column in ("team", "event_type", "shot_outcome"):
+        assert isinstance(prepared[column].dtype, pd.CategoricalDtype)
+        assert not isinstance(df[column].dtype, pd.CategoricalDtype)
+    assert (result.total_shots, result.total_goals) == (2, 1)
+    assert (result.opponent_shots, result.opponent_goals) == (1, 1)
+
+
+def test_save_figure_uses_configured_png_compression(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+
+    class RecordingFig(DummyFig):
+        def savefig(self, target: Any, **kwargs: Any) -> None:
+            captured.update(kwargs)
+            super().savefig(target, **kwargs)
+
+    monkeypatch.setattr(viz, "_PNG_COMPRESS_LEVEL", viz._parse_compress_level("1"))
+
+    assert viz._save_figure(RecordingFig(), tmp_path / "fig.png") == b"png"
+    assert captured["pil_kwargs"] == {"compress_level": 1, "optimize": False}
+    assert (tmp_path / "fig.png").read_bytes() == b"png"
+
+
+def test_parse_compress_level_clamps_and_falls_back(caplog: pytest.LogCaptureFixture) -> None:
+    assert viz._parse_compress_level(None) == 6
+    assert viz._parse_compress_level("12") == 9
+    assert viz._parse_compress_level("-3") == 0
+
+    with caplog.at_level("WARNING", logger=viz.__name__):
+        assert viz._parse_compress_level("fast") == 6
+    assert "AGENTSPACE_PNG_COMPRESS_LEVEL" in caplog.text
+
+
+def test_plot_match_shot_map_reuses_renderer_figure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[Any] = []
+    monkeypatch.setattr(DummyPlt, "close", staticmethod(closed.append))
+    df = pd.DataFrame(
+        [
+            {
+                "event_type": "Shot",
+                "team": "Arsenal",
+                "location_x": 110.0,
+                "location_y": 40.0,
+                "shot_outcome": "Goal",
+                "shot_xg": 0.3,
+            }
+        ]
+    )
+    renderer = viz.PitchRenderer()
+    cleared: list[bool] = []
+    monkeypatch.setattr(renderer.ax, "cla", lambda: cleared.append(True))
+
+    first = viz.plot_match_shot_map(df, team_name="Arsenal", output_dir=tmp_path, filename="a.png", renderer=renderer)
+    second = viz.plot_match_shot_map(df, team_name="Arsenal", output_dir=tmp_path, filename="b.png", renderer=renderer)
+
+    assert (first.total_goals, second.total_goals) == (1, 1)
+    assert cleared == [True]
+    assert closed == []
+    renderer.close()
+    assert closed == [renderer.figure]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 
 import pytest
@@ -16,6 +17,13 @@ from agentspace.services.statsbomb_tools import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_session_init():
+    tools._SESSION_INIT_ARGS = None
+    yield
+    tools._SESSION_INIT_ARGS = None
+
+
 def _sample_match() -> dict:
     return {
         "match_id": 1,
@@ -143,6 +151,18 @@ def test_fetch_match_events(monkeypatch):
 
     assert response.metadata["preview_events"][0]["event_id"] == "evt-1"
     assert "Retrieved" in response.content[0]["text"]
+    assert response.metadata["lineups"] is None
+
+    withheld = tools.fetch_match_events(
+        1,
+        competition_id=2,
+        season_id=317,
+        include_lineups=True,
+        verbose_metadata=False,
+    )
+    assert "lineups" not in withheld.metadata
+    assert tools.get_full_records(withheld.metadata["lineups_ref"]) == [{"team": "Arsenal"}]
+    assert withheld.metadata["frames"] is None
 
 
 def test_fetch_match_events_extended_filters(monkeypatch):
@@ -180,12 +200,12 @@ def test_fetch_match_events_extended_filters(monkeypatch):
     )
 
     filters = captured["filters"]
-    assert filters.team_names == ["Arsenal"]
-    assert filters.possession_team_names == ["Arsenal"]
-    assert filters.event_types == ["Pass"]
-    assert filters.player_names == ["Bukayo Saka"]
-    assert filters.play_patterns == ["From Open Play"]
-    assert filters.outcome_names == ["Complete"]
+    assert filters.team_names == ("Arsenal",)
+    assert filters.possession_team_names == ("Arsenal",)
+    assert filters.event_types == ("Pass",)
+    assert filters.player_names == ("Bukayo Saka",)
+    assert filters.play_patterns == ("From Open Play",)
+    assert filters.outcome_names == ("Complete",)
     assert filters.minute_range == (0, 45)
     assert filters.time_range == (0.0, 2700.0)
     assert filters.zone == "final_third"
@@ -201,6 +221,47 @@ def test_fetch_player_season_aggregates(monkeypatch):
     )
     response = tools.fetch_player_season_aggregates(2, 317)
     assert response.metadata["records"] == records
+    assert "player_name=Bukayo Saka, player_season_minutes=900" in response.content[0]["text"]
+
+
+def test_fetch_player_season_aggregates_can_withhold_records(monkeypatch):
+    records = [{"player_name": "Bukayo Saka", "player_season_minutes": 900}]
+    monkeypatch.setattr(
+        tools,
+        "fetch_player_season_stats_data",
+        lambda *_, **__: records,
+    )
+    response = tools.fetch_player_season_aggregates(2, 317, verbose_metadata=False)
+    assert "records" not in response.metadata
+    assert tools.get_full_records(response.metadata["records_ref"]) is records
+    assert "player_name=Bukayo Saka" in response.content[0]["text"]
+
+
+def test_registered_tools_keep_verbose_metadata_out_of_schema():
+    toolkit = tools.register_statsbomb_tools()
+
+    for name in (
+        "fetch_match_events",
+        "fetch_player_season_aggregates",
+        "fetch_team_season_aggregates",
+        "fetch_player_match_aggregates",
+        "list_team_players_tool",
+        "list_competition_players_tool",
+    ):
+        tool = toolkit.tools[name]
+        assert "verbose_metadata" not in json.dumps(tool.json_schema)
+        assert tool.preset_kwargs == {"verbose_metadata": True}
+
+
+def test_fetch_player_season_aggregates_handles_no_records(monkeypatch):
+    monkeypatch.setattr(
+        tools,
+        "fetch_player_season_stats_data",
+        lambda *_, **__: [],
+    )
+    response = tools.fetch_player_season_aggregates(2, 317)
+    assert response.metadata["records"] == []
+    assert "Retrieved 0 player season record(s)" in response.content[0]["text"]
 
 
 def test_fetch_team_season_aggregates(monkeypatch):
@@ -317,10 +378,18 @@ def test_summarise_match_performance(monkeypatch):
         match=match,
     )
 
-    dataset = MatchDataset(descriptor=descriptor, match=match, events=[])
+    context = EventContext(
+        event={"id": "evt-1", "type": {"name": "Shot"}},
+        match=match,
+        home_score=0,
+        away_score=0,
+        score_state="level",
+        elapsed_seconds=0.0,
+    )
+    dataset = MatchDataset(descriptor=descriptor, match=match, events=[context])
 
     monkeypatch.setattr(tools, "fetch_match_dataset", lambda *_, **__: dataset)
-    monkeypatch.setattr(tools, "events_to_dataframe", lambda *_: pd.DataFrame({"event_type": []}))
+    monkeypatch.setattr(tools, "events_to_dataframe", lambda *_: pd.DataFrame({"event_type": ["Shot"]}))
 
     player_summary_df = pd.DataFrame(
         [
@@ -374,7 +443,59 @@ def test_summarise_match_performance(monkeypatch):
 
     assert response.metadata["player_summary"][0]["player_name"] == "Bukayo Saka"
     assert response.metadata["team_summary"][0]["team"] == "Arsenal"
-    assert "Leaderboard highlights" in response.content[0]["text"]
+    text = response.content[0]["text"]
+    assert "Top scorers: Bukayo Saka (Arsenal, 1 goals)" in text
+    assert "xG leaders: Bukayo Saka (Arsenal, 0.40 xG)" in text
+    assert "Progression: Bukayo Saka (Arsenal, 5 progressive actions)" in text
+    assert "Arsenal: Goals 2, xG 1.50, Passes Completed 500" in text
+    assert "Leaderboard highlights" in text
+
+
+def test_summarise_match_performance_skips_unrequested_summaries(monkeypatch):
+    match = _sample_match()
+    descriptor = MatchDescriptor(match_id=1, competition_id=2, season_id=317, match=match)
+    dataset = MatchDataset(descriptor=descriptor, match=match, events=[])
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("summary should not be computed")
+
+    monkeypatch.setattr(tools, "fetch_match_dataset", lambda *_, **__: dataset)
+    monkeypatch.setattr(tools, "events_to_dataframe", _unexpected)
+    monkeypatch.setattr(tools, "summarise_player_events", _unexpected)
+    monkeypatch.setattr(tools, "summarise_team_events", _unexpected)
+
+    response = tools.summarise_match_performance(
+        1,
+        competition_id=2,
+        season_id=317,
+        top_n=0,
+        include_leaderboards=False,
+        include_team_summary=False,
+    )
+
+    assert response.metadata["player_summary"] == []
+    assert response.metadata["team_summary"] == []
+    assert response.metadata["leaderboards"] == {}
+    assert "Events analysed: 0" in response.content[0]["text"]
+
+
+def test_summarise_match_performance_without_events_skips_dataframe(monkeypatch):
+    match = _sample_match()
+    descriptor = MatchDescriptor(match_id=1, competition_id=2, season_id=317, match=match)
+    dataset = MatchDataset(descriptor=descriptor, match=match, events=[])
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("no events to flatten")
+
+    monkeypatch.setattr(tools, "fetch_match_dataset", lambda *_, **__: dataset)
+    monkeypatch.setattr(tools, "events_to_dataframe", _unexpected)
+
+    response = tools.summarise_match_performance(1, competition_id=2, season_id=317)
+
+    assert response.metadata["player_summary"] == []
+    assert response.metadata["team_summary"] == []
+    assert response.metadata["leaderboards"] == {}
+    assert "Events analysed: 0" in response.content[0]["text"]
 
 
 def test_player_season_summary_tool(monkeypatch):
@@ -441,6 +562,40 @@ def test_player_season_summary_tool_uses_resolver(monkeypatch):
     assert response.metadata["resolver"] is not None
 
 
+def test_player_season_summary_tool_resolves_once(monkeypatch):
+    resolver_calls = {"count": 0}
+
+    def fake_resolve(*_args, **_kwargs):
+        resolver_calls["count"] += 1
+        return (
+            {
+                "player_name": "Scott McTominay",
+                "team_name": "Napoli",
+                "competition_id": 12,
+                "season_label": "2024/2025",
+            },
+            [],
+        )
+
+    monkeypatch.setattr(tools, "resolve_competition_id", lambda name: 2)
+    monkeypatch.setattr(
+        tools,
+        "get_player_season_summary",
+        lambda **kwargs: {"player_name": kwargs["player_name"], "team_name": "Napoli"},
+    )
+    monkeypatch.setattr(tools, "resolve_player_current_team", fake_resolve)
+
+    response = tools.player_season_summary_tool(
+        "S. McTominay",
+        "2024/2025",
+        competition="Premier League",
+        team_name="Manchester United",
+    )
+
+    assert response.metadata["expected_team"] == "Manchester United"
+    assert resolver_calls["count"] == 1
+
+
 def test_resolve_player_current_team_tool(monkeypatch):
     best = {
         "player_name": "Bukayo Saka",
@@ -464,6 +619,7 @@ def test_resolve_player_current_team_tool(monkeypatch):
     )
 
     assert "Arsenal" in response.content[0]["text"]
+    assert "Competition name: Premier League" in response.content[0]["text"]
     assert response.metadata["best_match"]["team_name"] == "Arsenal"
 
 
@@ -487,6 +643,11 @@ def test_team_season_summary_tool(monkeypatch):
     )
 
     assert response.metadata["record"]["team_name"] == "Arsenal"
+    assert response.content[0]["text"] == (
+        "Season summary for Arsenal in 2024/2025.\n"
+        "Key metrics:\n- Goals: 70\n"
+        "Raw fields:\n- team_name=Arsenal, team_season_goals=70"
+    )
 
 
 def test_player_multi_season_summary_tool(monkeypatch):
@@ -509,6 +670,29 @@ def test_player_multi_season_summary_tool(monkeypatch):
     )
 
     assert len(response.metadata["records"]) == 2
+    assert [record["season_label"] for record in response.metadata["records"]] == [
+        "2023/2024",
+        "2024/2025",
+    ]
+
+
+def test_player_multi_season_summary_tool_reports_failing_season(monkeypatch):
+    def _summary(player_name, season_label, competition_id, **_):
+        if season_label == "2022/2023":
+            raise ValueError("no records")
+        return {"season_label": season_label, "player_name": player_name}
+
+    monkeypatch.setattr(tools, "resolve_competition_id", lambda name: 2)
+    monkeypatch.setattr(tools, "get_player_season_summary", _summary)
+
+    response = tools.player_multi_season_summary_tool(
+        "Bukayo Saka",
+        ["2023/2024", "2022/2023", "2024/2025"],
+        competition="Premier League",
+    )
+
+    assert response.metadata["season_label"] == "2022/2023"
+    assert response.metadata["error"] == "no records"
 
 
 def test_compare_player_season_summaries_tool(monkeypatch):
@@ -543,6 +727,7 @@ def test_player_report_template_tool_defaults():
     assert module["metrics_table"]["rows"][0]["metric"] == "Tackles"
     assert template["key_skill_analysis"][0]["summary"] == "[AI_GENERATED_SUMMARY_OF_SKILL_1]"
     assert response.content[0]["text"].strip().startswith("{")
+    assert json.loads(response.content[0]["text"]) == template
 
 
 def test_register_statsbomb_tools_creates_group(monkeypatch):
@@ -594,3 +779,62 @@ def test_init_session_with_statsbomb_tools(monkeypatch):
 
     assert called["project"] == "proj"
     assert result["activate"] is False
+
+
+def test_init_session_skips_repeated_named_init(monkeypatch):
+    calls = []
+
+    def fake_init(**kwargs):
+        if kwargs["studio_url"] == "http://down":
+            raise RuntimeError("studio unavailable")
+        calls.append(kwargs["project"])
+
+    monkeypatch.setattr(tools.agentscope, "init", fake_init)
+    monkeypatch.setattr(tools, "register_statsbomb_tools", lambda **kwargs: kwargs)
+
+    tools.init_session_with_statsbomb_tools(project="a", name="run")
+    tools.init_session_with_statsbomb_tools(project="a", name="run")
+    tools.init_session_with_statsbomb_tools(project="b", name="run")
+    with pytest.raises(RuntimeError):
+        tools.init_session_with_statsbomb_tools(project="b", name="run", studio_url="http://down")
+    tools.init_session_with_statsbomb_tools(project="a", name="run")
+    tools.init_session_with_statsbomb_tools(project="a")
+    tools.init_session_with_statsbomb_tools(project="a")
+
+    assert calls == ["a", "b", "a", "a", "a"]
+
+
+def test_dumps_indented_matches_json_fallback(monkeypatch):
+    payload = {"player": "Ødegaard", "club": "Arsenal", "metrics": [1, 2.5, None, True]}
+    expected = json.dumps(payload, indent=2, ensure_ascii=False)
+
+    assert tools._dumps_indented(payload) == expected
+    monkeypatch.setattr(tools, "orjson", None)
+    assert tools._dumps_indented(payload) == expected
+
+
+def test_format_rows_respects_limit():
+    rows = [{"player_name": "Saka", "goals": 3}, {"player_name": "Odegaard", "goals": None}]
+
+    assert tools._format_rows(rows, limit=0) == ""
+    assert tools._format_rows(rows, limit=-1) == ""
+    assert tools._format_rows(rows, limit=5) == "- goals=3, player_name=Saka\n- player_name=Odegaard"
+
+
+def test_summarise_metrics_uses_map_format_specs():
+    record = {
+        "player_season_minutes": 1234.6,
+        "player_season_goals": 7,
+        "player_season_goals_90": 0.5,
+        "player_season_xa": "n/a",
+        "player_season_assists": None,
+    }
+
+    text = tools._summarise_metrics(record, tools.PLAYER_SEASON_SUMMARY_MAP)
+
+    assert text.splitlines() == [
+        "- Minutes: 1235",
+        "- Total goals: 7",
+        "- Goals/90: 0.50",
+        "- xA: n/a",
+    ]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
 
 import pytest
 
+from agentspace import config
 from agentspace.agents import statsbomb_chat as chat
 
 
@@ -37,3 +39,104 @@ def test_system_prompt_includes_current_year_and_season(monkeypatch):
 def test_season_label_for_today(month, expected):
     season = chat._season_label_for_today(datetime(2024, month, 1).date())
     assert season == expected
+
+
+def test_prompt_sections_are_cached_per_season(monkeypatch):
+    chat._chat_prompt_sections.cache_clear()
+    chat._scouting_prompt_sections.cache_clear()
+
+    for hour in (9, 15):
+        target = datetime(2024, 10, 16, hour, 0, tzinfo=timezone.utc)
+
+        class DummyDateTime:
+            @classmethod
+            def now(cls, tz=None):
+                return target.astimezone(tz) if tz else target.replace(tzinfo=None)
+
+        monkeypatch.setattr(chat, "datetime", DummyDateTime)
+        prompt = chat._system_prompt()
+        scouting = chat._scouting_system_prompt()
+        assert target.astimezone().strftime("%H:%M") in prompt
+        assert "`season_name` set to 2024/2025" in prompt
+        assert "`season_name` set to 2024/2025" in scouting
+        assert prompt.endswith(chat._COMPETITION_REFERENCE)
+
+    assert chat._chat_prompt_sections.cache_info().misses == 1
+    assert chat._chat_prompt_sections.cache_info().hits == 1
+    assert chat._scouting_prompt_sections.cache_info().misses == 1
+
+
+def test_load_env_from_file_parses_and_caches(tmp_path, monkeypatch):
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        '# comment\nAGENTSPACE_TEST_A = "one"\nAGENTSPACE_TEST_B=two=2\nnot an assignment\nAGENTSPACE_TEST_A=again\n'
+    )
+    monkeypatch.delenv("AGENTSPACE_TEST_A", raising=False)
+    monkeypatch.setenv("AGENTSPACE_TEST_B", "preset")
+    config._parse_env_file.cache_clear()
+
+    config._load_env_from_file(env_path)
+    config._load_env_from_file(env_path)
+    config._load_env_from_file(tmp_path / "missing.env")
+
+    assert os.environ["AGENTSPACE_TEST_A"] == "one"
+    assert os.environ["AGENTSPACE_TEST_B"] == "preset"
+    assert config._parse_env_file.cache_info().misses == 1
+    assert config._parse_env_file(str(env_path), env_path.stat().st_mtime_ns) == (
+        ("AGENTSPACE_TEST_A", "one"),
+        ("AGENTSPACE_TEST_B", "two=2"),
+        ("AGENTSPACE_TEST_A", "again"),
+    )
+
+
+def test_prompt_clock_is_cached_per_minute(monkeypatch):
+    moments = iter(
+        [
+            datetime(2024, 10, 16, 12, 0, 5, tzinfo=timezone.utc),
+            datetime(2024, 10, 16, 12, 0, 55, tzinfo=timezone.utc),
+            datetime(2024, 10, 16, 12, 1, 0, tzinfo=timezone.utc),
+        ]
+    )
+
+    class DummyDateTime:
+        @classmethod
+        def now(cls, tz=None):
+            return next(moments).astimezone(tz)
+
+    monkeypatch.setattr(chat, "datetime", DummyDateTime)
+    chat._minute_context.cache_clear()
+
+    first = chat._prompt_clock()
+    second = chat._prompt_clock()
+    third = chat._prompt_clock()
+
+    assert first is second
+    assert third != first
+    assert first[1:] == (2024, "2024/2025")
+    assert chat._minute_context.cache_info().misses == 2
+
+
+def test_prompts_share_one_competition_reference():
+    chat_prompt = chat._system_prompt()
+    scouting_prompt = chat._scouting_system_prompt()
+
+    for prompt in (chat_prompt, scouting_prompt):
+        assert prompt.endswith(chat._COMPETITION_REFERENCE)
+        assert prompt.count("Competition reference (hard-coded):") == 1
+
+
+def test_api_settings_and_chat_share_one_env_parse(tmp_path, monkeypatch):
+    env_path = tmp_path / ".env"
+    env_path.write_text("AGENTSPACE_TEST_SHARED=yes\n")
+    monkeypatch.delenv("AGENTSPACE_TEST_SHARED", raising=False)
+    monkeypatch.setenv("AGENTSPACE_ENV_FILE", str(env_path))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "_ENV_LOADED", False)
+    config._parse_env_file.cache_clear()
+
+    config._ensure_env_loaded()
+    chat._load_env_from_file(env_path)
+
+    assert os.environ["AGENTSPACE_TEST_SHARED"] == "yes"
+    assert chat._load_env_from_file is config._load_env_from_file
+    assert config._parse_env_file.cache_info().hits >= 1
@@ -4,6 +4,11 @@ Tests for Agentspace chat agent configuration helpers.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
 from typing import Any, Dict
 
 import pytest
@@ -32,7 +37,7 @@ def test_build_toolkit_resolves_studio_and_tracing(monkeypatch: pytest.MonkeyPat
     """
 
     captured: Dict[str, Any] = {}
-    dummy_toolkit = object()
+    dummy_toolkit = SimpleNamespace(groups={}, tools={})
 
     def fake_init_session_with_statsbomb_tools(**kwargs: Any) -> object:
         captured.update(kwargs)
@@ -51,12 +56,10 @@ def test_build_toolkit_resolves_studio_and_tracing(monkeypatch: pytest.MonkeyPat
         "init_session_with_statsbomb_tools",
         fake_init_session_with_statsbomb_tools,
     )
-    monkeypatch.setattr(statsbomb_chat, "register_statsbomb_online_index_tools", passthrough)
     monkeypatch.setattr(statsbomb_chat, "register_statsbomb_index_tools", passthrough)
     monkeypatch.setattr(statsbomb_chat, "register_offline_index_tools", passthrough)
-    monkeypatch.setattr(statsbomb_chat, "register_wyscout_tools", passthrough)
-    monkeypatch.setattr(statsbomb_chat, "register_statsbomb_viz_tools", passthrough)
-    monkeypatch.setattr(statsbomb_chat, "register_web_search_tools", passthrough)
+    monkeypatch.setattr(statsbomb_chat, "register_ranking_tools", passthrough)
+    monkeypatch.setattr(statsbomb_chat, "_register_tool_discovery", lambda toolkit: register_calls.append("discover"))
 
     monkeypatch.setenv("AGENTSPACE_STUDIO_URL", " http://studio.local ")
     monkeypatch.setenv("AGENTSCOPE_TRACING_URL", "http://trace.local")
@@ -67,7 +70,8 @@ def test_build_toolkit_resolves_studio_and_tracing(monkeypatch: pytest.MonkeyPat
     assert captured["studio_url"] == "http://studio.local"
     assert captured["tracing_url"] == "http://trace.local"
     assert "offline-index" in register_calls
-    assert "statsbomb-viz" in register_calls
+    assert "discover" in register_calls
+    assert "statsbomb-viz" not in register_calls
 
     captured.clear()
     register_calls.clear()
@@ -83,7 +87,58 @@ def test_build_toolkit_resolves_studio_and_tracing(monkeypatch: pytest.MonkeyPat
     assert captured["studio_url"] == "https://override"
     assert captured["tracing_url"] == "https://trace-override"
     assert "offline-index" in register_calls
-    assert "statsbomb-viz" in register_calls
+    assert "discover" in register_calls
+    assert "statsbomb-viz" not in register_calls
+
+
+def test_build_toolkit_skips_groups_already_registered(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    _build_toolkit should not register core groups or discovery twice on a reused toolkit.
+    """
+
+    reused = SimpleNamespace(
+        groups={"offline-index": None, "season-rankings": None},
+        tools={"discover_tools_tool": None},
+    )
+    register_calls: list[str] = []
+
+    def passthrough(toolkit: object, **kwargs: Any) -> object:
+        register_calls.append(kwargs["group_name"])
+        return toolkit
+
+    monkeypatch.setattr(statsbomb_chat, "init_session_with_statsbomb_tools", lambda **_: reused)
+    monkeypatch.setattr(statsbomb_chat, "register_statsbomb_index_tools", passthrough)
+    monkeypatch.setattr(statsbomb_chat, "register_offline_index_tools", passthrough)
+    monkeypatch.setattr(statsbomb_chat, "register_ranking_tools", passthrough)
+    monkeypatch.setattr(statsbomb_chat, "_register_tool_discovery", lambda toolkit: register_calls.append("discover"))
+
+    assert statsbomb_chat._build_toolkit(project=None, activate_tool_group=True) is reused
+    assert register_calls == ["statsbomb-index"]
+
+
+def test_discover_tools_tool_registers_lazy_group() -> None:
+    """
+    discover_tools_tool should import and register a lazy group on first use.
+    """
+
+    from agentscope.tool import Toolkit
+
+    toolkit = Toolkit()
+    statsbomb_chat._register_tool_discovery(toolkit)
+    discover = toolkit.tools["discover_tools_tool"].original_func
+
+    assert "web" not in toolkit.groups
+    response = discover("web")
+    assert response.metadata["tools"] == ["web_search"]
+    assert toolkit.groups["web"].active
+
+    toolkit.update_tool_groups(["web"], active=False)
+    assert discover("web").metadata["tools"] == ["web_search"]
+    assert toolkit.groups["web"].active
+
+    unknown = discover("nope")
+    assert unknown.metadata["tools"] == []
+    assert "Unknown tool group" in unknown.content[0]["text"]
 
 
 def test_build_chat_agent_uses_plan_max_subtasks(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -142,3 +197,470 @@ def test_build_scouting_agent_uses_plan_max_subtasks(monkeypatch: pytest.MonkeyP
     assert captured["max_subtasks"] == [6]
     assert isinstance(captured["agent_kwargs"]["plan_notebook"], DummyPlanNotebook)
     assert captured["agent_kwargs"]["max_iters"] == 6
+
+
+def test_prepare_environment_runs_once_per_path(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """
+    _prepare_environment should load .env and check credentials only once.
+    """
+
+    calls: list[str] = []
+    monkeypatch.setattr(statsbomb_chat, "_ENV_STATE", {"loaded_path": None, "creds_checked": False})
+    monkeypatch.setattr(statsbomb_chat, "_load_env_from_file", lambda path: calls.append(f"load:{path.name}"))
+
+    def failing_credentials() -> None:
+        calls.append("creds")
+        raise RuntimeError("missing")
+
+    monkeypatch.setattr(statsbomb_chat, "_ensure_credentials", failing_credentials)
+    with pytest.raises(RuntimeError):
+        statsbomb_chat._prepare_environment(tmp_path / ".env")
+
+    monkeypatch.setattr(statsbomb_chat, "_ensure_credentials", lambda: calls.append("creds"))
+    statsbomb_chat._prepare_environment(tmp_path / ".env")
+    statsbomb_chat._prepare_environment(tmp_path / ".env")
+    statsbomb_chat._prepare_environment(tmp_path / "other.env")
+
+    assert calls == ["load:.env", "creds", "creds", "load:other.env"]
+
+
+@pytest.mark.parametrize(
+    ("model", "provider", "expected"),
+    [
+        ("Sonnet", None, ("anthropic", "claude-sonnet-4-20250514")),
+        ("opus", "anthropic", ("anthropic", "claude-3-opus-20240229")),
+        ("gpt-4o-mini", "OpenAI", ("openai", "gpt-4o-mini")),
+    ],
+)
+def test_resolve_provider_and_model_aliases(model: str, provider: str | None, expected: tuple[str, str]) -> None:
+    assert statsbomb_chat._resolve_provider_and_model(model=model, provider=provider) == expected
+
+
+def test_resolve_provider_and_model_rejects_unknown_provider() -> None:
+    with pytest.raises(ValueError):
+        statsbomb_chat._resolve_provider_and_model(model="gpt-4o", provider="mystery")
+
+
+def test_chat_reuses_background_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    chat() should run dialogues on one persistent loop; achat() on the caller's loop.
+    """
+
+    loops: list[object] = []
+
+    class DummyReply:
+        def __init__(self, text: str) -> None:
+            self._text = text
+
+        def get_text_content(self) -> str:
+            return self._text
+
+    class DummyMemory:
+        async def clear(self) -> None:
+            pass
+
+    class DummyAgent:
+        memory = DummyMemory()
+        plan_notebook = None
+
+        async def reply(self, msg: Any) -> DummyReply:
+            loops.append(asyncio.get_running_loop())
+            if msg.content == "boom":
+                raise RuntimeError("failed")
+            return DummyReply(f"echo {msg.content}")
+
+    monkeypatch.setattr(statsbomb_chat, "_CHAT_AGENTS", OrderedDict())
+    monkeypatch.setattr(statsbomb_chat, "build_chat_agent", lambda **_: DummyAgent())
+
+    assert statsbomb_chat.chat(["a", "b"]) == ["echo a", "echo b"]
+    assert statsbomb_chat.chat(["boom", "never"]) == ["Agent execution error: failed"]
+    assert len(set(map(id, loops))) == 1
+    assert loops[0] is statsbomb_chat._dialog_loop()
+
+    assert asyncio.run(statsbomb_chat.achat(["c"])) == ["echo c"]
+    assert loops[-1] is not loops[0]
+
+
+def test_chat_reuses_idle_agent_and_resets_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    chat() should reuse a cached agent, clearing its conversation between dialogues.
+    """
+
+    built: list[object] = []
+    cleared: list[object] = []
+
+    class DummyMemory:
+        def __init__(self) -> None:
+            self.items: list[str] = []
+
+        async def clear(self) -> None:
+            cleared.append(self)
+            self.items.clear()
+
+    class DummyPlanNotebook:
+        current_plan: object | None = None
+
+    class DummyReply:
+        def __init__(self, text: str) -> None:
+            self._text = text
+
+        def get_text_content(self) -> str:
+            return self._text
+
+    class DummyAgent:
+        def __init__(self) -> None:
+            self.memory = DummyMemory()
+            self.plan_notebook = DummyPlanNotebook()
+
+        async def reply(self, msg: Any) -> DummyReply:
+            self.memory.items.append(msg.content)
+            self.plan_notebook.current_plan = object()
+            return DummyReply(",".join(self.memory.items))
+
+    def build(**_: Any) -> DummyAgent:
+        agent = DummyAgent()
+        built.append(agent)
+        return agent
+
+    monkeypatch.setattr(statsbomb_chat, "_CHAT_AGENTS", OrderedDict())
+    monkeypatch.setattr(statsbomb_chat, "build_chat_agent", build)
+
+    assert statsbomb_chat.chat(["a", "b"]) == ["a", "a,b"]
+    assert statsbomb_chat.chat(["c"]) == ["c"]
+    assert statsbomb_chat.chat(["d"], model="other") == ["d"]
+    assert len(built) == 2
+    assert cleared.count(built[0].memory) == 2
+
+    loop = statsbomb_chat._dialog_loop()
+    agent, lock = statsbomb_chat._checkout_chat_agent(
+        loop,
+        project="statsbomb-chat",
+        model=None,
+        provider=None,
+        openai_api_key=None,
+        studio_url=None,
+        tracing_url=None,
+    )
+    assert agent is built[0]
+    busy_agent, busy_lock = statsbomb_chat._checkout_chat_agent(
+        loop,
+        project="statsbomb-chat",
+        model=None,
+        provider=None,
+        openai_api_key=None,
+        studio_url=None,
+        tracing_url=None,
+    )
+    assert busy_agent is not agent
+    lock.release()
+    busy_lock.release()
+
+    assert asyncio.run(statsbomb_chat.achat(["e"])) == ["e"]
+    assert asyncio.run(statsbomb_chat.achat(["f"])) == ["f"]
+    # Each asyncio.run loop gets its own agent; closed loops are dropped on the next checkout,
+    # leaving only the most recent one.
+    assert len(built) == 5
+    assert sum(key[0].is_closed() for key in statsbomb_chat._CHAT_AGENTS) == 1
+
+
+def test_build_toolkit_studio_fallback_only_with_urls(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Without Studio/tracing URLs the session is created directly; with them a
+    Studio failure falls back to an untraced session.
+    """
+
+    from requests.exceptions import ConnectionError as RequestsConnectionError
+
+    calls: list[Dict[str, Any]] = []
+
+    def fake_init_session_with_statsbomb_tools(**kwargs: Any) -> object:
+        calls.append(kwargs)
+        if kwargs["studio_url"]:
+            raise RequestsConnectionError("studio down")
+        return SimpleNamespace(groups={}, tools={})
+
+    monkeypatch.setattr(statsbomb_chat, "init_session_with_statsbomb_tools", fake_init_session_with_statsbomb_tools)
+    for name in ("register_statsbomb_index_tools", "register_offline_index_tools", "register_ranking_tools"):
+        monkeypatch.setattr(statsbomb_chat, name, lambda toolkit, **_: toolkit)
+    monkeypatch.setattr(statsbomb_chat, "_register_tool_discovery", lambda toolkit: None)
+
+    statsbomb_chat._build_toolkit(project=None, activate_tool_group=True)
+    assert [(call["studio_url"], call["tracing_url"]) for call in calls] == [(None, None)]
+
+    calls.clear()
+    statsbomb_chat._build_toolkit(
+        project=None,
+        activate_tool_group=True,
+        studio_url="http://studio.local",
+        tracing_url="http://trace.local",
+    )
+    assert [(call["studio_url"], call["tracing_url"]) for call in calls] == [
+        ("http://studio.local", "http://trace.local"),
+        (None, "http://trace.local"),
+    ]
+
+
+def test_chat_batch_answers_prompts_concurrently_with_a_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    chat_batch() should run independent prompts on separate agents, bounded by max_concurrent.
+    """
+
+    active: list[int] = [0]
+    peak: list[int] = [0]
+
+    class DummyReply:
+        def __init__(self, text: str) -> None:
+            self._text = text
+
+        def get_text_content(self) -> str:
+            return self._text
+
+    class DummyMemory:
+        async def clear(self) -> None:
+            pass
+
+    class DummyAgent:
+        memory = DummyMemory()
+        plan_notebook = None
+
+        async def reply(self, msg: Any) -> DummyReply:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            return DummyReply(f"echo {msg.content}")
+
+    def build(**kwargs: Any) -> DummyAgent:
+        if kwargs["model"] == "broken":
+            raise RuntimeError("no credentials")
+        return DummyAgent()
+
+    monkeypatch.setattr(statsbomb_chat, "_CHAT_AGENTS", OrderedDict())
+    monkeypatch.setattr(statsbomb_chat, "build_chat_agent", build)
+
+    prompts = [f"q{index}" for index in range(5)]
+    results = asyncio.run(statsbomb_chat.chat_batch(prompts, max_concurrent=2))
+    assert results == [f"echo {prompt}" for prompt in prompts]
+    assert peak[0] == 2
+
+    [error] = asyncio.run(statsbomb_chat.chat_batch(["q"], model="broken"))
+    assert isinstance(error, RuntimeError)
+
+    with pytest.raises(ValueError):
+        asyncio.run(statsbomb_chat.chat_batch(prompts, max_concurrent=0))
+
+
+def test_chat_batch_builds_agents_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    building: list[int] = [0]
+    peak: list[int] = [0]
+    guard = threading.Lock()
+
+    class DummyReply:
+        def get_text_content(self) -> str:
+            return "ok"
+
+    class DummyMemory:
+        async def clear(self) -> None:
+            pass
+
+    class DummyAgent:
+        memory = DummyMemory()
+        plan_notebook = None
+
+        async def reply(self, msg: Any) -> DummyReply:
+            return DummyReply()
+
+    def slow_build(**_: Any) -> DummyAgent:
+        with guard:
+            building[0] += 1
+            peak[0] = max(peak[0], building[0])
+        time.sleep(0.05)
+        with guard:
+            building[0] -= 1
+        return DummyAgent()
+
+    monkeypatch.setattr(statsbomb_chat, "_CHAT_AGENTS", OrderedDict())
+    monkeypatch.setattr(statsbomb_chat, "build_chat_agent", slow_build)
+
+    assert asyncio.run(statsbomb_chat.chat_batch(["a", "b", "c"], max_concurrent=3)) == ["ok"] * 3
+    assert peak[0] > 1
+
+
+def test_chat_stream_yields_text_deltas(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    chat_stream() should forward only new assistant text as the agent prints it.
+    """
+
+    from copy import deepcopy
+
+    from agentscope.message import Msg
+
+    console: list[bool] = []
+
+    class DummyMemory:
+        async def clear(self) -> None:
+            pass
+
+    class DummyAgent:
+        memory = DummyMemory()
+        plan_notebook = None
+        queue: asyncio.Queue | None = None
+
+        def set_msg_queue_enabled(self, enabled: bool, queue: asyncio.Queue | None = None) -> None:
+            self.queue = queue if enabled else None
+
+        def set_console_output_enabled(self, enabled: bool) -> None:
+            console.append(enabled)
+
+        async def _print(self, msg: Msg, last: bool) -> None:
+            await self.queue.put((deepcopy(msg), last, None))
+
+        async def reply(self, msg: Any) -> Msg:
+            if msg.content == "boom":
+                raise RuntimeError("failed")
+            thinking = Msg("statsbomb-analyst", "Checking", "assistant")
+            await self._print(thinking, True)
+            await self._print(Msg("system", "tool output", "system"), True)
+            answer = Msg("statsbomb-analyst", "Ars", "assistant")
+            await self._print(answer, False)
+            answer.content = "Arsenal won"
+            await self._print(answer, True)
+            return answer
+
+    agent = DummyAgent()
+    monkeypatch.setattr(statsbomb_chat, "_CHAT_AGENTS", OrderedDict())
+    monkeypatch.setattr(statsbomb_chat, "build_chat_agent", lambda **_: agent)
+
+    async def collect(messages: list[str]) -> list[str]:
+        return [chunk async for chunk in statsbomb_chat.chat_stream(messages)]
+
+    chunks = asyncio.run(collect(["a", "boom", "never"]))
+
+    assert chunks == ["Checking", "\n", "Ars", "enal won", "\n\n", "Agent execution error: failed"]
+    assert console == [False, True]
+    assert agent.queue is None
+    assert asyncio.run(collect(["b"])) == ["Checking", "\n", "Ars", "enal won"]
+
+
+def test_chat_stream_releases_agent_on_early_break(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Leaving ``async with chat_stream(...)`` mid-stream should return the agent to the cache.
+    """
+
+    from agentscope.message import Msg
+
+    built: list[object] = []
+
+    class DummyMemory:
+        async def clear(self) -> None:
+            pass
+
+    class DummyAgent:
+        memory = DummyMemory()
+        plan_notebook = None
+        queue: asyncio.Queue | None = None
+
+        def set_msg_queue_enabled(self, enabled: bool, queue: asyncio.Queue | None = None) -> None:
+            self.queue = queue if enabled else None
+
+        def set_console_output_enabled(self, enabled: bool) -> None:
+            pass
+
+        async def reply(self, msg: Any) -> Msg:
+            answer = Msg("statsbomb-analyst", "first", "assistant")
+            await self.queue.put((answer, True, None))
+            second = Msg("statsbomb-analyst", "second", "assistant")
+            await self.queue.put((second, True, None))
+            return second
+
+    def build(**_: Any) -> DummyAgent:
+        built.append(DummyAgent())
+        return built[-1]
+
+    monkeypatch.setattr(statsbomb_chat, "_CHAT_AGENTS", OrderedDict())
+    monkeypatch.setattr(statsbomb_chat, "build_chat_agent", build)
+
+    async def first_chunk() -> str:
+        async with statsbomb_chat.chat_stream(["a"]) as stream:
+            async for chunk in stream:
+                return chunk
+        return ""
+
+    async def run_twice() -> list[str]:
+        return [await first_chunk(), await first_chunk()]
+
+    assert asyncio.run(run_twice()) == ["first", "first"]
+    assert len(built) == 1
+    assert built[0].queue is None
+
+
+def test_invalidate_chat_agent_cache_forces_rebuild(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[object] = []
+
+    class DummyReply:
+        def get_text_content(self) -> str:
+            return "ok"
+
+    class DummyMemory:
+        async def clear(self) -> None:
+            pass
+
+    class DummyAgent:
+        memory = DummyMemory()
+        plan_notebook = None
+
+        async def reply(self, msg: Any) -> DummyReply:
+            return DummyReply()
+
+    def build(**_: Any) -> DummyAgent:
+        built.append(DummyAgent())
+        return built[-1]
+
+    monkeypatch.setattr(statsbomb_chat, "_CHAT_AGENTS", OrderedDict())
+    monkeypatch.setattr(statsbomb_chat, "build_chat_agent", build)
+
+    statsbomb_chat.chat(["a"])
+    statsbomb_chat.chat(["b"])
+    statsbomb_chat.invalidate_chat_agent_cache()
+    statsbomb_chat.chat(["c"])
+
+    assert len(built) == 2
+
+
+def test_chat_agent_cache_keys_on_api_key_and_evicts_lru(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[object] = []
+
+    class DummyReply:
+        def get_text_content(self) -> str:
+            return "ok"
+
+    class DummyMemory:
+        async def clear(self) -> None:
+            pass
+
+    class DummyAgent:
+        memory = DummyMemory()
+        plan_notebook = None
+
+        async def reply(self, msg: Any) -> DummyReply:
+            return DummyReply()
+
+    def build(**_: Any) -> DummyAgent:
+        built.append(DummyAgent())
+        return built[-1]
+
+    monkeypatch.setattr(statsbomb_chat, "_CHAT_AGENTS", OrderedDict())
+    monkeypatch.setattr(statsbomb_chat, "_CHAT_AGENTS_SIZE", 2)
+    monkeypatch.setattr(statsbomb_chat, "build_chat_agent", build)
+
+    statsbomb_chat.chat(["a"], openai_api_key="sk-one")
+    statsbomb_chat.chat(["a"], openai_api_key="sk-two")
+    statsbomb_chat.chat(["a"], openai_api_key="sk-one")
+    assert len(built) == 2
+    assert all("sk-" not in repr(key) for key in statsbomb_chat._CHAT_AGENTS)
+
+    statsbomb_chat.chat(["a"], openai_api_key="sk-three")
+    statsbomb_chat.chat(["a"], openai_api_key="sk-two")
+
+    assert len(built) == 4
+    assert len(statsbomb_chat._CHAT_AGENTS) == 2
@@ -160,6 +160,9 @@ def test_events_to_dataframe_and_player_summary():
     assert rice["tackles_won"] == 1
     assert rice["interceptions"] == 1
     assert rice["ball_recoveries"] == 1
+    assert rice["pass_accuracy"] == 0.0
+    assert rice["shot_accuracy"] == 0.0
+    assert martinelli["shot_accuracy"] == 1.0
 
 
 def test_team_summary_and_leaderboards():
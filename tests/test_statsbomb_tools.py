@@ -106,6 +106,36 @@ def test_apply_filters_supports_game_state_and_zone():
     assert [ctx.event["id"] for ctx in within_ten_minutes] == [1]
 
 
+def test_event_filters_from_options_freezes_sequences():
+    player_names = ["Bukayo Saka"]
+    filters = EventFilters.from_options(
+        event_types=player_names[:0],
+        team_names="Arsenal",
+        player_names=player_names,
+        zone="final_third",
+    )
+
+    assert filters.event_types is None
+    assert filters.team_names == ("Arsenal",)
+    assert filters.player_names == ("Bukayo Saka",)
+    assert filters.zone == "final_third"
+    hash(filters)
+
+
+def test_match_dataset_exposes_typed_header():
+    match = _sample_match()
+    dataset = tools.MatchDataset(
+        descriptor=tools.MatchDescriptor(match_id=1, competition_id=2, season_id=317, match=match),
+        match=match,
+        events=[],
+    )
+
+    assert dataset.header.home_team_name == match["home_team"]["home_team_name"]
+    assert dataset.header.away_team_name == match["away_team"]["away_team_name"]
+    assert dataset.header.to_dict()["match_date"] == match.get("match_date")
+    assert tools.MatchHeader.from_match(None) == tools.MatchHeader()
+
+
 def test_list_matches_returns_empty_on_missing():
     class DummyClient:
         def list_matches(self, *_args, **_kwargs):
@@ -525,6 +555,38 @@ def test_fetch_team_season_stats_data_sort(monkeypatch):
     assert result == [{"team_name": "Arsenal"}]
 
 
+def test_fetch_team_season_stats_data_top_n_matches_full_sort(monkeypatch):
+    rows = [
+        {"team_name": "Arsenal", "team_season_goals": 70},
+        {"team_name": "Brentford", "team_season_goals": 50},
+        {"team_name": "Chelsea", "team_season_goals": 70},
+        {"team_name": "Everton", "team_season_goals": None},
+        {"team_name": "Fulham", "team_season_goals": 50},
+    ]
+
+    class DummyClient:
+        def get_team_season_stats(self, *_, **__):
+            return [dict(row) for row in rows]
+
+    monkeypatch.setattr(tools, "get_statsbomb_client", lambda: DummyClient())
+
+    for descending in (True, False):
+        for top_n in range(len(rows) + 1):
+            expected = sorted(
+                rows,
+                key=lambda row: tools._to_float(row["team_season_goals"]),
+                reverse=descending,
+            )[:top_n]
+            result = tools.fetch_team_season_stats_data(
+                2,
+                317,
+                sort_by="team_season_goals",
+                descending=descending,
+                top_n=top_n,
+            )
+            assert result == expected
+
+
 def test_fetch_player_match_stats_data_filters(monkeypatch):
     rows = [
         {"player_name": "Bukayo Saka", "team_name": "Arsenal", "stat": 1},
@@ -822,6 +884,56 @@ def test_get_players_season_summary(monkeypatch):
     assert missing == []
 
 
+def test_get_players_season_summary_loads_season_once(monkeypatch):
+    rows = [
+        {"player_name": "Bukayo Saka", "team_name": "Arsenal", "player_season_minutes": 900},
+        {"player_name": "Gabriel Jesus", "team_name": "Arsenal", "player_season_minutes": 800},
+    ]
+    calls = []
+
+    monkeypatch.setattr(
+        tools,
+        "season_id_for_label",
+        lambda competition_id, season_label, use_cache=True: 317,
+    )
+
+    class DummyClient:
+        def get_player_season_stats(self, *_, **__):
+            calls.append(1)
+            return rows
+
+    monkeypatch.setattr(tools, "get_statsbomb_client", lambda: DummyClient())
+
+    summaries, missing = get_players_season_summary(
+        player_names=["Saka", "Cole Palmer"],
+        season_label="2024/2025",
+        competition_id=2,
+    )
+
+    assert calls == [1]
+    assert summaries["Saka"]["player_name"] == "Bukayo Saka"
+    assert missing == ["Cole Palmer"]
+
+
+def test_fetch_player_events_for_matches_preserves_order(monkeypatch):
+    match = _sample_match()
+    descriptors = [
+        MatchDescriptor(match_id=match_id, competition_id=2, season_id=317)
+        for match_id in (3, 1, 2)
+    ]
+    monkeypatch.setattr(tools, "get_statsbomb_client", lambda: object())
+    monkeypatch.setattr(
+        tools,
+        "fetch_match_dataset",
+        lambda descriptor, **_: MatchDataset(descriptor, match, []),
+    )
+
+    datasets = tools.fetch_player_events_for_matches(descriptors, player_name="Bukayo Saka")
+
+    assert list(datasets) == [3, 1, 2]
+    assert datasets[1].descriptor.match_id == 1
+
+
 def test_count_player_passes_by_body_part(monkeypatch):
     match = _sample_match()
     descriptor1 = MatchDescriptor(match_id=1, competition_id=2, season_id=317)
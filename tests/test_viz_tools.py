@@ -8,12 +8,22 @@ from pathlib import Path
 
 import pytest
 
-from agentscope.tool import ToolResponse
+from agentscope.tool import Toolkit, ToolResponse
 
+from agentspace.agent_tools import images
 from agentspace.agent_tools import viz as viz_tools
 from agentspace.analytics.mplsoccer_viz import HeatmapResult, ShotMapResult, PassNetworkResult
 
 
+@pytest.fixture(autouse=True)
+def _clear_dataset_cache():
+    viz_tools._DATASET_CACHE.clear()
+    images.clear_encoded_image_cache()
+    yield
+    viz_tools._DATASET_CACHE.clear()
+    images.clear_encoded_image_cache()
+
+
 def test_plot_match_shot_map_tool(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     dummy_dataset = object()
     output_path = tmp_path / "shot.png"
@@ -51,6 +61,8 @@ def test_plot_match_shot_map_tool(monkeypatch: pytest.MonkeyPatch, tmp_path: Pat
     assert response.metadata["image_path"] == str(output_path)
     assert response.metadata["total_shots"] == 10
     assert response.metadata["opponent_shots"] == 8
+    assert "image_data" not in response.metadata
+    assert response.metadata["images"][0]["data"] == response.content[1]["source"]["data"]
     assert response.content[1]["type"] == "image"
     assert response.content[1]["source"]["type"] == "base64"
 
@@ -137,3 +149,81 @@ def test_plot_match_shot_map_tool_handles_errors(monkeypatch: pytest.MonkeyPatch
 
     assert "Failed to render shot map" in response.content[0]["text"]
     assert response.metadata["error"].startswith("Failed to render shot map")
+
+
+def test_encode_image_file_reencodes_when_file_changes(tmp_path: Path) -> None:
+    image_path = tmp_path / "plot.png"
+    image_path.write_bytes(b"first")
+    first = images.encode_image_file(image_path)
+
+    assert first == "Zmlyc3Q="
+    assert images.encode_image_file(image_path) is first
+
+    image_path.write_bytes(b"second!")
+    assert images.encode_image_file(image_path) == "c2Vjb25kIQ=="
+
+
+def test_encode_image_file_cache_is_bounded_by_size(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(images, "_ENCODED_CACHE_MAX_CHARS", 16)
+    small, other, large = tmp_path / "small.png", tmp_path / "other.png", tmp_path / "large.png"
+    small.write_bytes(b"1234567")
+    other.write_bytes(b"abcdefg")
+    large.write_bytes(b"x" * 32)
+
+    images.encode_image_file(small)
+    images.encode_image_file(other)
+    assert [key[0] for key in images._ENCODED_CACHE] == [str(other)]
+
+    images.encode_image_file(large)
+    assert [key[0] for key in images._ENCODED_CACHE] == [str(other)]
+
+
+def test_viz_tools_share_match_dataset(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def fake_fetch(descriptor, **kwargs):
+        calls.append((descriptor.match_id, kwargs["use_cache"]))
+        return object()
+
+    monkeypatch.setattr(viz_tools, "fetch_match_dataset", fake_fetch)
+
+    first = viz_tools._match_dataset(7, 2, 281, True)
+    assert viz_tools._match_dataset(7, 2, 281, True) is first
+    viz_tools._match_dataset(7, 2, 281, False)
+
+    assert calls == [(7, True), (7, False)]
+
+
+def test_viz_dataset_cache_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    now = [1000.0]
+
+    def fake_fetch(descriptor, **kwargs):
+        calls.append(descriptor.match_id)
+        return object()
+
+    monkeypatch.setattr(viz_tools, "fetch_match_dataset", fake_fetch)
+    monkeypatch.setattr(viz_tools.time, "monotonic", lambda: now[0])
+
+    first = viz_tools._match_dataset(7, 2, 281, True)
+    now[0] += viz_tools._DATASET_CACHE_TTL + 1
+    assert viz_tools._match_dataset(7, 2, 281, True) is not first
+
+    assert calls == [7, 7]
+
+
+def test_register_statsbomb_viz_tools_activates_existing_group() -> None:
+    toolkit = Toolkit()
+    toolkit.create_tool_group("statsbomb-viz", description="existing", active=False)
+
+    toolkit = viz_tools.register_statsbomb_viz_tools(toolkit)
+
+    assert toolkit.groups["statsbomb-viz"].active is True
+    assert "plot_pass_network_tool" in toolkit.tools
+
+
+def test_image_payload_prefers_rendered_bytes(tmp_path: Path) -> None:
+    block, meta = viz_tools._image_payload(tmp_path / "missing.png", png_bytes=b"png")
+
+    assert meta["data"] == "cG5n"
+    assert block["source"]["data"] == "cG5n"
@@ -0,0 +1,100 @@
+"""
+Tests for the lightweight web search tool.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from agentscope.tool import Toolkit
+
+from agentspace.agent_tools import web_search as web_search_tools
+
+
+class _FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    web_search_tools._RESULT_CACHE.clear()
+    yield
+    web_search_tools._RESULT_CACHE.clear()
+
+
+def test_web_search_caches_identical_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def fake_get(url, timeout):
+        calls.append(url)
+        return _FakeResponse("<p>Bukayo&nbsp;Saka</p>   <b>Arsenal</b>")
+
+    monkeypatch.setattr(web_search_tools._SESSION, "get", fake_get)
+
+    first = web_search_tools.web_search("saka")
+    second = web_search_tools.web_search("saka")
+
+    assert first.metadata["results"] == "Bukayo Saka Arsenal"
+    assert second.metadata["results"] == first.metadata["results"]
+    assert len(calls) == 1
+
+
+def test_web_search_cache_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    monkeypatch.setattr(
+        web_search_tools._SESSION,
+        "get",
+        lambda url, timeout: calls.append(url) or _FakeResponse("result"),
+    )
+    monkeypatch.setattr(web_search_tools, "_RESULT_CACHE_TTL", -1.0)
+
+    web_search_tools.web_search("saka")
+    web_search_tools.web_search("saka")
+
+    assert len(calls) == 2
+
+
+def test_clean_excerpt_matches_full_clean() -> None:
+    body = "<div class='result'>Arsenal&amp;Chelsea</div>\n  " * 400
+
+    for max_chars in (10, 50, 200, 5000):
+        assert web_search_tools._clean_excerpt(body, max_chars) == (
+            web_search_tools._clean_text(body)[:max_chars]
+        )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "x" * 50 + " &lt; " + "word " * 3000 + ">" + " tail",
+        "Saka &amp; Odegaard " * 200 + "<b" + " more" * 2000 + ">" + " end",
+        "lead " * 170 + "&lt" + "b class='x'" + " filler" * 500 + "&gt; after",
+        "&lt;i&gt;Rice&lt;/i&gt; &nbsp; scores\n\t" * 300,
+    ],
+)
+def test_clean_excerpt_matches_full_clean_past_the_window(body: str) -> None:
+    for max_chars in (20, 100, 400):
+        assert len(body) > max_chars * web_search_tools._RAW_WINDOW_FACTOR
+        assert web_search_tools._clean_excerpt(body, max_chars) == (
+            web_search_tools._clean_text(body)[:max_chars]
+        )
+
+
+def test_clean_excerpt_falls_back_when_prefix_is_mostly_markup() -> None:
+    body = "<span class='x'></span>" * 200 + "Saka scores"
+
+    assert web_search_tools._clean_excerpt(body, 20) == "Saka scores"
+
+
+def test_register_web_search_tools_reuses_existing_group() -> None:
+    toolkit = Toolkit()
+    toolkit.create_tool_group("web", description="existing", active=True)
+
+    toolkit = web_search_tools.register_web_search_tools(toolkit)
+
+    assert toolkit.groups["web"].description == "existing"
+    assert "web_search" in toolkit.tools
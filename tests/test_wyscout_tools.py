@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import pytest
 from agentscope.tool import Toolkit
 
 from agentspace.agent_tools import wyscout as wyscout_tools
 from agentspace.services import data_fetch
 
 
+@pytest.fixture(autouse=True)
+def _clear_wyscout_memos():
+    wyscout_tools._AREA_CACHE.clear()
+    yield
+    wyscout_tools._AREA_CACHE.clear()
+
+
 class DummyClient:
     def __init__(
         self,
@@ -91,6 +99,16 @@ def test_register_wyscout_tools():
         assert expected in names
 
 
+def test_register_wyscout_tools_reuses_existing_group():
+    toolkit = Toolkit()
+    toolkit.create_tool_group("wyscout", description="existing", active=True)
+
+    toolkit = wyscout_tools.register_wyscout_tools(toolkit)
+
+    assert toolkit.groups["wyscout"].description == "existing"
+    assert "list_wyscout_areas" in toolkit.tools
+
+
 def test_list_wyscout_areas(monkeypatch):
     monkeypatch.setattr(
         data_fetch,
@@ -256,6 +274,17 @@ def test_get_wyscout_match_player_advanced_stats(monkeypatch):
     assert response.metadata["match_id"] == 555
     assert response.metadata["stats"]["players"][0]["wyId"] == 1
     assert client._last_match_players_adv_params["detail"] == "player"
+    assert "Records: 2" in response.content[0]["text"]
+
+
+def test_match_player_advanced_stats_record_counts():
+    def count(stats):
+        return wyscout_tools._RECORD_COUNTERS.get(type(stats), wyscout_tools._no_records)(stats)
+
+    assert count({"items": [1, 2, 3]}) == 3
+    assert count({"players": {"wyId": 1}}) == 0
+    assert count([1, 2]) == 2
+    assert count(None) == 0
 
 
 def test_get_wyscout_events(monkeypatch):
@@ -268,5 +297,113 @@ def test_get_wyscout_events(monkeypatch):
     response = wyscout_tools.get_wyscout_events(555, include_player_details=True)
     assert response.metadata["match_id"] == 555
     assert response.metadata["events"]["events"][0]["id"] == 1
-    assert "Event count" in response.content[0]["text"]
+    assert "Event count (if available): 2" in response.content[0]["text"]
     assert client._last_match_event_params["detail"] == "player"
+
+
+def test_string_matches_searches_nested_leaves():
+    match = {"teams": {"home": {"name": "Team Alpha"}, "away": {"name": "Beta"}}, "tags": ["Derby", 3]}
+
+    assert list(wyscout_tools._flatten_strings(match)) == ["Team Alpha", "Beta", "Derby"]
+    assert wyscout_tools._string_matches(match, " derby ")
+    assert not wyscout_tools._string_matches(match, "alphabeta")
+
+
+def test_list_wyscout_matches_requires_team_and_opponent(monkeypatch):
+    matches = [
+        {"matchId": 1, "teams": {"home": {"name": "Team Alpha"}, "away": {"name": "Team Beta"}}},
+        {"matchId": 2, "teams": {"home": {"name": "Team Alpha"}, "away": {"name": "Team Gamma"}}},
+    ]
+    client = DummyClient(matches=matches)
+    monkeypatch.setattr(wyscout_tools, "_client", lambda: client)
+
+    response = wyscout_tools.list_wyscout_matches(11, 21, team_name="alpha", opponent_name=" BETA ")
+
+    assert [match["matchId"] for match in response.metadata["matches"]] == [1]
+
+
+def test_list_wyscout_matches_limit_applies_before_filters(monkeypatch):
+    matches = [{"matchId": idx, "label": "Alpha" if idx % 2 else "Beta"} for idx in range(1, 7)]
+    client = DummyClient(matches=matches)
+    monkeypatch.setattr(wyscout_tools, "_client", lambda: client)
+
+    limited = wyscout_tools.list_wyscout_matches(12, 22, limit=4, team_name="alpha", use_cache=False)
+    unfiltered = wyscout_tools.list_wyscout_matches(12, 22, limit=2, use_cache=False)
+    empty = wyscout_tools.list_wyscout_matches(12, 22, limit=-1, use_cache=False)
+
+    assert [match["matchId"] for match in limited.metadata["matches"]] == [1, 3]
+    assert [match["matchId"] for match in unfiltered.metadata["matches"]] == [1, 2]
+    assert empty.metadata["matches"] == []
+
+
+def test_extract_match_id_coerces_known_keys():
+    assert wyscout_tools._extract_match_id({"matchId": "42"}) == 42
+    assert wyscout_tools._extract_match_id({"match_id": "n/a", "id": 7}) == 7
+    assert wyscout_tools._extract_match_id({"id": {"nested": 1}}) is None
+
+
+def test_list_wyscout_seasons_accepts_competition_name(monkeypatch):
+    client = DummyClient(seasons=[{"seasonId": 1, "name": "2024/2025", "status": "active"}])
+    calls = []
+    original = client.list_seasons
+
+    def list_seasons(competition_id, use_cache=True):
+        calls.append(competition_id)
+        return original(competition_id, use_cache=use_cache)
+
+    client.list_seasons = list_seasons
+    monkeypatch.setattr(wyscout_tools, "_client", lambda: client)
+
+    assert wyscout_tools.resolve_competition_by_name(" premier league ") == ("England", 364)
+    response = wyscout_tools.list_wyscout_seasons("Serie A")
+    assert calls == [524]
+    assert response.metadata["competition_id"] == 524
+
+    response = wyscout_tools.list_wyscout_seasons("Unknown Cup")
+    assert calls == [524]
+    assert response.metadata["seasons"] == []
+    assert "Unable to resolve" in response.content[0]["text"]
+
+
+def test_list_wyscout_competitions_memoises_area_names(monkeypatch):
+    client = DummyClient(competitions=[{"competitionId": 1, "name": "Liga Test", "category": "default"}])
+    calls = []
+
+    def resolve(identifier, use_cache=True):  # noqa: ARG001
+        calls.append(identifier)
+        return {"id": 1100, "name": "Memo Area"}
+
+    monkeypatch.setattr(wyscout_tools, "_client", lambda: client)
+    monkeypatch.setattr(data_fetch, "resolve_wyscout_area", resolve)
+
+    wyscout_tools.list_wyscout_competitions(area_id="Memo Area")
+    response = wyscout_tools.list_wyscout_competitions(area_id="Memo Area")
+    wyscout_tools.list_wyscout_competitions(area_id="Memo Area", use_cache=False)
+
+    assert calls == ["Memo Area", "Memo Area"]
+    assert client._last_area_id == 1100
+    assert response.metadata["filters"]["resolved_area_id"] == 1100
+
+
+def test_resolve_area_does_not_memoise_misses(monkeypatch):
+    answers = iter([None, {"id": 1200, "name": "Late Area"}])
+    calls = []
+
+    def resolve(identifier, use_cache=True):  # noqa: ARG001
+        calls.append(identifier)
+        return next(answers)
+
+    monkeypatch.setattr(data_fetch, "resolve_wyscout_area", resolve)
+
+    assert wyscout_tools._resolve_area("Late Area", True) is None
+    assert wyscout_tools._resolve_area("Late Area", True)["id"] == 1200
+    assert wyscout_tools._resolve_area("Late Area", True)["id"] == 1200
+
+    assert calls == ["Late Area", "Late Area"]
+
+
+def test_summarize_match_collects_preview_fields():
+    match = {"matchId": "9", "matchDate": "2024-09-01", "homeTeam": "Alpha", "team2": {"shortName": "Beta"}}
+
+    assert wyscout_tools._summarize_match(match) == (9, "2024-09-01", "Alpha", "Beta")
+    assert wyscout_tools._summarize_match({}) == (None, None, None, None)